@@ -391,20 +391,44 @@ const writeRealtimeLog = (logData: any) => {
     const type = logData.type.toUpperCase();
     const message = logData.data;
 
-    // 处理多行消息，为每一行添加时间戳前缀
-    const lines = message.split("\n");
-    lines.forEach((line, index) => {
-      if (line.trim()) {
-        // 只处理非空行
-        const logLine = `[${timestamp}] [${scriptName}] [${type}] ${line}\n`;
-        fs.appendFileSync(logFilePath, logLine, "utf8");
-      }
-    });
+    // 处理多行消息，为每一行添加时间戳前缀，整块消息一次写入
+    const logLines = message
+      .split("\n")
+      .filter((line) => line.trim()) // 只处理非空行
+      .map((line) => `[${timestamp}] [${scriptName}] [${type}] ${line}\n`)
+      .join("");
+    if (logLines) {
+      fs.appendFileSync(logFilePath, logLines, "utf8");
+    }
   } catch (error) {
     console.error("写入实时日志文件失败:", error);
   }
 };
 
+// Python 进度事件行的前缀（见 python/scripts/common_utils.py 的 Progress）
+const PROGRESS_PREFIX = "@@progress ";
+
+// 从完整的输出行中分离进度事件，返回普通日志文本和进度事件列表
+const splitProgressLines = (lines: string[]) => {
+  const logLines: string[] = [];
+  const events: any[] = [];
+
+  lines.forEach((line) => {
+    const content = line.replace(/\r$/, "");
+    if (content.startsWith(PROGRESS_PREFIX)) {
+      try {
+        events.push(...JSON.parse(content.slice(PROGRESS_PREFIX.length)));
+        return;
+      } catch (error) {
+        // 解析失败时按普通日志处理
+      }
+    }
+    logLines.push(line);
+  });
+
+  return { logText: logLines.join("\n"), events };
+};
+
 // 清空实时日志文件
 const clearRealtimeLog = () => {
   return new Promise<void>((resolve, reject) => {
@@ -439,7 +463,8 @@ ipcMain.handle(
     scriptName: string,
     inputFolder: string,
     outputFolder: string,
-    chipConfig: any
+    chipConfig: any,
+    runId?: string
   ) => {
     return new Promise(async (resolve, reject) => {
       // 构建 Python 主脚本路径
@@ -506,6 +531,9 @@ ipcMain.handle(
           PYTHONIOENCODING: "utf-8",
           PYTHONUTF8: "1",
           PYTHONUNBUFFERED: "1", // 禁用 Python 输出缓冲，实现实时输出
+          CHM_PROGRESS: "1", // 启用结构化进度事件
+          // 同一次运行的脚本记录到同一条构建时间线
+          ...(runId ? { CHM_TRACE_RUN: runId } : {}),
         },
       });
 
@@ -514,10 +542,22 @@ ipcMain.handle(
 
       let output = "";
       let errorOutput = "";
+      // 标准输出中尚未结束的行（数据块可能在行中间断开）
+      let pendingStdout = "";
 
-      // 监听标准输出
-      pythonProcess.stdout?.on("data", (data) => {
-        const text = data.toString("utf8");
+      // 处理标准输出中的完整行：进度事件发送给渲染进程，其余写入日志
+      const handleStdoutLines = (lines: string[]) => {
+        const { logText, events } = splitProgressLines(lines);
+
+        if (events.length > 0) {
+          win?.webContents.send("python:progress", { scriptName, events });
+        }
+
+        if (!logText.trim()) {
+          return;
+        }
+
+        const text = `${logText}\n`;
         output += text;
         console.log(`[${scriptName}] stdout:`, text);
 
@@ -533,6 +573,16 @@ ipcMain.handle(
 
         // 写入实时日志文件
         writeRealtimeLog(logData);
+      };
+
+      // 按 UTF-8 解码标准输出，避免多字节字符在数据块边界被截断
+      pythonProcess.stdout?.setEncoding("utf8");
+
+      // 监听标准输出
+      pythonProcess.stdout?.on("data", (data) => {
+        const lines = (pendingStdout + data.toString()).split("\n");
+        pendingStdout = lines.pop() ?? "";
+        handleStdoutLines(lines);
       });
 
       // 监听错误输出
@@ -559,6 +609,12 @@ ipcMain.handle(
       pythonProcess.on("close", (code) => {
         console.log(`[${scriptName}] 进程结束，退出码: ${code}`);
 
+        // 处理最后一行没有换行符的输出
+        if (pendingStdout) {
+          handleStdoutLines([pendingStdout]);
+          pendingStdout = "";
+        }
+
         // 清理进程引用
         currentPythonProcess = null;
 
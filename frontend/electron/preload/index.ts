@@ -49,14 +49,16 @@ contextBridge.exposeInMainWorld("electronAPI", {
     scriptName: string,
     inputFolder: string,
     outputFolder: string,
-    chipConfig: any
+    chipConfig: any,
+    runId?: string
   ) =>
     ipcRenderer.invoke(
       "python:runScript",
       scriptName,
       inputFolder,
       outputFolder,
-      chipConfig
+      chipConfig,
+      runId
     ),
 
   // 日志管理 API
@@ -67,6 +69,14 @@ contextBridge.exposeInMainWorld("electronAPI", {
   // 脚本控制 API
   cancelPythonScript: () => ipcRenderer.invoke("python:cancelScript"),
 
+  // 脚本进度事件 API
+  onPythonProgress: (callback: (progress: any) => void) => {
+    ipcRenderer.on("python:progress", (_, progress) => callback(progress));
+  },
+  offPythonProgress: () => {
+    ipcRenderer.removeAllListeners("python:progress");
+  },
+
   // 窗口控制 API
   minimizeWindow: () => ipcRenderer.invoke("window:minimize"),
   maximizeWindow: () => ipcRenderer.invoke("window:maximize"),
@@ -38,7 +38,8 @@ interface Window {
       scriptName: string,
       inputFolder: string,
       outputFolder: string,
-      chipConfig: any
+      chipConfig: any,
+      runId?: string
     ) => Promise<{
       success: boolean;
       output: string;
@@ -63,6 +64,23 @@ interface Window {
       success: boolean;
       error?: string;
     }>;
+    // 脚本进度事件 API
+    onPythonProgress: (
+      callback: (progress: {
+        scriptName: string;
+        events: Array<{
+          stage: string | null;
+          task: string;
+          item: string | null;
+          done: number;
+          total: number | null;
+          bytes: number;
+          ms: number;
+          state: "running" | "done";
+        }>;
+      }) => void
+    ) => void;
+    offPythonProgress: () => void;
     // 窗口控制 API
     minimizeWindow: () => Promise<void>;
     maximizeWindow: () => Promise<void>;
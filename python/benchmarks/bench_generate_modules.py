@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_generate_modules.py - generate_modules模块生成步骤基准测试
+功能：基于config/path.xlsx构造指定行数的合成数据表，测量芯片系列过滤、
+模块过滤排序和Markdown生成的耗时，用于确认耗时随数据表规模线性增长
+
+用法：python bench_generate_modules.py [--rows 10000 100000] [--chip N32G430]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 添加scripts目录到Python路径
+scripts_dir = Path(__file__).parent.parent / "scripts"
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+from generate_modules import DoxygenGenerator
+
+
+def build_synthetic_sheet(template: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """
+    以真实数据表为模板构造合成数据表
+
+    复制模板行直到达到指定行数，并为复制出的行改写产品系列名称，
+    保证大部分行不会被芯片系列过滤命中（与真实的多芯片数据表分布一致）
+    """
+    repeat = rows // len(template) + 1
+    data = pd.concat([template] * repeat, ignore_index=True).iloc[:rows].copy()
+
+    copy_index = pd.Series(range(rows)) // len(template)
+    series = data.iloc[:, 0].astype(str)
+    is_platform = series == "Common_Platform"
+    data.iloc[:, 0] = series.where(is_platform | (copy_index == 0), "SYN" + copy_index.astype(str) + "_" + series)
+    return data
+
+
+def run_benchmark(rows: int, chip_name: str, chip_version: str) -> dict:
+    """对指定行数的合成数据表运行一次模块生成，返回各步骤耗时（秒）"""
+    with tempfile.TemporaryDirectory() as output_folder:
+        generator = DoxygenGenerator(output_folder, {'chipName': chip_name, 'chipVersion': chip_version})
+        generator.load_excel()
+        generator.load_base_config()
+        generator.excel_data = build_synthetic_sheet(generator.excel_data, rows)
+
+        timings = {}
+
+        start = time.perf_counter()
+        chip_mask = generator.chip_series_mask(chip_name)
+        timings['chip_series_mask'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        chip_positions = np.flatnonzero(chip_mask.to_numpy())
+        module_data = {}
+        for module_key, module_info in generator.base_config.get("MarkDown_Info", {}).items():
+            module_info['filename'] = module_key
+            module_data[module_key] = generator.select_module_data(chip_positions, module_info)
+        timings['filter_and_sort_modules'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generator.generate_modules()
+        timings['generate_modules'] = time.perf_counter() - start
+
+        timings['matched_rows'] = len(chip_positions)
+        return timings
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="generate_modules基准测试")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000], help="合成数据表行数")
+    parser.add_argument("--chip", default="N32G430", help="芯片系列名称")
+    parser.add_argument("--version", default="1.0.0", help="芯片版本")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'matched':>8} {'chip_filter':>12} {'module_sort':>12} {'generate':>10}")
+    for rows in args.rows:
+        timings = run_benchmark(rows, args.chip, args.version)
+        print(f"{rows:>10} {timings['matched_rows']:>8} "
+              f"{timings['chip_series_mask']:>11.3f}s "
+              f"{timings['filter_and_sort_modules']:>11.3f}s "
+              f"{timings['generate_modules']:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
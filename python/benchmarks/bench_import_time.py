@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_import_time.py - 脚本启动耗时基准测试
+功能：用 python -X importtime 测量每个步骤脚本（及common_utils）的导入耗时，
+检查是否超出启动预算，以及导入时是否加载了只应在用到时才导入的重量级模块（pandas、requests等）
+
+导入前先用compileall生成字节码，测量结果不包含编译耗时；每个脚本重复测量取最小值
+
+用法：python bench_import_time.py [--budget-ms 100] [--repeat 5] [--scripts generate_modules get_chip_data]
+"""
+
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+
+# 只应在用到的代码路径中导入的重量级模块
+HEAVY_MODULES = ["pandas", "numpy", "openpyxl", "requests", "urllib3", "bs4", "lxml", "deep_translator", "PIL"]
+
+
+def get_script_names():
+    """获取所有步骤脚本的模块名（包括common_utils）"""
+    return sorted(path.stem for path in SCRIPTS_DIR.glob("*.py"))
+
+
+def parse_importtime(stderr):
+    """
+    解析 -X importtime 的输出
+
+    返回：
+    - list: [(模块名, 自身耗时微秒, 累计耗时微秒, 嵌套层级)]
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+def measure_script(name, repeat):
+    """
+    测量一个脚本的导入耗时
+
+    返回：
+    - dict: {'us': 最小累计耗时, 'records': 最快一次的导入记录, 'heavy': 导入时加载的重量级模块}
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+            cwd=SCRIPTS_DIR, env=env, capture_output=True, text=True, encoding="utf-8", errors="replace"
+        )
+        if result.returncode != 0:
+            return {'us': None, 'records': [], 'heavy': [], 'error': result.stderr.strip().splitlines()[-1:]}
+        records = parse_importtime(result.stderr)
+        total = next((cumulative for module, _, cumulative, depth in records if module == name and depth == 0), None)
+        if total is not None and (best is None or total < best['us']):
+            best = {'us': total, 'records': records}
+
+    # 区分脚本本身导入的模块和解释器启动时（site）已导入的模块：只统计脚本模块之前、层级更深的记录
+    imported = set()
+    if best:
+        for module, _, _, depth in reversed(best['records']):
+            if module == name and depth == 0:
+                continue
+            if depth == 0:
+                break
+            imported.add(module.split(".")[0])
+    best = best or {'us': None, 'records': []}
+    best['heavy'] = sorted(module for module in HEAVY_MODULES if module in imported)
+    return best
+
+
+def get_slowest_imports(records, name, top):
+    """获取脚本导入链中累计耗时最长的直接子模块"""
+    children = []
+    for module, _, cumulative, depth in reversed(records):
+        if module == name and depth == 0:
+            continue
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((cumulative, module))
+    return sorted(children, reverse=True)[:top]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="脚本启动耗时基准测试")
+    parser.add_argument("--budget-ms", type=float, default=100, help="每个脚本的导入耗时预算（毫秒）")
+    parser.add_argument("--repeat", type=int, default=5, help="每个脚本的测量次数（取最小值）")
+    parser.add_argument("--scripts", nargs="+", help="只测量指定脚本（模块名）")
+    parser.add_argument("--top", type=int, default=5, help="超出预算时列出的最慢导入数量")
+    args = parser.parse_args()
+
+    # 先生成字节码，避免把编译耗时计入导入耗时
+    compileall.compile_dir(str(SCRIPTS_DIR), quiet=1)
+
+    names = args.scripts or get_script_names()
+    failures = []
+
+    print(f"{'script':<34} {'import_ms':>10}  heavy_modules")
+    for name in names:
+        result = measure_script(name, args.repeat)
+        if result['us'] is None:
+            print(f"{name:<34} {'error':>10}  {' '.join(result.get('error', []))}")
+            failures.append(name)
+            continue
+
+        import_ms = result['us'] / 1000
+        over_budget = import_ms > args.budget_ms
+        print(f"{name:<34} {import_ms:>10.1f}  {', '.join(result['heavy']) or '-'}"
+              + ("  OVER BUDGET" if over_budget else ""))
+
+        if over_budget or result['heavy']:
+            failures.append(name)
+            for cumulative, module in get_slowest_imports(result['records'], name, args.top):
+                print(f"    {module:<30} {cumulative / 1000:>10.1f}")
+
+    if failures:
+        print(f"\n超出预算或导入时加载了重量级模块的脚本（预算 {args.budget_ms:.0f} 毫秒）: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"\n所有脚本的导入耗时都在预算（{args.budget_ms:.0f} 毫秒）以内")
+
+
+if __name__ == "__main__":
+    main()
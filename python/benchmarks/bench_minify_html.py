@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_minify_html.py - docs_minify_html页面压缩步骤基准测试
+功能：在合成的Doxygen风格页面（或真实构建输出的副本）上运行页面压缩，
+测量压缩耗时、页面体积变化和CHM体积变化；指定hhc.exe时分别编译压缩前后的CHM，
+比较编译耗时和CHM文件大小，未指定时以zlib压缩后的大小近似CHM体积
+
+用法：python bench_minify_html.py [--pages 2000 10000] [--output-folder <构建输出目录>] [--hhc <hhc.exe路径>]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+# 添加scripts目录到Python路径
+scripts_dir = Path(__file__).parent.parent / "scripts"
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+from docs_minify_html import HtmlMinifier, HTML_EXTENSIONS
+
+
+PAGE_TEMPLATE = """<!-- HTML header for doxygen 1.9.0-->
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "https://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+  <head>
+    <meta http-equiv="Content-Type" content="text/xhtml;charset=UTF-8" />
+    <title>Project {index}: File Reference</title>
+    <link href="tabs.css" rel="stylesheet" type="text/css" />
+    <script type="text/javascript" src="jquery.js"></script>
+    <script type="text/javascript" src="dynsections.js"></script>
+    <link href="customdoxygen.css" rel="stylesheet" type="text/css" />
+  </head>
+  <body>
+    <div id="top">
+      <!-- do not remove this div, it is closed by doxygen! -->
+      <div id="titlearea">
+        <table cellspacing="0" cellpadding="0">
+          <tbody>
+            <tr style="height: 30px">
+              <td id="projectalign" style="padding-left: 0.5em;">
+                <div id="projectname">Project {index}</div>
+              </td>
+            </tr>
+          </tbody>
+        </table>
+      </div>
+      <!-- end header part -->
+    </div>
+    <div class="contents">
+      <table class="memberdecls">
+{rows}
+      </table>
+      <div class="fragment">
+{lines}
+      </div>
+    </div>
+    <!-- start footer part -->
+  </body>
+</html>
+"""
+
+ROW_TEMPLATE = """        <tr class="memitem:a{index}">
+          <td class="memItemLeft" align="right" valign="top">void&#160;</td>
+          <td class="memItemRight" valign="bottom"><a class="el" href="file_{index}.html#a{index}">Function_{index}</a> (uint32_t value)</td>
+        </tr>
+        <tr class="memdesc:a{index}">
+          <td class="mdescLeft">&#160;</td>
+          <td class="mdescRight">Configure the peripheral with the given value.  <a href="#a{index}">More...</a><br /></td>
+        </tr>"""
+
+LINE_TEMPLATE = """<div class="line"><a id="l{index:05d}" name="l{index:05d}"></a><span class="lineno">{index:5d}</span>    <span class="keywordtype">uint32_t</span> value_{index} = 0;</div>"""
+
+
+def build_synthetic_tree(output_folder: Path, pages: int):
+    """在output_folder/output/sub下生成指定数量的Doxygen风格页面"""
+    for index in range(pages):
+        html_dir = output_folder / "output" / "sub" / f"project_{index // 200}" / "html"
+        html_dir.mkdir(parents=True, exist_ok=True)
+        rows = "\n".join(ROW_TEMPLATE.format(index=index * 20 + row) for row in range(20))
+        lines = "\n".join(LINE_TEMPLATE.format(index=line) for line in range(1, 41))
+        content = PAGE_TEMPLATE.replace("{index}", str(index)).replace("{rows}", rows).replace("{lines}", lines)
+        (html_dir / f"file_{index}.html").write_text(content, encoding="utf-8")
+
+
+def measure_pages(output_dir: Path) -> dict:
+    """统计页面总大小和zlib压缩后的总大小（近似CHM中的体积）"""
+    raw_bytes = 0
+    compressed_bytes = 0
+    pages = []
+    for root, dirs, files in os.walk(output_dir):
+        for file_name in files:
+            if file_name.lower().endswith(HTML_EXTENSIONS):
+                data = (Path(root) / file_name).read_bytes()
+                raw_bytes += len(data)
+                compressed_bytes += len(zlib.compress(data, 9))
+                pages.append(os.path.relpath(os.path.join(root, file_name), output_dir).replace(os.sep, '\\'))
+    return {'raw_bytes': raw_bytes, 'compressed_bytes': compressed_bytes, 'pages': sorted(pages)}
+
+
+def compile_chm(hhc_path: str, output_dir: Path, pages: list) -> dict:
+    """用hhc.exe编译只包含页面的CHM，返回编译耗时和CHM大小"""
+    hhp_file = output_dir / "bench.hhp"
+    hhp_file.write_text(
+        "[OPTIONS]\nCompiled file=bench.chm\nFull-text search=No\n\n[FILES]\n" + "\n".join(pages) + "\n",
+        encoding="utf-8"
+    )
+    start = time.perf_counter()
+    subprocess.run([hhc_path, hhp_file.name], cwd=output_dir, capture_output=True)
+    duration = time.perf_counter() - start
+    chm_file = output_dir / "bench.chm"
+    return {'compile_time': duration, 'chm_bytes': chm_file.stat().st_size if chm_file.exists() else 0}
+
+
+def run_benchmark(output_folder: Path, hhc_path: str = None) -> dict:
+    """对output_folder运行一次页面压缩，返回压缩前后的统计"""
+    output_dir = output_folder / "output"
+    result = {'before': measure_pages(output_dir)}
+    if hhc_path:
+        result['before'].update(compile_chm(hhc_path, output_dir, result['before']['pages']))
+
+    # 保留原始页面，用于测量命中缓存时的耗时
+    original_dir = output_folder / "output_original"
+    shutil.copytree(output_dir, original_dir)
+
+    # 第一次运行不使用缓存，测量完整的压缩耗时
+    shutil.rmtree(output_folder / "cache", ignore_errors=True)
+    start = time.perf_counter()
+    HtmlMinifier(str(output_folder), {}).run()
+    result['minify_time'] = time.perf_counter() - start
+
+    # 恢复原始页面后再次运行，全部命中缓存（相当于前面的步骤重新生成了相同的页面）
+    shutil.rmtree(output_dir)
+    original_dir.rename(output_dir)
+    start = time.perf_counter()
+    HtmlMinifier(str(output_folder), {}).run()
+    result['cached_time'] = time.perf_counter() - start
+
+    result['after'] = measure_pages(output_dir)
+    if hhc_path:
+        result['after'].update(compile_chm(hhc_path, output_dir, result['after']['pages']))
+    return result
+
+
+def print_result(label: str, result: dict):
+    """输出一次基准测试的结果"""
+    before, after = result['before'], result['after']
+    print(f"{label:>12} {len(before['pages']):>7} "
+          f"{before['raw_bytes']:>12} {after['raw_bytes']:>12} "
+          f"{before['compressed_bytes']:>12} {after['compressed_bytes']:>12} "
+          f"{result['minify_time']:>9.3f}s {result['cached_time']:>9.3f}s")
+    if 'compile_time' in before:
+        print(f"{'':>12} CHM: {before['chm_bytes']} -> {after['chm_bytes']} 字节，"
+              f"编译: {before['compile_time']:.3f}s -> {after['compile_time']:.3f}s")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="docs_minify_html基准测试")
+    parser.add_argument("--pages", type=int, nargs="+", default=[2000, 10000], help="合成页面数量")
+    parser.add_argument("--output-folder", help="真实构建输出目录（复制到临时目录后测试，不修改原目录）")
+    parser.add_argument("--hhc", help="hhc.exe路径，指定时编译压缩前后的CHM")
+    args = parser.parse_args()
+
+    print(f"{'input':>12} {'pages':>7} {'raw_before':>12} {'raw_after':>12} "
+          f"{'zlib_before':>12} {'zlib_after':>12} {'minify':>10} {'cached':>10}")
+
+    if args.output_folder:
+        with tempfile.TemporaryDirectory() as temp_folder:
+            output_folder = Path(temp_folder)
+            shutil.copytree(Path(args.output_folder) / "output", output_folder / "output")
+            print_result("real", run_benchmark(output_folder, args.hhc))
+        return
+
+    for pages in args.pages:
+        with tempfile.TemporaryDirectory() as temp_folder:
+            output_folder = Path(temp_folder)
+            build_synthetic_tree(output_folder, pages)
+            print_result(str(pages), run_benchmark(output_folder, args.hhc))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_pipeline.py - 完整流水线基准测试
+功能：生成指定规模的合成输入树（编号目录、嵌套压缩包、PDF、带中英文readme.txt的例程、path.xlsx），
+使用doxygen、7z、hhc和翻译库的替身逐个运行各步骤，输出每个步骤的耗时和峰值内存，并与保存的基线比较
+
+用法：python bench_pipeline.py [--scale small|medium|large] [--save-baseline] [--max-regression 20]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pipeline import (
+    SCALES,
+    build_input_tree,
+    build_path_excel,
+    install_standins,
+    run_pipeline,
+    get_baseline_file,
+    load_baseline,
+    save_baseline,
+    print_report,
+    find_regressions
+)
+
+
+def run_benchmark(work_dir, scale, chip, translate_latency_ms, extra_config=None):
+    """在work_dir下生成输入树并运行流水线，返回各步骤结果（extra_config为附加的芯片配置项）"""
+    spec = SCALES[scale]
+    input_folder = work_dir / "input"
+    output_folder = work_dir / "output"
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    stats = build_input_tree(input_folder, chip, spec)
+    # 在单独的进程中生成数据表：Linux的ru_maxrss包含exec之前继承的内存，
+    # 本进程不加载pandas，步骤进程的峰值内存才不会被本进程的内存抬高
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        excel_file = executor.submit(build_path_excel, work_dir / "config" / "path.xlsx", chip, spec['excel_rows']).result()
+    print(f"合成输入: PDF {stats['pdfs']} 个，压缩包 {stats['zips']} 个，例程 {stats['examples']} 个，数据表 {spec['excel_rows']} 行")
+
+    env = dict(os.environ)
+    env.update(install_standins(work_dir / "tools"))
+    env['BENCH_TRANSLATE_LATENCY_MS'] = str(translate_latency_ms)
+
+    chip_config = {
+        'chipName': chip,
+        'chipVersion': '1.0.0',
+        'Path_Excel': str(excel_file),
+    }
+    chip_config.update(extra_config or {})
+    log_file = work_dir / "pipeline.log"
+    print(f"运行日志: {log_file}")
+    return run_pipeline(input_folder, output_folder, chip_config, env, log_file)
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="文档生成流水线基准测试")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="合成输入树规模")
+    parser.add_argument("--chip", default="N32G430", help="芯片系列名称（需要在config/path.xlsx中存在）")
+    parser.add_argument("--work-dir", help="工作目录（保留输入、输出和日志），默认使用临时目录并在结束后删除")
+    parser.add_argument("--baseline", help="基线文件，默认benchmarks/baselines/pipeline_<规模>.json")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果保存为基线")
+    parser.add_argument("--max-regression", type=float, help="任一步骤比基线慢超过该百分比时返回非0")
+    parser.add_argument("--translate-latency-ms", type=int, default=0, help="翻译替身每次请求的模拟延迟（毫秒）")
+    args = parser.parse_args()
+
+    baseline_file = Path(args.baseline) if args.baseline else get_baseline_file(args.scale)
+
+    if args.work_dir:
+        work_dir = Path(args.work_dir).resolve()
+        if work_dir.exists():
+            shutil.rmtree(work_dir)
+        work_dir.mkdir(parents=True)
+        results = run_benchmark(work_dir, args.scale, args.chip, args.translate_latency_ms)
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = run_benchmark(Path(temp_dir), args.scale, args.chip, args.translate_latency_ms)
+
+    baseline = load_baseline(baseline_file)
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        save_baseline(baseline_file, args.scale, SCALES[args.scale], results)
+        print(f"\n基线已保存: {baseline_file}")
+
+    failed = [stage for stage, result in results.items() if result['returncode'] != 0]
+    if failed:
+        print(f"\n失败的步骤: {', '.join(failed)}")
+        sys.exit(1)
+
+    if args.max_regression is not None and baseline:
+        regressions = find_regressions(results, baseline, args.max_regression)
+        for stage, delta in regressions:
+            print(f"性能回退: {stage} 比基线慢 {delta:.1f}%")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+check_chm_partition.py - 分区编译检查
+功能：在合成输入树上以Chm_Partition运行流水线（hhc使用替身），读取编译出的主CHM和子CHM，检查：
+- index_master.hhp的[OPTIONS]和[WINDOWS]使用index_master.hhc和index_master.hhk，[MERGE FILES]中的子CHM都已生成
+- 目录、索引、页面和数据脚本中的本地引用（相对路径和ms-its:<CHM>::/<路径>）都能在对应的CHM中找到
+
+目标文件在任何CHM中都不存在的引用是页面本身的断链，只报告不算失败
+
+用法：python check_chm_partition.py [--scale small|medium|large] [--work-dir DIR] [--output-folder 已分区编译的输出目录]
+"""
+
+import argparse
+import posixpath
+import re
+import shutil
+import sys
+import tempfile
+from html import unescape
+from pathlib import Path
+
+from bench_pipeline import run_benchmark
+from pipeline import SCALES
+from pipeline.standins.hhc import read_chm
+
+# 添加scripts目录到Python路径
+scripts_dir = Path(__file__).parent.parent / "scripts"
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+from generate_chm_hhc import (
+    EXTERNAL_LINK_PREFIXES,
+    LOCAL_PARAM_PATTERN,
+    MERGED_LINK_PATTERN,
+    PAGE_EXTENSIONS,
+    PAGE_LINK_PATTERN,
+    SCRIPT_EXTENSIONS,
+    SCRIPT_LINK_PATTERN,
+    normalize_chm_path,
+    read_hhp_sections
+)
+
+# [WINDOWS]中带引号的目录和索引文件名
+WINDOW_FILE_PATTERN = re.compile(r'"([^"]*\.hh[ck])"', re.IGNORECASE)
+
+# 主项目使用的目录和索引文件
+MASTER_PROJECT_FILES = {'contents file': "index_master.hhc", 'index file': "index_master.hhk"}
+
+# 每类问题最多显示的条数
+MAX_REPORTED_ISSUES = 20
+
+
+def check_master_project(master_hhp_file):
+    """
+    检查主项目的[OPTIONS]、[WINDOWS]和[MERGE FILES]
+
+    返回：
+    - tuple: (问题列表, {CHM文件名（小写）: CHM路径})
+    """
+    sections = read_hhp_sections(master_hhp_file)
+    options = {}
+    for line in sections.get('OPTIONS', []):
+        key, _, value = line.partition('=')
+        options[key.strip().lower()] = value.strip()
+
+    issues = []
+    for key, expected in MASTER_PROJECT_FILES.items():
+        if options.get(key) != expected:
+            issues.append(f"[OPTIONS] {key}={options.get(key)}，应为{expected}")
+    for line in sections.get('WINDOWS', []):
+        for file_name in WINDOW_FILE_PATTERN.findall(line):
+            if file_name not in MASTER_PROJECT_FILES.values():
+                issues.append(f"[WINDOWS] 引用了{file_name}: {line}")
+
+    # 合并的子CHM在运行时按主CHM所在目录查找
+    master_chm = (master_hhp_file.parent / options.get('compiled file', 'index.chm')).resolve()
+    chm_files = {master_chm.name.lower(): master_chm}
+    for merge_file in sections.get('MERGE FILES', []):
+        chm_files[merge_file.lower()] = master_chm.parent / merge_file
+    for chm_name, chm_file in chm_files.items():
+        if not chm_file.exists():
+            issues.append(f"CHM未生成: {chm_file}")
+    return issues, chm_files
+
+
+def iter_links(file_path, content):
+    """列出目录、索引、页面或数据脚本中的引用，返回 (引用所在目录, 引用)"""
+    text = content.decode('utf-8', errors='ignore')
+    page_dir = posixpath.dirname(file_path.replace('\\', '/'))
+    if file_path.lower().endswith(('.hhc', '.hhk')):
+        for local_value in LOCAL_PARAM_PATTERN.findall(text):
+            yield '', local_value
+    elif file_path.lower().endswith(PAGE_EXTENSIONS):
+        for link in set(PAGE_LINK_PATTERN.findall(text)):
+            yield page_dir, link
+    elif file_path.lower().endswith(SCRIPT_EXTENSIONS):
+        for link in set(SCRIPT_LINK_PATTERN.findall(text)):
+            yield page_dir, link
+
+
+def check_links(chm_files):
+    """
+    检查所有CHM中的引用
+
+    返回：
+    - dict: 检查结果，包含 links、merged_links、missing 和 broken
+    """
+    archives = {chm_name: read_chm(chm_file) for chm_name, chm_file in chm_files.items() if chm_file.exists()}
+    contents = {chm_name: {normalize_chm_path(name) for name in files} for chm_name, files in archives.items()}
+    all_files = set().union(*contents.values()) if contents else set()
+
+    result = {'links': 0, 'merged_links': 0, 'missing': [], 'broken': []}
+    for chm_name, files in archives.items():
+        for file_path, content in files.items():
+            for base_dir, link in iter_links(file_path, content):
+                link = unescape(link).strip()
+                merged = MERGED_LINK_PATTERN.match(link)
+                if merged:
+                    target_chm, target = merged.group(1).lower(), normalize_chm_path(merged.group(2))
+                    result['merged_links'] += 1
+                elif not link or link.lower().startswith(EXTERNAL_LINK_PREFIXES):
+                    continue
+                else:
+                    target_chm, target = chm_name, normalize_chm_path(f"{base_dir}/{link}" if base_dir else link)
+                if not target:
+                    continue
+
+                result['links'] += 1
+                if target in contents.get(target_chm, ()):
+                    continue
+                issue = (f"{chm_name}::/{file_path}", link)
+                result['missing' if target in all_files else 'broken'].append(issue)
+    return result
+
+
+def report_issues(title, issues):
+    """输出问题列表"""
+    if not issues:
+        return
+    print(f"{title}: {len(issues)}")
+    for issue in issues[:MAX_REPORTED_ISSUES]:
+        print(f"  - {' -> '.join(issue) if isinstance(issue, tuple) else issue}")
+    if len(issues) > MAX_REPORTED_ISSUES:
+        print(f"  ... 其余 {len(issues) - MAX_REPORTED_ISSUES} 项未显示")
+
+
+def check_output(output_folder):
+    """检查已分区编译的输出目录，返回是否通过"""
+    master_hhp_file = Path(output_folder) / "output" / "index_master.hhp"
+    if not master_hhp_file.exists():
+        print(f"没有分区编译的主项目: {master_hhp_file}")
+        return False
+
+    project_issues, chm_files = check_master_project(master_hhp_file)
+    result = check_links(chm_files)
+    print(f"CHM {len(chm_files)} 个，引用 {result['links']} 个，其中跨CHM引用 {result['merged_links']} 个")
+    report_issues("主项目配置问题", project_issues)
+    report_issues("引用的文件不在所指的CHM中", result['missing'])
+    report_issues("引用的文件不在任何CHM中（页面本身的断链）", result['broken'])
+    return not project_issues and not result['missing']
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="分区编译CHM检查")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small", help="合成输入树规模")
+    parser.add_argument("--chip", default="N32G430", help="芯片系列名称（需要在config/path.xlsx中存在）")
+    parser.add_argument("--work-dir", help="工作目录（保留输入、输出和日志），默认使用临时目录并在结束后删除")
+    parser.add_argument("--output-folder", help="只检查已分区编译的构建输出目录，不运行流水线")
+    args = parser.parse_args()
+
+    if args.output_folder:
+        passed = check_output(args.output_folder)
+    elif args.work_dir:
+        work_dir = Path(args.work_dir).resolve()
+        if work_dir.exists():
+            shutil.rmtree(work_dir)
+        work_dir.mkdir(parents=True)
+        run_benchmark(work_dir, args.scale, args.chip, 0, {'Chm_Partition': True})
+        passed = check_output(work_dir / "output")
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            run_benchmark(Path(temp_dir), args.scale, args.chip, 0, {'Chm_Partition': True})
+            passed = check_output(Path(temp_dir) / "output")
+
+    print("检查通过" if passed else "检查失败")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+流水线基准测试包
+功能：不依赖真实芯片资料包和外部工具，在合成输入树上运行完整的文档生成流水线
+
+- synthetic_tree: 生成合成输入目录和path.xlsx数据表
+- standins: doxygen、7z、hhc和翻译库的替身
+- runner: 逐个运行步骤，记录耗时和峰值内存，与基线比较
+"""
+
+from .synthetic_tree import SCALES, build_input_tree, build_path_excel
+from .standins import install_standins
+from .runner import (
+    STAGES,
+    run_pipeline,
+    get_baseline_file,
+    load_baseline,
+    save_baseline,
+    print_report,
+    find_regressions
+)
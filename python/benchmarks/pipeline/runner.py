@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+流水线基准测试运行器
+功能：按前端"组合脚本"的顺序逐个运行各步骤脚本（与main.py相同的调用方式：独立进程、工作目录为python目录），
+记录每个步骤的耗时、峰值内存和返回代码，并与保存的基线比较
+
+峰值内存：
+- Linux/macOS：os.wait4返回的ru_maxrss，即步骤进程及其进程池工作进程中最大的常驻内存
+- Windows：安装psutil时轮询进程树常驻内存之和的峰值，否则不统计
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PYTHON_DIR = Path(__file__).parent.parent.parent
+SCRIPTS_DIR = PYTHON_DIR / "scripts"
+
+# 基线目录
+BASELINE_DIR = Path(__file__).parent.parent / "baselines"
+
+# 按前端组合脚本顺序排列的步骤
+# get_chip_data需要访问官网（或预先录制的HTTP夹具），不在基准测试范围内
+STAGES = [
+    "docs_decompression",
+    "docs_gen_main_html",
+    "generate_modules",
+    "translate_main_modules",
+    "docs_main_doxygen",
+    "docs_gen_config",
+    "docs_gen_doxyfile",
+    "docs_gen_doxygen",
+    "docs_gen_pdfhtml",
+    "docs_gen_examples",
+    "docs_gen_examples_overview",
+    "docs_gen_examples_description",
+    "docs_gen_template_hhc",
+    "docs_gen_hhc",
+    "docs_gen_hhp",
+    "docs_optimize_images",
+    "docs_minify_html",
+    "generate_chm_hhc",
+]
+
+
+def run_process(command, env, log_file):
+    """
+    运行一个步骤进程
+
+    返回：
+    - tuple: (返回代码, 耗时（秒）, 峰值内存（MB，无法统计时为None）)
+    """
+    with open(log_file, 'ab') as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=PYTHON_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+        if hasattr(os, 'wait4'):
+            _, status, usage = os.wait4(process.pid, 0)
+            seconds = time.perf_counter() - start
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # Linux的ru_maxrss单位为KB，macOS为字节
+            peak_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+            return process.returncode, seconds, peak_mb
+
+        peak_bytes = None
+        while process.poll() is None:
+            if psutil is not None:
+                try:
+                    root = psutil.Process(process.pid)
+                    rss = root.memory_info().rss + sum(child.memory_info().rss for child in root.children(recursive=True))
+                    peak_bytes = max(peak_bytes or 0, rss)
+                except psutil.Error:
+                    pass
+            time.sleep(0.05)
+        seconds = time.perf_counter() - start
+        return process.returncode, seconds, peak_bytes / (1024 * 1024) if peak_bytes is not None else None
+
+
+def run_pipeline(input_folder, output_folder, chip_config, env, log_file, stages=STAGES):
+    """
+    依次运行所有步骤，某个步骤失败时继续运行后续步骤（与前端组合脚本的行为一致）
+
+    返回：
+    - dict: 步骤名 -> {'seconds', 'peak_mb', 'returncode'}
+    """
+    chip_config_json = json.dumps(chip_config, ensure_ascii=False)
+    # 所有步骤记录到同一条构建时间线（Tracer的运行编号）
+    env = dict(env, CHM_TRACE_RUN=f"bench_{time.strftime('%Y%m%d_%H%M%S')}")
+    results = {}
+    for stage in stages:
+        command = [sys.executable, str(SCRIPTS_DIR / f"{stage}.py"), str(input_folder), str(output_folder), chip_config_json]
+        with open(log_file, 'ab') as log:
+            log.write(f"\n===== {stage} =====\n".encode('utf-8'))
+        returncode, seconds, peak_mb = run_process(command, env, log_file)
+        results[stage] = {'seconds': round(seconds, 3), 'peak_mb': round(peak_mb, 1) if peak_mb is not None else None, 'returncode': returncode}
+        status = "ok" if returncode == 0 else f"返回代码 {returncode}"
+        print(f"  {stage:<32} {seconds:>8.2f}s  {status}", flush=True)
+    return results
+
+
+def get_baseline_file(scale):
+    """获取规模对应的默认基线文件"""
+    return BASELINE_DIR / f"pipeline_{scale}.json"
+
+
+def load_baseline(baseline_file):
+    """加载基线，不存在时返回None"""
+    baseline_file = Path(baseline_file)
+    if not baseline_file.exists():
+        return None
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(baseline_file, scale, spec, results):
+    """保存基线（包含规模参数和运行环境，便于判断基线是否可比）"""
+    baseline_file = Path(baseline_file)
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        'scale': scale,
+        'spec': spec,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'stages': results,
+    }
+    with open(baseline_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def format_delta(current, baseline):
+    """格式化相对基线的变化百分比"""
+    if current is None or not baseline:
+        return "-"
+    return f"{(current - baseline) / baseline * 100:+.1f}%"
+
+
+def format_value(value, digits):
+    """格式化数值，没有数值时显示-"""
+    return f"{value:.{digits}f}" if value is not None else "-"
+
+
+def print_report(results, baseline=None):
+    """输出各步骤的耗时和峰值内存，有基线时输出变化百分比"""
+    baseline_stages = (baseline or {}).get('stages', {})
+    print(f"\n{'stage':<32} {'seconds':>9} {'base':>9} {'delta':>8} {'peak_mb':>9} {'base':>9} {'delta':>8}")
+    total = 0.0
+    base_total = 0.0
+    for stage, result in results.items():
+        base = baseline_stages.get(stage, {})
+        total += result['seconds']
+        base_total += base.get('seconds') or 0
+        print(f"{stage:<32} {format_value(result['seconds'], 2):>9} {format_value(base.get('seconds'), 2):>9} "
+              f"{format_delta(result['seconds'], base.get('seconds')):>8} "
+              f"{format_value(result['peak_mb'], 1):>9} {format_value(base.get('peak_mb'), 1):>9} "
+              f"{format_delta(result['peak_mb'], base.get('peak_mb')):>8}"
+              + ("  FAILED" if result['returncode'] != 0 else ""))
+    print(f"{'total':<32} {total:>9.2f} {format_value(base_total or None, 2):>9} {format_delta(total, base_total):>8}")
+
+
+def find_regressions(results, baseline, max_regression, min_seconds=0.5):
+    """
+    查找相对基线变慢超过max_regression（百分比）的步骤
+
+    基线耗时低于min_seconds的步骤波动较大，不参与比较
+    """
+    regressions = []
+    for stage, result in results.items():
+        base = (baseline or {}).get('stages', {}).get(stage)
+        if not base or not base.get('seconds') or base['seconds'] < min_seconds:
+            continue
+        delta = (result['seconds'] - base['seconds']) / base['seconds'] * 100
+        if delta > max_regression:
+            regressions.append((stage, delta))
+    return regressions
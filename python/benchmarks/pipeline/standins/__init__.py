@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+外部工具替身
+功能：在临时目录中生成与项目tools目录结构一致的替身工具（doxygen、7z、hhc），
+并提供替换deep_translator的模块目录；运行各步骤时通过环境变量CHM_TOOLS_DIR和PYTHONPATH使用替身
+
+替身以Python脚本实现，启动脚本在Windows下为.cmd，其他系统为不带扩展名的可执行脚本
+（PathUtils.get_tool_path找不到.exe时会查找这两种文件）
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+STANDINS_DIR = Path(__file__).parent
+
+# 工具目录名 -> (可执行文件名, 替身脚本)
+STANDIN_TOOLS = {
+    'doxygen': ('doxygen.exe', 'doxygen.py'),
+    '7z': ('7z.exe', 'sevenzip.py'),
+    'hhc': ('hhc.exe', 'hhc.py'),
+}
+
+# 替换deep_translator的模块目录
+TRANSLATOR_SITE_DIR = STANDINS_DIR / "site"
+
+
+def write_launcher(launcher_dir, exe_name, script_path):
+    """生成调用替身脚本的启动脚本，返回启动脚本路径"""
+    launcher_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(exe_name).stem
+    if os.name == 'nt':
+        launcher = launcher_dir / f"{stem}.cmd"
+        launcher.write_text(f'@"{sys.executable}" "{script_path}" %*\r\n', encoding='utf-8')
+    else:
+        launcher = launcher_dir / stem
+        launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script_path}" "$@"\n', encoding='utf-8')
+        launcher.chmod(launcher.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return launcher
+
+
+def install_standins(tools_dir):
+    """
+    在tools_dir下生成替身工具
+
+    返回：
+    - dict: 运行步骤时需要设置的环境变量
+    """
+    tools_dir = Path(tools_dir)
+    for tool_dir_name, (exe_name, script_name) in STANDIN_TOOLS.items():
+        write_launcher(tools_dir / tool_dir_name, exe_name, STANDINS_DIR / script_name)
+
+    python_path = [str(TRANSLATOR_SITE_DIR)]
+    if os.environ.get('PYTHONPATH'):
+        python_path.append(os.environ['PYTHONPATH'])
+
+    return {
+        'CHM_TOOLS_DIR': str(tools_dir),
+        'PYTHONPATH': os.pathsep.join(python_path),
+    }
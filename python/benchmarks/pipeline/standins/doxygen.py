@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+doxygen.exe替身
+功能：解析Doxyfile，为INPUT中匹配FILE_PATTERNS的每个源文件生成一个Doxygen风格的页面，
+并生成files.html、index.html、静态资源（css、js、png）以及GENERATE_HTMLHELP=YES时的index.hhc/index.hhk/index.hhp，
+输出目录结构与真实Doxygen一致，供后续步骤处理
+
+用法：doxygen <Doxyfile>（相对路径相对当前工作目录，与真实Doxygen一致）
+"""
+
+import fnmatch
+import hashlib
+import html
+import os
+import re
+import shutil
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+# Doxyfile值的分词规则：引号内的整体作为一个值
+VALUE_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# 每个html目录都会生成的静态资源（文件名 -> 大小，字节）
+STATIC_SCRIPTS = {
+    'jquery.js': 90000,
+    'dynsections.js': 4500,
+    'menu.js': 5000,
+    'menudata.js': 1200,
+    'navtree.js': 16000,
+    'resize.js': 4000,
+}
+STATIC_STYLESHEETS = {
+    'doxygen.css': 30000,
+    'tabs.css': 1500,
+    'navtree.css': 2000,
+}
+STATIC_IMAGES = ['closed.png', 'open.png', 'doc.png', 'folderclosed.png', 'folderopen.png',
+                 'nav_f.png', 'nav_g.png', 'nav_h.png', 'sync_on.png', 'sync_off.png', 'tab_a.png', 'tab_b.png']
+
+PAGE_HEADER = """<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "https://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+<meta http-equiv="Content-Type" content="text/xhtml;charset=UTF-8"/>
+<meta http-equiv="X-UA-Compatible" content="IE=9"/>
+<meta name="generator" content="Doxygen 1.9.1"/>
+<title>{project}: {title}</title>
+<link href="tabs.css" rel="stylesheet" type="text/css"/>
+<script type="text/javascript" src="jquery.js"></script>
+<script type="text/javascript" src="dynsections.js"></script>
+<link href="doxygen.css" rel="stylesheet" type="text/css" />
+{extra_head}
+</head>
+<body>
+<div id="top"><!-- do not remove this div, it is closed by doxygen! -->
+<div id="titlearea">
+<table cellspacing="0" cellpadding="0">
+ <tbody>
+ <tr style="height: 56px;">
+  <td id="projectalign" style="padding-left: 0.5em;">
+   <div id="projectname">{project}</div>
+  </td>
+ </tr>
+ </tbody>
+</table>
+</div>
+<!-- end header part -->
+<!-- Generated by Doxygen 1.9.1 -->
+<script type="text/javascript" src="menudata.js"></script>
+<script type="text/javascript" src="menu.js"></script>
+</div><!-- top -->
+<div class="header">
+  <div class="headertitle">
+<div class="title">{title}</div>  </div>
+</div><!--header-->
+<div class="contents">
+"""
+
+PAGE_FOOTER = """</div><!-- contents -->
+<!-- start footer part -->
+<hr class="footer"/><address class="footer"><small>
+Generated by&#160;<a href="https://www.doxygen.org/index.html"><img class="footer" src="doxygen.svg" width="104" height="31" alt="doxygen"/></a> 1.9.1
+</small></address>
+</body>
+</html>
+"""
+
+
+def parse_doxyfile(doxyfile_path):
+    """
+    解析Doxyfile
+
+    返回：
+    - dict: 配置名 -> 值列表（支持行尾反斜杠续行和+=追加）
+    """
+    config = {}
+    logical_lines = []
+    current = ""
+    for line in Path(doxyfile_path).read_text(encoding='utf-8', errors='replace').splitlines():
+        stripped = line.strip()
+        if not current and (not stripped or stripped.startswith('#')):
+            continue
+        if stripped.endswith('\\'):
+            current += stripped[:-1] + " "
+            continue
+        logical_lines.append(current + stripped)
+        current = ""
+    if current:
+        logical_lines.append(current)
+
+    for line in logical_lines:
+        match = re.match(r'([A-Z_0-9]+)\s*(\+?=)\s*(.*)$', line)
+        if not match:
+            continue
+        key, operator, value = match.groups()
+        tokens = [quoted if quoted else plain for quoted, plain in VALUE_TOKEN_PATTERN.findall(value)]
+        if operator == '+=':
+            config.setdefault(key, []).extend(tokens)
+        else:
+            config[key] = tokens
+    return config
+
+
+def get_value(config, key, default=""):
+    """获取单值配置"""
+    values = config.get(key) or []
+    return " ".join(values) if values else default
+
+
+def escape_name(name):
+    """Doxygen的文件名转义规则（_ -> __，/ -> _2，. -> _8）"""
+    return name.replace('_', '__').replace('/', '_2').replace('.', '_8').replace(' ', '_01')
+
+
+def collect_input_files(config):
+    """按INPUT、FILE_PATTERNS和RECURSIVE收集输入文件，返回 (输入文件路径, 显示用相对路径) 列表"""
+    patterns = [pattern.lower() for pattern in config.get('FILE_PATTERNS', [])] or ['*.c', '*.h', '*.md']
+    recursive = get_value(config, 'RECURSIVE', 'NO').upper() == 'YES'
+    strip_paths = [os.path.normcase(os.path.abspath(path)) for path in config.get('STRIP_FROM_PATH', [])]
+
+    def display_name(file_path, input_root):
+        normalized = os.path.normcase(os.path.abspath(file_path))
+        for strip_path in strip_paths:
+            if normalized.startswith(strip_path.rstrip(os.sep) + os.sep):
+                return os.path.relpath(file_path, strip_path).replace(os.sep, '/')
+        return os.path.relpath(file_path, input_root).replace(os.sep, '/')
+
+    files = []
+    for input_path in config.get('INPUT', []):
+        if os.path.isfile(input_path):
+            files.append((input_path, os.path.basename(input_path)))
+            continue
+        if not os.path.isdir(input_path):
+            continue
+        for root, dirs, filenames in os.walk(input_path):
+            dirs.sort()
+            if not recursive:
+                dirs[:] = []
+            for filename in sorted(filenames):
+                if any(fnmatch.fnmatch(filename.lower(), pattern) for pattern in patterns):
+                    file_path = os.path.join(root, filename)
+                    files.append((file_path, display_name(file_path, input_path)))
+    return files
+
+
+def filler_text(name, size):
+    """生成指定大小的确定性填充内容（模拟压缩后的js/css）"""
+    seed = hashlib.md5(name.encode('utf-8')).hexdigest()
+    line = f"/* {name} {seed} */ var _{seed[:8]}=function(a,b){{return a+b;}};\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def build_png(width, height, seed):
+    """生成指定尺寸的PNG（灰度渐变，分多个IDAT块，与Doxygen生成的图片一样可以无损重新压缩）"""
+    rows = b''.join(b'\x00' + bytes((x * 7 + y * 3 + seed) % 256 for x in range(width)) for y in range(height))
+    data = zlib.compress(rows, 1)
+
+    def chunk(chunk_type, chunk_data):
+        return struct.pack('>I', len(chunk_data)) + chunk_type + chunk_data + struct.pack('>I', zlib.crc32(chunk_type + chunk_data) & 0xffffffff)
+
+    idat = b''.join(chunk(b'IDAT', data[i:i + 256]) for i in range(0, len(data), 256))
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+            + chunk(b'tEXt', b'Software\x00doxygen') + idat + chunk(b'IEND', b''))
+
+
+def render_source_page(project, display_name, source, extra_head):
+    """生成源文件页面：文件简介、函数列表和源码（div.line，与Doxygen的源码浏览一致）"""
+    functions = re.findall(r'^\w[\w\s\*]*?\b(\w+)\s*\([^;{]*\)\s*$', source, re.MULTILINE)
+    rows = "\n".join(
+        f'<tr class="memitem:a{index}"><td class="memItemLeft" align="right" valign="top">void&#160;</td>'
+        f'<td class="memItemRight" valign="bottom"><a class="el" href="#a{index}">{html.escape(function)}</a> (void)</td></tr>'
+        for index, function in enumerate(functions)
+    )
+    lines = "\n".join(
+        f'<div class="line"><a name="l{number:05d}"></a><span class="lineno">{number:5d}</span>&#160;{html.escape(text)}</div>'
+        for number, text in enumerate(source.splitlines(), 1)
+    )
+    body = (f'<table class="memberdecls">\n{rows}\n</table>\n'
+            f'<div class="fragment">\n{lines}\n</div><!-- fragment -->\n')
+    return PAGE_HEADER.format(project=project, title=f"{html.escape(display_name)} File Reference", extra_head=extra_head) + body + PAGE_FOOTER
+
+
+def render_markdown_page(project, title, source, extra_head):
+    """生成Markdown页面"""
+    paragraphs = "\n".join(f"<p>{html.escape(line)}</p>" for line in source.splitlines() if line.strip() and not line.startswith('#'))
+    return PAGE_HEADER.format(project=project, title=html.escape(title), extra_head=extra_head) + f'<div class="textblock">{paragraphs}</div>\n' + PAGE_FOOTER
+
+
+def hhc_item(name, local):
+    """index.hhc目录项"""
+    return (f'<LI><OBJECT type="text/sitemap"><param name="Name" value="{html.escape(name)}">'
+            f'<param name="Local" value="{local}"><param name="ImageNumber" value="11"></OBJECT>')
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print("用法: doxygen <Doxyfile>", file=sys.stderr)
+        return 1
+
+    config = parse_doxyfile(sys.argv[1])
+    project = get_value(config, 'PROJECT_NAME', 'Project')
+    output_dir = Path(get_value(config, 'OUTPUT_DIRECTORY', '.')) / get_value(config, 'HTML_OUTPUT', 'html')
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # HTML_STYLESHEET、HTML_EXTRA_FILES和PROJECT_LOGO按文件名复制到html目录
+    extra_head = []
+    for key in ('HTML_STYLESHEET', 'HTML_EXTRA_STYLESHEET', 'HTML_EXTRA_FILES', 'PROJECT_LOGO'):
+        for extra_file in config.get(key, []):
+            if os.path.isfile(extra_file):
+                shutil.copy2(extra_file, output_dir / os.path.basename(extra_file))
+                if extra_file.lower().endswith('.css'):
+                    extra_head.append(f'<link href="{os.path.basename(extra_file)}" rel="stylesheet" type="text/css"/>')
+                elif extra_file.lower().endswith('.js'):
+                    extra_head.append(f'<script type="text/javascript" src="{os.path.basename(extra_file)}"></script>')
+    extra_head = "\n".join(extra_head)
+
+    for name, size in {**STATIC_SCRIPTS, **STATIC_STYLESHEETS}.items():
+        (output_dir / name).write_text(filler_text(name, size), encoding='utf-8')
+    for index, name in enumerate(STATIC_IMAGES):
+        (output_dir / name).write_bytes(build_png(16 + index, 22, index))
+    (output_dir / 'doxygen.svg').write_text('<svg xmlns="http://www.w3.org/2000/svg" width="104" height="31"></svg>', encoding='utf-8')
+
+    mainpage = get_value(config, 'USE_MDFILE_AS_MAINPAGE')
+    mainpage_title = project
+    pages = []
+    for file_path, display_name in collect_input_files(config):
+        source = Path(file_path).read_text(encoding='utf-8', errors='replace')
+        if file_path.lower().endswith('.md'):
+            # 页面名称：\page命令或标题中的{#id}，主页为index.html，其余为md_<转义后的路径>.html
+            page_command = re.search(r'^[\\@]page\s+(\w+)\s*(.*)$', source, re.MULTILINE)
+            heading = re.search(r'^#\s*(.+?)\s*(?:\{#(\w+)\})?\s*$', source, re.MULTILINE)
+            if page_command:
+                page_id, title = page_command.group(1), page_command.group(2).strip() or page_command.group(1)
+            elif heading:
+                page_id, title = heading.group(2), heading.group(1)
+            else:
+                page_id, title = None, Path(file_path).stem
+
+            content = render_markdown_page(project, title, source, extra_head)
+            if page_id == 'mainpage' or (mainpage and os.path.basename(file_path) == os.path.basename(mainpage)):
+                mainpage_title = title
+                (output_dir / 'index.html').write_text(content, encoding='utf-8')
+                continue
+            page_name = f"{page_id}.html" if page_id else f"md_{escape_name(display_name[:-3])}.html"
+        else:
+            title = display_name
+            page_name = f"{escape_name(display_name)}.html"
+            content = render_source_page(project, display_name, source, extra_head)
+        (output_dir / page_name).write_text(content, encoding='utf-8')
+        pages.append((title, display_name, page_name))
+
+    if not (output_dir / 'index.html').exists():
+        (output_dir / 'index.html').write_text(render_markdown_page(project, project, "", extra_head), encoding='utf-8')
+
+    file_rows = "\n".join(
+        f'<tr id="row_0_{index}_"><td class="entry"><a class="el" href="{page_name}" target="_self">{html.escape(display_name)}</a></td></tr>'
+        for index, (title, display_name, page_name) in enumerate(pages)
+    )
+    (output_dir / 'files.html').write_text(
+        PAGE_HEADER.format(project=project, title="File List", extra_head=extra_head)
+        + f'<div class="directory"><table class="directory">\n{file_rows}\n</table></div>\n' + PAGE_FOOTER,
+        encoding='utf-8'
+    )
+
+    if get_value(config, 'GENERATE_HTMLHELP', 'NO').upper() == 'YES':
+        items = [hhc_item(mainpage_title, 'index.html'), hhc_item("Files", 'files.html'), '<UL>']
+        items.extend(hhc_item(display_name, page_name) for title, display_name, page_name in pages)
+        items.append('</UL>')
+        (output_dir / 'index.hhc').write_text(
+            '<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">\n<HTML><HEAD></HEAD><BODY>\n'
+            '<OBJECT type="text/site properties">\n<param name="FrameName" value="right">\n</OBJECT>\n'
+            '<UL>\n' + "\n".join(items) + '\n</UL>\n</BODY>\n</HTML>\n',
+            encoding='utf-8'
+        )
+        (output_dir / 'index.hhk').write_text(
+            '<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">\n<HTML><HEAD></HEAD><BODY>\n<UL>\n'
+            + "\n".join(hhc_item(title, page_name) for title, display_name, page_name in pages)
+            + '\n</UL>\n</BODY>\n</HTML>\n',
+            encoding='utf-8'
+        )
+        chm_file = get_value(config, 'CHM_FILE', 'index.chm')
+        html_files = sorted(name for name in os.listdir(output_dir) if (output_dir / name).is_file())
+        (output_dir / 'index.hhp').write_text(
+            f"[OPTIONS]\nCompiled file={chm_file}\nContents file=index.hhc\nIndex file=index.hhk\n"
+            f"Default topic=index.html\nTitle={project}\n\n[FILES]\n" + "\n".join(html_files) + "\n",
+            encoding='utf-8'
+        )
+
+    print(f"Generating HTML output for {len(pages)} files...")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
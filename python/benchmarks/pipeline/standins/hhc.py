@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+hhc.exe替身
+功能：读取HHP项目（当前工作目录下），把[FILES]中的文件以及目录、索引文件逐个zlib压缩后写入Compiled file，
+[MERGE FILES]中的CHM只检查是否存在，编译耗时随文件数量和大小增长，与hhc.exe的行为近似；
+read_chm读取生成的文件，供check_chm_partition.py检查分区编译的结果
+
+返回代码与hhc.exe一致：成功返回1，失败返回0
+"""
+
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+
+def read_hhp(hhp_file):
+    """读取HHP项目，返回 {段名: [行]}"""
+    data = Path(hhp_file).read_bytes()
+    for encoding in ('utf-8-sig', 'gbk'):
+        try:
+            text = data.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = data.decode('latin1')
+
+    sections = {}
+    current = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(';'):
+            continue
+        if line.startswith('[') and line.endswith(']'):
+            current = sections.setdefault(line[1:-1].upper(), [])
+        elif current is not None:
+            current.append(line)
+    return sections
+
+
+def read_chm(chm_file):
+    """读取替身生成的CHM，返回 {项目中的文件路径: 文件内容}"""
+    files = {}
+    data = Path(chm_file).read_bytes()
+    if data[:4] != b'ITSF':
+        raise ValueError(f"不是替身生成的CHM文件: {chm_file}")
+    offset = 4
+    header_size = struct.calcsize('<HI')
+    while offset < len(data):
+        name_length, data_length = struct.unpack_from('<HI', data, offset)
+        offset += header_size
+        name = data[offset:offset + name_length].decode('utf-8')
+        offset += name_length
+        files[name] = zlib.decompress(data[offset:offset + data_length])
+        offset += data_length
+    return files
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2 or not os.path.isfile(sys.argv[1]):
+        print("HHC5010: Error: Cannot open project file", file=sys.stderr)
+        return 0
+
+    sections = read_hhp(sys.argv[1])
+    options = {}
+    for line in sections.get('OPTIONS', []):
+        key, _, value = line.partition('=')
+        options[key.strip().lower()] = value.strip()
+
+    files = list(sections.get('FILES', []))
+    for key in ('contents file', 'index file'):
+        if options.get(key):
+            files.append(options[key])
+
+    compiled_file = options.get('compiled file') or Path(sys.argv[1]).with_suffix('.chm').name
+    missing = 0
+    with open(compiled_file, 'wb') as output:
+        output.write(b'ITSF')
+        for file_path in files:
+            local_path = file_path.replace('\\', os.sep)
+            try:
+                data = Path(local_path).read_bytes()
+            except OSError:
+                print(f"HHC5003: Error: Compilation failed while compiling {file_path}.")
+                missing += 1
+                continue
+            name = file_path.encode('utf-8')
+            compressed = zlib.compress(data, 6)
+            output.write(struct.pack('<HI', len(name), len(compressed)) + name + compressed)
+
+    for merge_file in sections.get('MERGE FILES', []):
+        if not os.path.isfile(merge_file):
+            print(f"HHC6003: Warning: The file {merge_file} specified in the [MERGE FILES] section could not be found.")
+
+    print(f"Compile time: {len(files)} files, {missing} missing")
+    print(f"Created {os.path.abspath(compiled_file)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
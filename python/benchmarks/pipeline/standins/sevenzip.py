@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+7z.exe替身
+功能：支持docs_decompression使用的命令形式 7z x <压缩包> -o<目录> [-y] [-r] [-bb0]，用zipfile解压，
+以及可用性检查使用的 7z --help
+
+返回代码与7z一致：0成功，2解压失败，7命令行错误
+"""
+
+import sys
+import zipfile
+
+
+def main():
+    """主函数"""
+    args = sys.argv[1:]
+    if args[:1] == ['--help']:
+        print("7-Zip stand-in\n\nUsage: 7z x <archive> -o<directory> [-y]")
+        return 0
+
+    if not args or args[0] != 'x':
+        print("Command Line Error: 只支持x命令", file=sys.stderr)
+        return 7
+
+    archive = None
+    output_dir = "."
+    for arg in args[1:]:
+        if arg.startswith('-o'):
+            output_dir = arg[2:]
+        elif not arg.startswith('-') and archive is None:
+            archive = arg
+
+    if archive is None:
+        print("Command Line Error: 缺少压缩包路径", file=sys.stderr)
+        return 7
+
+    try:
+        with zipfile.ZipFile(archive) as zip_file:
+            zip_file.extractall(output_dir)
+            count = len(zip_file.infolist())
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"ERROR: {archive}: {e}", file=sys.stderr)
+        return 2
+
+    print(f"Everything is Ok\n\nFiles: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+deep_translator替身（基准测试时通过PYTHONPATH替换真实的翻译库）
+功能：不访问网络，把中文片段替换为确定性的英文占位词；
+环境变量BENCH_TRANSLATE_LATENCY_MS可模拟每次请求的网络延迟
+"""
+
+import os
+import re
+import time
+import zlib
+
+CHINESE_PATTERN = re.compile(r'[\u4e00-\u9fff]+')
+
+
+class GoogleTranslator:
+    """与deep_translator.GoogleTranslator接口一致的翻译器"""
+
+    def __init__(self, source='auto', target='en', **kwargs):
+        self.source = source
+        self.target = target
+        self.latency = int(os.environ.get('BENCH_TRANSLATE_LATENCY_MS', '0') or 0) / 1000
+
+    def translate(self, text, **kwargs):
+        """翻译单条文本"""
+        if self.latency:
+            time.sleep(self.latency)
+        if not text:
+            return text
+        return CHINESE_PATTERN.sub(lambda match: f"Term{zlib.crc32(match.group(0).encode('utf-8')) % 10000:04d}", text)
+
+    def translate_batch(self, batch, **kwargs):
+        """批量翻译"""
+        return [self.translate(text) for text in batch]
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+合成文档输入树
+功能：按规模参数生成与真实芯片资料包结构一致的输入目录：
+1. 1-4编号目录下的中英文PDF
+2. 5-Hardware_Evaluation_Board下的评估板压缩包（多个根项目，解压到同名目录）
+3. 6-Software_Development_Kit下的SDK压缩包（单个根目录），包含驱动源码、
+   带中英文readme.txt的例程目录，以及需要递归解压的嵌套压缩包
+4. 7-Application_Note、8-User_Guide下的应用笔记和用户指南压缩包
+5. 以config/path.xlsx为模板、扩展到指定行数的合成数据表
+"""
+
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+# 规模预设
+SCALES = {
+    'small': {
+        'modules': 6,             # SDK驱动模块数量
+        'examples_per_module': 2, # 每个模块的例程数量
+        'source_lines': 150,      # 每个源文件的行数
+        'application_notes': 2,
+        'user_guides': 1,
+        'pdfs_per_folder': 2,     # 1-4编号目录下每个目录的PDF数量（中英文各一份算两个）
+        'pdf_kb': 32,
+        'excel_rows': 2000,
+    },
+    'medium': {
+        'modules': 24,
+        'examples_per_module': 4,
+        'source_lines': 400,
+        'application_notes': 8,
+        'user_guides': 3,
+        'pdfs_per_folder': 6,
+        'pdf_kb': 256,
+        'excel_rows': 20000,
+    },
+    'large': {
+        'modules': 60,
+        'examples_per_module': 8,
+        'source_lines': 800,
+        'application_notes': 20,
+        'user_guides': 6,
+        'pdfs_per_folder': 12,
+        'pdf_kb': 1024,
+        'excel_rows': 100000,
+    },
+}
+
+PDF_FOLDERS = {
+    '1-Product_Brief': 'PB',
+    '2-Datasheet': 'DS',
+    '3-User_Manual': 'UM',
+    '4-Errata_Sheet': 'ES',
+}
+
+README_TEMPLATE = """1、功能说明
+    1、{module}模块{name}例程，演示外设的初始化和基本用法。
+    2、通过串口打印运行结果。
+2、使用环境
+    软件开发环境：KEIL MDK-ARM V5.34
+    硬件开发环境：{chip}_EVB V1.0
+3、使用说明
+    1、编译后下载程序复位运行。
+
+1. Function description
+    1. {module} {name} example, shows peripheral initialization and basic usage.
+    2. Results are printed through the serial port.
+2. Development environment
+    Software development environment: KEIL MDK-ARM V5.34
+    Hardware development environment: {chip}_EVB V1.0
+3. Instructions for use
+    1. Download the program after compiling and reset to run.
+"""
+
+MAINPAGE_TEMPLATE = """# {title}
+
+{chip}系列软件开发包说明，包含外设驱动、例程和工具。
+
+This package contains the peripheral drivers, examples and utilities for {chip}.
+"""
+
+
+def build_source(module, kind, lines):
+    """生成带Doxygen注释（中英文）的C源文件或头文件"""
+    output = [f"/**\n * @file n32_{module.lower()}.{kind}\n * @brief {module}驱动 / {module} driver\n */"]
+    output.append(f'#include "n32_{module.lower()}.h"' if kind == 'c' else f"#ifndef __N32_{module}_H__\n#define __N32_{module}_H__")
+    index = 0
+    while len(output) < lines:
+        output.append(f"/**\n * @brief  配置{module}参数 / Configure {module} parameter {index}\n * @param  value 参数值\n */")
+        if kind == 'c':
+            output.append(f"void {module}_Config{index}(uint32_t value)\n{{\n    {module}->CTRL{index % 4} = value;\n}}")
+        else:
+            output.append(f"void {module}_Config{index}(uint32_t value);")
+        index += 1
+    if kind == 'h':
+        output.append("#endif")
+    return "\n".join(output) + "\n"
+
+
+def build_pdf(title, size):
+    """生成指定大小的PDF文件内容"""
+    stream = (f"BT /F1 12 Tf 72 720 Td ({title}) Tj ET\n" * (size // 40 + 1)).encode('latin1')[:size]
+    return (b"%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+            b"2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n"
+            b"3 0 obj << /Type /Page /Parent 2 0 R /Contents 4 0 R >> endobj\n"
+            + f"4 0 obj << /Length {len(stream)} >> stream\n".encode('latin1') + stream
+            + b"\nendstream endobj\ntrailer << /Root 1 0 R >>\n%%EOF\n")
+
+
+def write_zip(zip_path, files):
+    """写入压缩包，files为 {压缩包内路径: 内容（str或bytes）}"""
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content.encode('utf-8') if isinstance(content, str) else content)
+
+
+def build_sdk_files(chip, spec):
+    """生成SDK压缩包内容（单个根目录）"""
+    root = f"Nations.{chip}_Library.1.0.0"
+    files = {f"{root}/readme.md": MAINPAGE_TEMPLATE.format(title=f"{chip}软件开发包", chip=chip)}
+    lines = spec['source_lines']
+
+    for module_index in range(spec['modules']):
+        module = f"PERIPH{module_index:02d}"
+        files[f"{root}/firmware/n32_std_periph_driver/inc/n32_{module.lower()}.h"] = build_source(module, 'h', lines // 2)
+        files[f"{root}/firmware/n32_std_periph_driver/src/n32_{module.lower()}.c"] = build_source(module, 'c', lines)
+
+        for example_index in range(spec['examples_per_module']):
+            name = f"{module}_Example{example_index}"
+            example_dir = f"{root}/projects/{chip}_EVB/examples/{module}/{name}"
+            readme = README_TEMPLATE.format(module=module, name=name, chip=chip)
+            # 一半的readme使用GBK编码，与真实资料包一致
+            files[f"{example_dir}/readme.txt"] = readme.encode('gbk') if example_index % 2 else readme
+            files[f"{example_dir}/src/main.c"] = build_source(name.upper(), 'c', lines // 4)
+            files[f"{example_dir}/inc/main.h"] = build_source(name.upper(), 'h', lines // 8)
+
+    # 嵌套压缩包（递归解压）
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        zip_file.writestr("tool.c", build_source("TOOL", 'c', lines))
+        zip_file.writestr("tool.h", build_source("TOOL", 'h', lines // 2))
+        zip_file.writestr("readme.txt", "Utilities\n")
+    files[f"{root}/utilities/Tools.zip"] = buffer.getvalue()
+    return files
+
+
+def build_input_tree(input_folder, chip, spec):
+    """
+    生成合成输入目录
+
+    返回：
+    - dict: 生成的文件统计
+    """
+    input_folder = Path(input_folder)
+    pdf_size = spec['pdf_kb'] * 1024
+    stats = {'pdfs': 0, 'zips': 0, 'examples': spec['modules'] * spec['examples_per_module']}
+
+    for folder, code in PDF_FOLDERS.items():
+        folder_path = input_folder / folder
+        folder_path.mkdir(parents=True, exist_ok=True)
+        for index in range(spec['pdfs_per_folder'] // 2 or 1):
+            for language in ('CN', 'EN'):
+                name = f"{language}_{code}_{chip}_Series_Document{index}_V1.0.0.pdf"
+                (folder_path / name).write_bytes(build_pdf(name, pdf_size))
+                stats['pdfs'] += 1
+
+    # 评估板：多个根项目，解压到以压缩包命名的目录
+    write_zip(input_folder / "5-Hardware_Evaluation_Board" / f"{chip}_EVB_V1.0.zip", {
+        f"{chip}_EVB_V1.0_Schematic.pdf": build_pdf("Schematic", pdf_size),
+        f"{chip}_EVB_V1.0_用户手册.pdf": build_pdf("EVB User Manual", pdf_size),
+        "readme.md": MAINPAGE_TEMPLATE.format(title=f"{chip}评估板", chip=chip),
+    })
+    stats['zips'] += 1
+
+    write_zip(input_folder / "6-Software_Development_Kit" / f"Nations.{chip}_Library.1.0.0.zip", build_sdk_files(chip, spec))
+    stats['zips'] += 2
+
+    for index in range(spec['application_notes']):
+        root = f"AN_{chip}_Topic{index}_Application_Note_V1.0.0"
+        write_zip(input_folder / "7-Application_Note" / f"{root}.zip", {
+            f"{root}/readme.md": MAINPAGE_TEMPLATE.format(title=f"应用笔记{index}", chip=chip),
+            f"{root}/{root}.pdf": build_pdf(root, pdf_size),
+            f"{root}/src/an_topic{index}.c": build_source(f"AN{index}", 'c', spec['source_lines']),
+            f"{root}/inc/an_topic{index}.h": build_source(f"AN{index}", 'h', spec['source_lines'] // 2),
+        })
+        stats['zips'] += 1
+
+    for index in range(spec['user_guides']):
+        root = f"UG_{chip}_Guide{index}_V1.0.0"
+        write_zip(input_folder / "8-User_Guide" / f"{root}.zip", {
+            f"{root}/readme.md": MAINPAGE_TEMPLATE.format(title=f"用户指南{index}", chip=chip),
+            f"{root}/{root}.pdf": build_pdf(root, pdf_size),
+        })
+        stats['zips'] += 1
+
+    return stats
+
+
+def build_path_excel(excel_file, chip, rows):
+    """以config/path.xlsx为模板生成指定行数的合成数据表（大部分行属于其他芯片系列）"""
+    benchmarks_dir = Path(__file__).parent.parent
+    if str(benchmarks_dir) not in sys.path:
+        sys.path.insert(0, str(benchmarks_dir))
+
+    import pandas as pd
+    from bench_generate_modules import build_synthetic_sheet
+
+    template = pd.read_excel(benchmarks_dir.parent.parent / "config" / "path.xlsx")
+    excel_file = Path(excel_file)
+    excel_file.parent.mkdir(parents=True, exist_ok=True)
+    build_synthetic_sheet(template, rows).to_excel(excel_file, index=False)
+    return excel_file
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+batch_build.py - 多芯片批量构建脚本
+功能：为config/chip.json中的多个芯片系列运行完整的构建步骤，各芯片共享缓存和工作进程预算
+
+主要功能：
+1. 从config/chip.json读取芯片列表（可用chips指定），每个芯片的资料包位于 input_root/<芯片名>，
+   输出到 output_root/<芯片名>
+2. 同时构建Parallel_Chips个芯片，每个芯片按前端组合脚本的顺序运行各步骤（与main.py相同，每个步骤是独立进程），
+   某个步骤失败时继续运行该芯片的后续步骤（与前端组合脚本的行为一致）
+3. 所有芯片的步骤共享Max_Workers个工作者的预算：每个步骤进程的进程池/线程池最多使用
+   Max_Workers // Parallel_Chips 个工作者（环境变量CHM_MAX_WORKERS，见WorkerBudget）
+4. 所有芯片共享 output_root/cache 下按内容寻址的缓存（环境变量CHM_SHARED_CACHE_DIR）：
+   path.xlsx编译缓存、HTTP缓存、翻译结果、Doxygen输出（如Common_Platform等相同的子项目）、
+   图片和页面压缩结果，先完成的芯片生成的结果由后续芯片直接复用
+5. 每个芯片的步骤输出写入 output_root/<芯片名>/batch_build.log，结束时输出汇总，有失败的步骤时返回非0
+
+参数：
+- input_root: 各芯片资料包的上级目录
+- output_root: 各芯片输出目录的上级目录
+- batch_config_json: 批量构建配置JSON，例如
+  {"chips": ["N32G432xx", "N32G435xx"], "chipVersion": "1.0.0", "Parallel_Chips": 2, "Max_Workers": 8}
+  - chips: 要构建的芯片，默认为chip.json中资料包目录存在的所有芯片
+  - stages: 要运行的步骤，默认为前端组合脚本的全部步骤
+  - overrides: 按芯片名覆盖单个芯片的配置，如 {"N32G435xx": {"chipVersion": "1.1.0"}}
+  - 其它配置项（chipVersion、Http_Offline、Image_Max_Width等）合并到每个芯片的配置中
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# 添加当前目录到Python路径
+current_dir = Path(__file__).parent
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
+
+from common_utils import (
+    Logger,
+    ArgumentParser,
+    ConfigManager,
+    JsonUtils,
+    PathUtils,
+    CacheUtils,
+    WorkerBudget,
+    Tracer,
+    Progress,
+    timing_decorator,
+    format_duration
+)
+
+# 按前端组合脚本顺序排列的步骤
+BATCH_STAGES = [
+    "docs_decompression",
+    "docs_gen_main_html",
+    "generate_modules",
+    "get_chip_data",
+    "translate_main_modules",
+    "docs_main_doxygen",
+    "docs_gen_config",
+    "docs_gen_doxyfile",
+    "docs_gen_doxygen",
+    "docs_gen_pdfhtml",
+    "docs_gen_examples",
+    "docs_gen_examples_overview",
+    "docs_gen_examples_description",
+    "docs_gen_template_hhc",
+    "docs_gen_hhc",
+    "docs_gen_hhp",
+    "docs_optimize_images",
+    "docs_minify_html",
+    "generate_chm_hhc",
+]
+
+# 批量构建本身的配置项（不合并到芯片配置中）
+BATCH_CONFIG_KEYS = {"chips", "stages", "overrides", "Parallel_Chips", "Max_Workers"}
+
+# 芯片版本号格式（与前端校验规则一致）
+CHIP_VERSION_PATTERN = re.compile(r'^\d+(\.\d+)*$')
+
+# 每个芯片的步骤输出日志
+BATCH_LOG_FILE = "batch_build.log"
+
+
+class BatchBuilder:
+    """
+    多芯片批量构建器类
+    
+    主要职责：
+    - 从config/chip.json中选出要构建的芯片并生成各自的芯片配置
+    - 在共享的工作者预算内同时构建多个芯片，每个芯片依次运行各步骤
+    - 设置共享缓存目录，使各芯片复用相同的中间结果
+    - 汇总各芯片各步骤的结果
+    """
+    
+    def __init__(self, input_root: str, output_root: str, batch_config: Dict[str, Any]):
+        """初始化批量构建器"""
+        self.input_root = Path(input_root)
+        self.output_root = Path(output_root)
+        self.batch_config = batch_config
+        self.project_root = PathUtils.get_project_root()
+        self.python_dir = Path(__file__).parent.parent
+        
+        self.stages = batch_config.get('stages') or BATCH_STAGES
+        self.overrides = batch_config.get('overrides') or {}
+        self.common_config = {key: value for key, value in batch_config.items() if key not in BATCH_CONFIG_KEYS}
+        
+        # 工作者预算：同时构建的芯片平分，每个步骤进程至少1个工作者
+        self.max_workers = int(batch_config.get('Max_Workers') or os.cpu_count() or 1)
+        self.parallel_chips = max(1, int(batch_config.get('Parallel_Chips') or 2))
+        self.shared_cache_dir = CacheUtils.get_cache_dir(self.output_root)
+    
+    def load_chip_entries(self) -> Dict[str, Dict[str, Any]]:
+        """读取config/chip.json，返回芯片名到芯片参考配置的映射"""
+        chip_groups = JsonUtils.load_json(self.project_root / "config" / "chip.json")
+        entries = {}
+        for group in chip_groups:
+            for chip in group.get('children', []):
+                entries[chip['name']] = chip
+        return entries
+    
+    def select_chips(self) -> Optional[List[str]]:
+        """
+        选出要构建的芯片
+        
+        返回：
+        - list: 芯片名列表，指定的芯片不存在或资料包目录不存在时返回None
+        """
+        entries = self.load_chip_entries()
+        chip_names = self.batch_config.get('chips')
+        
+        if not chip_names:
+            # 未指定时构建资料包目录存在的所有芯片
+            return [name for name in entries if (self.input_root / name).is_dir()]
+        
+        unknown = [name for name in chip_names if name not in entries]
+        if unknown:
+            Logger.error(f"config/chip.json中不存在这些芯片: {', '.join(unknown)}")
+            return None
+        
+        missing = [name for name in chip_names if not (self.input_root / name).is_dir()]
+        if missing:
+            Logger.error(f"资料包目录不存在: {', '.join(str(self.input_root / name) for name in missing)}")
+            return None
+        
+        return list(dict.fromkeys(chip_names))
+    
+    def build_chip_config(self, chip_name: str, chip_entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """生成单个芯片的配置（芯片参考配置 + 公共配置 + 该芯片的覆盖配置）"""
+        chip_config = {
+            'chipName': chip_name,
+            'chipVersion': chip_entry.get('chipVersion', ''),
+            'Cn_WebUrl': chip_entry.get('Cn_WebUrl', ''),
+            'En_WebUrl': chip_entry.get('En_WebUrl', ''),
+            'Zip_Url': chip_entry.get('Zip_Url', ''),
+        }
+        chip_config.update(self.common_config)
+        chip_config.update(self.overrides.get(chip_name, {}))
+        
+        if not CHIP_VERSION_PATTERN.match(str(chip_config.get('chipVersion', ''))):
+            Logger.error(f"[{chip_name}] 芯片版本格式不正确，只能包含数字和小数点，如：2.4.0")
+            return None
+        return chip_config
+    
+    def get_stage_env(self) -> Dict[str, str]:
+        """获取步骤进程的环境变量"""
+        env = dict(os.environ)
+        env[CacheUtils.SHARED_CACHE_ENV] = str(self.shared_cache_dir)
+        env[WorkerBudget.MAX_WORKERS_ENV] = str(max(1, self.max_workers // self.parallel_chips))
+        env['PYTHONIOENCODING'] = 'utf-8'
+        
+        # 步骤进程的输出写入日志文件，不输出进度事件
+        env.pop(Progress.SWITCH_ENV, None)
+        return env
+    
+    def run_stage(self, stage: str, input_folder: Path, output_folder: Path,
+                  chip_config_json: str, env: Dict[str, str], log_file: Path) -> Dict[str, Any]:
+        """运行一个步骤进程，返回步骤结果"""
+        command = [sys.executable, str(current_dir / f"{stage}.py"), str(input_folder), str(output_folder), chip_config_json]
+        
+        with open(log_file, 'a', encoding='utf-8') as log:
+            log.write(f"\n===== {stage} =====\n")
+            log.flush()
+            start_time = time.time()
+            with Tracer.span(f"{output_folder.name}/{stage}", "batch"):
+                result = subprocess.run(command, cwd=self.python_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        
+        return {
+            'stage': stage,
+            'returncode': result.returncode,
+            'duration': time.time() - start_time
+        }
+    
+    def build_chip(self, chip_name: str, chip_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """依次运行一个芯片的所有步骤"""
+        input_folder = self.input_root / chip_name
+        output_folder = self.output_root / chip_name
+        output_folder.mkdir(parents=True, exist_ok=True)
+        
+        log_file = output_folder / BATCH_LOG_FILE
+        log_file.write_text("", encoding='utf-8')
+        chip_config_json = json.dumps(chip_config, ensure_ascii=False)
+        env = self.get_stage_env()
+        
+        results = []
+        for stage in self.stages:
+            result = self.run_stage(stage, input_folder, output_folder, chip_config_json, env, log_file)
+            results.append(result)
+            if result['returncode'] == 0:
+                Logger.info(f"[{chip_name}] {stage} 完成，耗时 {format_duration(result['duration'])}")
+            else:
+                Logger.error(f"[{chip_name}] {stage} 失败，返回码: {result['returncode']}，详见 {log_file}")
+        return results
+    
+    def print_summary(self, chip_results: Dict[str, List[Dict[str, Any]]]):
+        """输出各芯片的构建结果"""
+        for chip_name, results in chip_results.items():
+            failed = [result['stage'] for result in results if result['returncode'] != 0]
+            duration = sum(result['duration'] for result in results)
+            if failed:
+                Logger.error(f"[{chip_name}] {len(failed)} 个步骤失败: {', '.join(failed)}，耗时 {format_duration(duration)}")
+            else:
+                Logger.success(f"[{chip_name}] 全部 {len(results)} 个步骤完成，耗时 {format_duration(duration)}")
+    
+    def run(self) -> bool:
+        """运行批量构建"""
+        chip_names = self.select_chips()
+        if chip_names is None:
+            return False
+        if not chip_names:
+            Logger.warning(f"{self.input_root} 下没有config/chip.json中芯片的资料包目录")
+            return False
+        
+        entries = self.load_chip_entries()
+        chip_configs = {}
+        for chip_name in chip_names:
+            chip_config = self.build_chip_config(chip_name, entries[chip_name])
+            if chip_config is None:
+                return False
+            chip_configs[chip_name] = chip_config
+        
+        self.parallel_chips = min(self.parallel_chips, len(chip_names))
+        Logger.info(
+            f"批量构建 {len(chip_names)} 个芯片，同时构建 {self.parallel_chips} 个，"
+            f"每个步骤最多 {max(1, self.max_workers // self.parallel_chips)} 个工作者，共享缓存: {self.shared_cache_dir}"
+        )
+        
+        chip_results = {}
+        Progress.begin("chips", len(chip_names))
+        with ThreadPoolExecutor(max_workers=self.parallel_chips) as executor:
+            future_to_chip = {
+                executor.submit(self.build_chip, chip_name, chip_configs[chip_name]): chip_name
+                for chip_name in chip_names
+            }
+            for future in as_completed(future_to_chip):
+                chip_name = future_to_chip[future]
+                try:
+                    chip_results[chip_name] = future.result()
+                except Exception as e:
+                    Logger.error(f"[{chip_name}] 构建异常: {e}")
+                    chip_results[chip_name] = [{'stage': 'batch_build', 'returncode': 1, 'duration': 0}]
+                Progress.advance("chips", item=chip_name)
+        Progress.end("chips")
+        
+        self.print_summary({chip_name: chip_results[chip_name] for chip_name in chip_names})
+        return all(result['returncode'] == 0 for results in chip_results.values() for result in results)
+
+
+@timing_decorator
+def main():
+    """主函数"""
+    try:
+        # 解析命令行参数
+        input_root, output_root, batch_config_json = ArgumentParser.parse_standard_args(
+            3, "python batch_build.py <input_root> <output_root> <batch_config_json>"
+        )
+        
+        # 解析批量构建配置JSON
+        config_manager = ConfigManager()
+        batch_config = config_manager.load_chip_config(batch_config_json)
+        
+        # 创建批量构建器并执行
+        builder = BatchBuilder(input_root, output_root, batch_config)
+        
+        if not builder.run():
+            sys.exit(1)
+    
+    except Exception as e:
+        Logger.error(f"执行失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,8 @@ import re
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from functools import wraps
+from contextlib import contextmanager
+import threading
 
 
 class ConfigManager:
@@ -76,6 +78,31 @@ class PathUtils:
         """获取项目根目录"""
         return Path(__file__).parent.parent.parent
     
+    @staticmethod
+    def get_tools_dir() -> Path:
+        """获取外部工具目录（doxygen、7z、hhc），环境变量CHM_TOOLS_DIR可指定其他目录"""
+        tools_dir = os.environ.get("CHM_TOOLS_DIR")
+        return Path(tools_dir) if tools_dir else PathUtils.get_project_root() / "tools"
+    
+    @staticmethod
+    def get_tool_path(tool_dir_name: str, exe_name: str) -> Path:
+        """
+        获取外部工具的可执行文件路径
+        
+        找不到exe_name时依次查找同名的.cmd脚本（Windows）或不带扩展名的可执行文件（其他系统），
+        都不存在时返回exe_name对应的路径，由调用方报告缺失
+        """
+        tool_dir = PathUtils.get_tools_dir() / tool_dir_name
+        tool_path = tool_dir / exe_name
+        if tool_path.is_file():
+            return tool_path.resolve()
+        
+        stem = Path(exe_name).stem
+        candidate = tool_dir / (f"{stem}.cmd" if os.name == 'nt' else stem)
+        if candidate.is_file():
+            return candidate.resolve()
+        return tool_path.resolve()
+    
     @staticmethod
     def ensure_dir(path: Union[str, Path]) -> Path:
         """确保目录存在"""
@@ -131,7 +158,28 @@ class FileUtils:
         except Exception as e:
             Logger.error(f"写入文件失败 {file_path}: {e}")
             return False
-    
+
+    @staticmethod
+    def write_file_if_changed(file_path: Union[str, Path], content: str, encoding: str = 'utf-8') -> bool:
+        """
+        写入文件，内容哈希与现有文件一致时跳过写入（保留文件修改时间，便于下游增量处理）
+
+        返回：
+        - bool: 是否成功（内容未变化也视为成功）
+        """
+        file_path = Path(file_path)
+        try:
+            if file_path.exists():
+                with open(file_path, 'r', encoding=encoding) as f:
+                    existing_hash = hashlib.md5(f.read().encode(encoding)).hexdigest()
+                if existing_hash == hashlib.md5(content.encode(encoding)).hexdigest():
+                    return True
+        except (OSError, UnicodeError):
+            # 无法读取现有文件时直接覆盖
+            pass
+
+        return FileUtils.write_file(file_path, content, encoding)
+
     @staticmethod
     def copy_file_with_processing(src: Union[str, Path], dst: Union[str, Path], 
                                 processor: callable = None) -> bool:
@@ -159,6 +207,140 @@ class FileUtils:
             Logger.error(f"复制文件失败 {src} -> {dst}: {e}")
             return False
 
+    @staticmethod
+    def copy_file_fast(src: Union[str, Path], dst: Union[str, Path]) -> None:
+        """
+        复制文件内容并保留修改时间
+
+        支持copy_file_range的平台由内核直接复制（支持reflink的文件系统只共享数据块），
+        不支持或跨文件系统时退回shutil.copy2（已使用各平台的快速复制接口）
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                if remaining <= 0:
+                    shutil.copystat(src, dst)
+                    return
+            except OSError:
+                pass
+
+        shutil.copy2(src, dst)
+
+    @staticmethod
+    def copy_file_if_changed(src: Union[str, Path], dst: Union[str, Path]) -> bool:
+        """
+        复制文件，目标文件内容一致时跳过
+
+        大小和修改时间都一致时直接视为相同，只有大小一致时再比较内容
+
+        返回：
+        - bool: 是否实际复制
+        """
+        src_stat = os.stat(src)
+        try:
+            dst_stat = os.stat(dst)
+            if dst_stat.st_size == src_stat.st_size and (
+                dst_stat.st_mtime_ns == src_stat.st_mtime_ns or FileUtils.is_same_content(src, dst)
+            ):
+                return False
+        except OSError:
+            pass
+
+        FileUtils.copy_file_fast(src, dst)
+        return True
+
+    @staticmethod
+    def is_same_content(file_a: Union[str, Path], file_b: Union[str, Path]) -> bool:
+        """逐块比较两个文件的内容"""
+        with open(file_a, 'rb') as fa, open(file_b, 'rb') as fb:
+            while True:
+                chunk_a = fa.read(1024 * 1024)
+                if chunk_a != fb.read(1024 * 1024):
+                    return False
+                if not chunk_a:
+                    return True
+
+    @staticmethod
+    def copy_tree(src_dir: Union[str, Path], dst_dir: Union[str, Path],
+                  processor: callable = None, process_prefixes: tuple = (),
+                  mirror: bool = False, max_workers: int = None) -> Dict[str, int]:
+        """
+        增量复制目录树
+
+        - 使用scandir遍历源目录，先创建所有目标目录
+        - 文件名以process_prefixes开头的文件经processor处理内容后写入（内容未变化时不写入）
+        - 其余文件用线程池并行复制，目标文件内容一致时跳过
+        - mirror为True时删除目标目录中源目录没有的文件和目录（相当于先清空再复制）
+
+        返回：
+        - dict: 统计信息（copied、skipped、processed、removed）
+        """
+        stats = {'copied': 0, 'skipped': 0, 'processed': 0, 'removed': 0}
+        copy_jobs = []
+        process_jobs = []
+        stack = [(str(src_dir), str(dst_dir))]
+
+        while stack:
+            current_src, current_dst = stack.pop()
+            os.makedirs(current_dst, exist_ok=True)
+
+            src_entries = {}
+            with os.scandir(current_src) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    src_entries[entry.name] = is_dir
+                    dst_path = os.path.join(current_dst, entry.name)
+                    if is_dir:
+                        stack.append((entry.path, dst_path))
+                    elif processor and entry.name.startswith(process_prefixes):
+                        process_jobs.append((entry.path, dst_path))
+                    else:
+                        copy_jobs.append((entry.path, dst_path))
+
+            # 删除类型不一致（文件/目录）的条目；mirror为True时同时删除源目录中没有的条目
+            stale_entries = []
+            with os.scandir(current_dst) as entries:
+                for entry in entries:
+                    src_is_dir = src_entries.get(entry.name)
+                    if src_is_dir is None:
+                        if mirror:
+                            stale_entries.append(entry)
+                    elif src_is_dir != entry.is_dir(follow_symlinks=False):
+                        stale_entries.append(entry)
+            for entry in stale_entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+                stats['removed'] += 1
+
+        for src_path, dst_path in process_jobs:
+            with open(src_path, 'r', encoding='utf-8') as f:
+                content = processor(f.read())
+            FileUtils.write_file_if_changed(dst_path, content)
+            stats['processed'] += 1
+
+        def copy_job(job):
+            return FileUtils.copy_file_if_changed(*job)
+
+        if len(copy_jobs) < 2:
+            results = [copy_job(job) for job in copy_jobs]
+        else:
+            # concurrent.futures会导入logging等模块，只在需要并行复制时导入
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=max_workers or WorkerBudget.get_max_workers()) as executor:
+                results = list(executor.map(copy_job, copy_jobs))
+
+        stats['copied'] = sum(1 for copied in results if copied)
+        stats['skipped'] = len(results) - stats['copied']
+        return stats
+
 
 class HashUtils:
     """哈希工具类"""
@@ -174,6 +356,15 @@ class HashUtils:
         """生成8位哈希值（兼容性方法）"""
         return HashUtils.generate_md5_hash(text, 8)
     
+    @staticmethod
+    def get_file_hash(file_path: Union[str, Path]) -> str:
+        """计算文件内容的MD5哈希"""
+        hash_obj = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hash_obj.update(chunk)
+        return hash_obj.hexdigest()
+    
     @staticmethod
     def reverse_hash_lookup(hash_value: str, mapping_data: List[Dict[str, Any]]) -> Optional[str]:
         """
@@ -231,6 +422,180 @@ class HashUtils:
         return HashUtils.reverse_hash_lookup(hash_value, mapping_data)
 
 
+class ExamplesIndex:
+    """
+    examples.json索引
+
+    一次性构建，供docs_gen_examples_description和docs_gen_examples_overview共用：
+    - 路径前缀树：按Path的各级目录建立，每个节点记录其子树在排序列表中的区间，
+      查询"某关键路径下的所有examples"的耗时与结果数量成正比
+    - hash路径别名：hash_path <-> original_path 双向映射（来自path_mapping.json）
+    - Level索引：Level id -> examples
+    """
+
+    def __init__(self, examples_data: List[Dict[str, Any]],
+                 path_mappings: List[Dict[str, Any]] = None):
+        """
+        初始化索引
+
+        参数：
+        - examples_data: examples.json中的data列表
+        - path_mappings: path_mapping.json中的mappings列表
+        """
+        self.examples = examples_data or []
+
+        # hash路径别名（保留第一次出现的映射，与原先的线性查找结果一致）
+        self.hash_to_original = {}
+        self.original_to_hash = {}
+        for mapping in path_mappings or []:
+            hash_path = mapping.get("hash_path")
+            original_path = mapping.get("original_path")
+            if hash_path and original_path:
+                self.hash_to_original.setdefault(hash_path, original_path)
+                self.original_to_hash.setdefault(original_path, hash_path)
+
+        # Level索引
+        self.level_index = {}
+        for item in self.examples:
+            level = item.get('Level', '')
+            if level:
+                self.level_index.setdefault(level, []).append(item)
+
+        # 路径前缀树：按路径段排序后插入，同一前缀下的examples在排序列表中连续
+        self._sorted_positions = []
+        self._trie = {'children': {}, 'range': None}
+        decorated = sorted(
+            (self.split_path(item.get('Path', '')), position)
+            for position, item in enumerate(self.examples)
+        )
+        for sorted_index, (segments, position) in enumerate(decorated):
+            self._sorted_positions.append(position)
+            node = self._trie
+            self._extend_range(node, sorted_index)
+            for segment in segments:
+                node = node['children'].setdefault(segment, {'children': {}, 'range': None})
+                self._extend_range(node, sorted_index)
+
+    @staticmethod
+    def _extend_range(node: Dict[str, Any], sorted_index: int):
+        """将排序下标并入节点的区间"""
+        if node['range'] is None:
+            node['range'] = [sorted_index, sorted_index + 1]
+        else:
+            node['range'][1] = sorted_index + 1
+
+    @staticmethod
+    def split_path(path: str) -> tuple:
+        """将路径统一为正斜杠并拆分为路径段"""
+        return tuple(part for part in path.replace('\\', '/').split('/') if part)
+
+    @classmethod
+    def from_output_folder(cls, output_folder: Union[str, Path]) -> 'ExamplesIndex':
+        """
+        从output_folder/json下的examples.json和path_mapping.json构建索引
+
+        参数：
+        - output_folder: 输出目录路径
+
+        返回：
+        - ExamplesIndex: 索引实例（文件不存在时为空索引）
+        """
+        output_folder = Path(output_folder)
+        examples_file = output_folder / "json" / "examples.json"
+
+        examples_data = []
+        if examples_file.exists():
+            examples_data = JsonUtils.load_json(examples_file).get('data', [])
+
+        return cls(examples_data, HashUtils.load_path_mapping(output_folder))
+
+    def find_by_path(self, key_path: str) -> List[Dict[str, Any]]:
+        """
+        查找关键路径下的所有examples（完全匹配或前缀匹配），保持examples.json中的原始顺序
+
+        参数：
+        - key_path: 关键路径，如 "6-Software_Development_Kit/Nations.N32G4FR_Library.2.4.0"
+
+        返回：
+        - list: 匹配的examples
+        """
+        node = self._trie
+        for segment in self.split_path(key_path or ''):
+            node = node['children'].get(segment)
+            if node is None:
+                return []
+
+        if node['range'] is None:
+            return []
+
+        start, end = node['range']
+        positions = sorted(self._sorted_positions[start:end])
+        return [self.examples[position] for position in positions]
+
+    def find_by_level(self, level: str) -> List[Dict[str, Any]]:
+        """根据Level id查找examples"""
+        return self.level_index.get(level, [])
+
+    def resolve_hash(self, hash_value: str) -> Optional[str]:
+        """根据hash值查找原始路径，未找到返回None"""
+        return self.hash_to_original.get(hash_value)
+
+    def get_hash_path(self, original_path: str) -> Optional[str]:
+        """根据原始路径查找hash值，未找到返回None"""
+        return self.original_to_hash.get(original_path)
+
+    def lookup(self, key_path: str) -> List[Dict[str, Any]]:
+        """
+        按files.html的关键路径查找examples
+
+        依次尝试：
+        1. 直接按路径前缀匹配
+        2. 将路径最后一段视为hash，反查原始路径后匹配
+        3. 使用 目录/原始路径 的完整格式匹配
+
+        参数：
+        - key_path: 关键路径（可能包含hash）
+
+        返回：
+        - list: 匹配的examples
+        """
+        matched = self.find_by_path(key_path)
+        if matched:
+            return matched
+
+        segments = self.split_path(key_path or '')
+        if len(segments) < 2:
+            return []
+
+        original_path = self.resolve_hash(segments[-1])
+        if not original_path:
+            return []
+
+        matched = self.find_by_path(original_path)
+        if matched:
+            return matched
+
+        return self.find_by_path('/'.join(segments[:-1]) + '/' + original_path)
+
+    def group_by_segment(self, segment_index: int, default: str = "") -> Dict[str, List[Dict[str, Any]]]:
+        """
+        按Path的第segment_index段分组，分组和组内顺序均与examples.json中的首次出现顺序一致
+
+        参数：
+        - segment_index: 路径段下标（0为第一段）
+        - default: 路径段数不足时使用的分组名
+
+        返回：
+        - dict: 分组名 -> examples列表
+        """
+        groups = {}
+        for item in self.examples:
+            segments = self.split_path(item.get('Path', ''))
+            group_name = segments[segment_index] if len(segments) > segment_index else default
+            groups.setdefault(group_name, []).append(item)
+        return groups
+
+
 class TemplateProcessor:
     """模板处理器"""
     
@@ -433,6 +798,340 @@ class JsonUtils:
             raise Exception(f"加载JSON文件失败 {file_path}: {e}")
 
 
+class CacheUtils:
+    """
+    构建缓存目录
+
+    缓存默认放在 output_folder/cache 下。按内容寻址的缓存（工作簿、HTTP、图片、页面压缩、翻译、Doxygen输出）
+    可以由多个芯片的构建共享，设置环境变量CHM_SHARED_CACHE_DIR后放在该目录下（见batch_build.py）。
+    """
+
+    CACHE_DIR_NAME = "cache"
+    SHARED_CACHE_ENV = "CHM_SHARED_CACHE_DIR"
+
+    @staticmethod
+    def get_cache_dir(output_folder: Union[str, Path]) -> Path:
+        """获取缓存目录（位于构建输出目录下）"""
+        return Path(output_folder) / CacheUtils.CACHE_DIR_NAME
+
+    @staticmethod
+    def get_shared_cache_dir(output_folder: Union[str, Path]) -> Path:
+        """获取可以在多个芯片的构建之间共享的缓存目录，未设置CHM_SHARED_CACHE_DIR时与get_cache_dir相同"""
+        shared_dir = os.environ.get(CacheUtils.SHARED_CACHE_ENV)
+        if shared_dir:
+            return Path(shared_dir)
+        return CacheUtils.get_cache_dir(output_folder)
+
+    @staticmethod
+    @contextmanager
+    def file_lock(lock_file: Union[str, Path], timeout: float = 30.0, stale_seconds: float = 120.0):
+        """
+        跨进程的锁文件，用于多个构建同时更新共享缓存中的同一个文件
+
+        锁文件以独占方式创建，已存在时等待；超过stale_seconds未更新的锁文件视为持有者已被结束，直接删除。
+        超过timeout仍未获得锁时抛出TimeoutError。
+
+        用法：
+            with CacheUtils.file_lock(cache_file.with_name(f"{cache_file.name}.lock")):
+                ...
+        """
+        lock_file = Path(lock_file)
+        lock_file.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fd = os.open(lock_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_file.stat().st_mtime > stale_seconds:
+                        lock_file.unlink()
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"等待锁文件超时: {lock_file}")
+                time.sleep(0.05)
+        try:
+            os.write(fd, str(os.getpid()).encode('ascii'))
+        finally:
+            os.close(fd)
+        try:
+            yield
+        finally:
+            try:
+                lock_file.unlink()
+            except OSError:
+                pass
+
+
+class WorkbookCache:
+    """
+    Excel工作簿编译缓存
+
+    首次读取时用pandas解析XLSX并保存为pickle，之后按工作簿内容的哈希命中缓存，
+    工作簿变化后自动重新生成。缓存目录见CacheUtils。
+    """
+
+    @staticmethod
+    def read_excel(excel_file: Union[str, Path], cache_dir: Union[str, Path]):
+        """
+        读取Excel工作簿，优先使用编译缓存
+
+        参数：
+        - excel_file: 工作簿路径，如 config/path.xlsx
+        - cache_dir: 缓存目录
+
+        返回：
+        - pandas.DataFrame: 工作簿第一个工作表的数据
+        """
+        import pandas as pd
+
+        excel_file = Path(excel_file)
+        cache_dir = Path(cache_dir)
+        cache_file = cache_dir / f"{excel_file.stem}_{HashUtils.get_file_hash(excel_file)}.pkl"
+
+        if cache_file.exists():
+            try:
+                return pd.read_pickle(cache_file)
+            except Exception as e:
+                Logger.warning(f"工作簿缓存无效，将重新解析: {e}")
+
+        data = pd.read_excel(excel_file)
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # 删除同一工作簿的旧缓存（只匹配"<工作簿名>_<MD5>.pkl"，不影响名称以相同前缀开头的其它工作簿）
+            stale_pattern = re.compile(rf"^{re.escape(excel_file.stem)}_[0-9a-f]{{32}}\.pkl$")
+            for stale_file in cache_dir.glob(f"{excel_file.stem}_*.pkl"):
+                if stale_pattern.match(stale_file.name):
+                    stale_file.unlink(missing_ok=True)
+
+            # 先写临时文件再替换，避免并行阶段读到不完整的缓存
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            data.to_pickle(temp_file)
+            os.replace(temp_file, cache_file)
+        except Exception as e:
+            Logger.warning(f"保存工作簿缓存失败: {e}")
+
+        return data
+
+
+class TranslationCache:
+    """
+    翻译结果缓存
+
+    按原文保存翻译器（zh-CN -> en）返回的结果，同一批构建中相同的中文文本只请求一次翻译服务。
+    缓存文件为 <缓存目录>/translations.json；保存时在锁文件（translations.json.lock）保护下
+    重新读取文件并合并已有的条目，并行运行的多个构建不会覆盖彼此新增的条目。
+    """
+
+    CACHE_FILE_NAME = "translations.json"
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """初始化并加载缓存文件"""
+        self.cache_file = Path(cache_dir) / self.CACHE_FILE_NAME
+        self.entries = self.load_entries()
+        self.new_entries = {}
+
+    def load_entries(self) -> Dict[str, str]:
+        """读取缓存文件，不存在或无效时返回空字典"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            return JsonUtils.load_json(self.cache_file)
+        except Exception as e:
+            Logger.warning(f"翻译缓存无效，将重新翻译: {e}")
+            return {}
+
+    def get(self, text: str) -> Optional[str]:
+        """获取原文的翻译结果，未命中时返回None"""
+        return self.entries.get(text)
+
+    def set(self, text: str, translated: str):
+        """记录翻译结果（调用save后写入文件）"""
+        if translated and self.entries.get(text) != translated:
+            self.entries[text] = translated
+            self.new_entries[text] = translated
+
+    def save(self) -> bool:
+        """把新增的翻译结果合并写入缓存文件（保存失败时保留新增的条目，下次保存时重试）"""
+        if not self.new_entries:
+            return True
+        try:
+            # 读取、合并和替换在同一把锁内完成，其它构建在此期间保存的条目不会丢失
+            with CacheUtils.file_lock(self.cache_file.with_name(f"{self.cache_file.name}.lock")):
+                entries = self.load_entries()
+                entries.update(self.new_entries)
+
+                # 先写临时文件再替换，避免其它构建读到不完整的缓存
+                temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False, indent=0)
+                os.replace(temp_file, self.cache_file)
+            self.entries = entries
+            self.new_entries = {}
+            return True
+        except Exception as e:
+            Logger.warning(f"保存翻译缓存失败: {e}")
+            return False
+
+
+class WorkerBudget:
+    """
+    工作进程/线程数量预算
+
+    各步骤的进程池和线程池默认最多使用6个工作者；多个芯片同时构建时（见batch_build.py），
+    通过环境变量CHM_MAX_WORKERS把总预算分给各个芯片，避免同时运行的进程数超过CPU核数。
+    """
+
+    MAX_WORKERS_ENV = "CHM_MAX_WORKERS"
+
+    @staticmethod
+    def get_max_workers(limit: int = 6) -> int:
+        """获取进程池/线程池的最大工作者数量"""
+        max_workers = min(limit, os.cpu_count() or 1)
+        try:
+            budget = int(os.environ.get(WorkerBudget.MAX_WORKERS_ENV, 0))
+        except ValueError:
+            budget = 0
+        if budget > 0:
+            max_workers = min(max_workers, budget)
+        return max_workers
+
+
+class BuildFileRegistry:
+    """
+    构建产物登记表
+
+    每个向output目录写文件的脚本在结束时登记自己的产物，HHP生成时直接读取登记表，
+    不再重新遍历整个output目录。登记表位于 output_folder/json/build_files/<脚本名>.txt，
+    每行一个相对于output目录的路径（使用"/"分隔），脚本重新运行时覆盖自己的登记文件。
+    """
+
+    REGISTRY_DIR_NAME = "build_files"
+
+    # output下的各区域及向该区域写文件的脚本
+    AREA_STAGES = {
+        "main": ("docs_main_doxygen",),
+        "pdf": ("docs_gen_pdfhtml",),
+        "sub": ("docs_gen_doxygen",),
+        "extra": ("docs_gen_config", "docs_gen_examples_overview", "docs_gen_template_hhc"),
+    }
+
+    def __init__(self, output_folder: Union[str, Path], stage: str):
+        """
+        初始化登记表
+
+        参数：
+        - output_folder: 输出目录路径
+        - stage: 登记产物的脚本名称，如 docs_gen_pdfhtml
+        """
+        self.output_dir = Path(output_folder) / "output"
+        self.registry_file = BuildFileRegistry.get_registry_dir(output_folder) / f"{stage}.txt"
+        self.files = set()
+
+    @staticmethod
+    def get_registry_dir(output_folder: Union[str, Path]) -> Path:
+        """获取登记表目录"""
+        return Path(output_folder) / "json" / BuildFileRegistry.REGISTRY_DIR_NAME
+
+    @staticmethod
+    def scan_tree(directory: Union[str, Path], base_dir: Union[str, Path]):
+        """
+        使用scandir遍历目录，逐个返回相对于base_dir的文件路径（使用"/"分隔）
+        """
+        base_prefix_length = len(os.path.join(str(base_dir), ''))
+        stack = [str(directory)]
+
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path[base_prefix_length:].replace(os.sep, '/')
+            except OSError:
+                continue
+
+    def add(self, file_path: Union[str, Path]):
+        """登记单个文件（绝对路径或相对于output目录的路径）"""
+        file_path = Path(file_path)
+        if file_path.is_absolute():
+            try:
+                file_path = file_path.relative_to(self.output_dir)
+            except ValueError:
+                return
+        self.files.add(file_path.as_posix())
+
+    def add_tree(self, directory: Union[str, Path]):
+        """登记目录下的所有文件"""
+        directory = Path(directory)
+        if directory.exists():
+            self.files.update(BuildFileRegistry.scan_tree(directory, self.output_dir))
+
+    def save(self) -> bool:
+        """保存登记文件（覆盖该脚本之前的登记）"""
+        try:
+            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.registry_file.with_name(f"{self.registry_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                for relative_path in sorted(self.files):
+                    f.write(f"{relative_path}\n")
+            os.replace(temp_file, self.registry_file)
+            return True
+        except Exception as e:
+            Logger.warning(f"保存构建产物登记表失败 {self.registry_file}: {e}")
+            return False
+
+    @staticmethod
+    def load_all(output_folder: Union[str, Path]) -> Optional[set]:
+        """
+        读取所有脚本登记的文件
+
+        - 某个区域的产出脚本中有没有登记文件的（如在旧的输出目录上只重新运行了其中一个脚本），
+          该区域改为扫描目录，不使用不完整的登记
+        - 登记后已从磁盘删除的文件不再返回
+
+        返回：
+        - set: 相对于output目录的文件路径集合，没有任何登记文件时返回None
+        """
+        registry_dir = BuildFileRegistry.get_registry_dir(output_folder)
+        if not registry_dir.exists():
+            return None
+
+        registry_files = sorted(registry_dir.glob("*.txt"))
+        if not registry_files:
+            return None
+
+        output_dir = Path(output_folder) / "output"
+        registered_stages = {registry_file.stem for registry_file in registry_files}
+        scanned_areas = sorted(
+            area for area, stages in BuildFileRegistry.AREA_STAGES.items()
+            if not all(stage in registered_stages for stage in stages)
+        )
+
+        files = set()
+        for registry_file in registry_files:
+            with open(registry_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    relative_path = line.rstrip('\n')
+                    if not relative_path or relative_path.split('/', 1)[0] in scanned_areas:
+                        continue
+                    if os.path.isfile(output_dir / relative_path):
+                        files.add(relative_path)
+
+        for area in scanned_areas:
+            area_dir = output_dir / area
+            if area_dir.exists():
+                Logger.warning(f"output/{area}的构建产物登记不完整，扫描该目录")
+                files.update(BuildFileRegistry.scan_tree(area_dir, output_dir))
+        return files
+
+
 class BaseGenerator:
     """基础生成器类"""
     
@@ -498,17 +1197,364 @@ def log_warning(message: str):
     Logger.warning(message)
 
 
+class Tracer:
+    """
+    构建时间线追踪（Chrome trace-event格式，可用Perfetto或chrome://tracing打开）
+    
+    - span: 记录一段耗时（ph=X），用于解压、Doxygen任务、hhc编译、翻译批次等热点循环
+    - counter: 记录计数器（ph=C），如已处理的文件数和字节数
+    - 每次运行（环境变量CHM_TRACE_RUN）使用一条新的时间线：前端每次"运行选中脚本"、batch_build每次批量构建
+      和基准测试的每次流水线设置一个运行编号，所有步骤进程继承；未设置时由第一个脚本生成，即单独运行的脚本各自一条
+    - 每个进程把事件逐条追加到 output_folder/json/trace/<运行编号>/<进程号>_<启动时间>.jsonl，
+      进程池的工作进程通过环境变量找到同一目录，进程被直接结束时也不会丢失已记录的事件
+    - 新的运行开始时删除同一输出目录下其它运行的片段
+    - 每个脚本结束时（timing_decorator）把本次运行的片段合并为 output_folder/json/trace.json
+    - 环境变量 CHM_TRACE=0 时关闭
+    """
+    
+    TRACE_DIR_ENV = "CHM_TRACE_DIR"
+    RUN_ENV = "CHM_TRACE_RUN"
+    SWITCH_ENV = "CHM_TRACE"
+    TRACE_DIR_NAME = "trace"
+    TRACE_FILE_NAME = "trace.json"
+    
+    _fd = None
+    _pid = None
+    
+    @staticmethod
+    def get_trace_dir(output_folder: Union[str, Path], run_id: Optional[str] = None) -> Path:
+        """获取事件片段目录（指定运行编号时为该次运行的子目录）"""
+        trace_dir = Path(output_folder) / "json" / Tracer.TRACE_DIR_NAME
+        return trace_dir / run_id if run_id else trace_dir
+    
+    @staticmethod
+    def get_run_id() -> str:
+        """获取本次运行的编号，未设置时生成新的编号并设置环境变量（子进程继承）"""
+        run_id = re.sub(r'[^0-9A-Za-z_.-]', '_', os.environ.get(Tracer.RUN_ENV, "")).strip('.')
+        if not run_id:
+            run_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        os.environ[Tracer.RUN_ENV] = run_id
+        return run_id
+    
+    @staticmethod
+    def prune(output_folder: Union[str, Path], run_id: str):
+        """删除其它运行的事件片段"""
+        trace_root = Tracer.get_trace_dir(output_folder)
+        if not trace_root.exists():
+            return
+        for entry in trace_root.iterdir():
+            if entry.name == run_id:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            elif entry.suffix == ".jsonl":
+                entry.unlink(missing_ok=True)
+    
+    @staticmethod
+    def start(output_folder: Union[str, Path]) -> bool:
+        """开始记录（设置环境变量，子进程继承同一运行编号和目录）"""
+        if os.environ.get(Tracer.SWITCH_ENV) == "0":
+            return False
+        run_id = Tracer.get_run_id()
+        trace_dir = Tracer.get_trace_dir(output_folder, run_id)
+        if not trace_dir.exists():
+            Tracer.prune(output_folder, run_id)
+        os.environ[Tracer.TRACE_DIR_ENV] = str(trace_dir)
+        return True
+    
+    @staticmethod
+    def is_enabled() -> bool:
+        """是否正在记录"""
+        return bool(os.environ.get(Tracer.TRACE_DIR_ENV))
+    
+    @staticmethod
+    def now_us() -> int:
+        """当前时间（微秒，所有进程共用的时间轴）"""
+        return time.time_ns() // 1000
+    
+    @staticmethod
+    def write_event(event: Dict[str, Any]):
+        """写入一个事件，每个进程第一次写入时创建自己的片段文件"""
+        trace_dir = os.environ.get(Tracer.TRACE_DIR_ENV)
+        if not trace_dir:
+            return
+        
+        pid = os.getpid()
+        if Tracer._pid != pid:
+            Tracer._pid = pid
+            try:
+                os.makedirs(trace_dir, exist_ok=True)
+                fragment_file = os.path.join(trace_dir, f"{pid}_{time.time_ns()}.jsonl")
+                Tracer._fd = os.open(fragment_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            except OSError:
+                Tracer._fd = None
+                return
+            
+            # 进程名称：脚本名，进程池中的工作进程加上worker后缀
+            import multiprocessing
+            process_name = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "python"
+            if multiprocessing.parent_process() is not None:
+                process_name += " worker"
+            Tracer.write_event({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process_name}})
+        
+        if Tracer._fd is None:
+            return
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        try:
+            os.write(Tracer._fd, line.encode('utf-8'))
+        except OSError:
+            pass
+    
+    @staticmethod
+    @contextmanager
+    def span(name: str, category: str = "stage", **args):
+        """
+        记录一段耗时
+        
+        用法：
+            with Tracer.span("doxygen", "doxygen", project=name):
+                ...
+        """
+        if not Tracer.is_enabled():
+            yield
+            return
+        
+        start_us = Tracer.now_us()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Tracer.write_event({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_us,
+                "dur": int((time.perf_counter() - start) * 1000000),
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": args
+            })
+    
+    @staticmethod
+    def counter(name: str, **values):
+        """记录计数器的当前值，如 Tracer.counter("zip", done=3, total=10)"""
+        if not Tracer.is_enabled():
+            return
+        Tracer.write_event({"name": name, "ph": "C", "ts": Tracer.now_us(), "pid": os.getpid(), "args": values})
+    
+    @staticmethod
+    def merge(output_folder: Union[str, Path], run_id: Optional[str] = None) -> Optional[Path]:
+        """
+        合并本次运行（默认为环境变量CHM_TRACE_RUN）的事件片段为trace.json
+        
+        返回：
+        - Path: trace.json路径，没有事件时返回None
+        """
+        run_id = run_id or os.environ.get(Tracer.RUN_ENV)
+        if not run_id:
+            return None
+        trace_dir = Tracer.get_trace_dir(output_folder, run_id)
+        if not trace_dir.exists():
+            return None
+        
+        events = []
+        for fragment_file in sorted(trace_dir.glob("*.jsonl")):
+            with open(fragment_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        # 进程写入时被结束，跳过不完整的行
+                        continue
+        if not events:
+            return None
+        
+        # 元数据事件在前，其余按时间排序
+        events.sort(key=lambda event: (event.get("ph") != "M", event.get("ts", 0)))
+        
+        trace_file = Tracer.get_trace_dir(output_folder).parent / Tracer.TRACE_FILE_NAME
+        temp_file = trace_file.with_name(f"{trace_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, trace_file)
+        return trace_file
+
+
+class Progress:
+    """
+    结构化进度上报（JSON lines协议，前端据此显示每个步骤的进度条）
+    
+    - 每行以 "@@progress " 开头，后面是一个JSON数组，每个元素是一个任务的最新状态：
+      {"stage": 脚本名, "task": 任务名, "item": 最近完成的项目, "done": 已完成数, "total": 总数,
+       "bytes": 已处理字节数, "ms": 任务已运行的毫秒数, "state": "running"/"done"}
+    - advance只更新内存中的状态，距离上次输出超过最小间隔（默认200ms，CHM_PROGRESS_INTERVAL_MS）才输出一行，
+      同一行中每个任务只保留最新状态；任务开始和结束时立即输出
+    - 只在环境变量 CHM_PROGRESS=1（前端启动脚本时设置）时输出，命令行运行时不产生额外输出
+    - 只在脚本主进程中调用（进程池的结果在主进程中汇总时上报）
+    """
+    
+    PREFIX = "@@progress "
+    SWITCH_ENV = "CHM_PROGRESS"
+    INTERVAL_ENV = "CHM_PROGRESS_INTERVAL_MS"
+    DEFAULT_INTERVAL_MS = 200
+    
+    _lock = threading.Lock()
+    _stage = None
+    _tasks: Dict[str, Dict[str, Any]] = {}
+    _dirty: List[str] = []
+    _last_flush = 0.0
+    
+    @staticmethod
+    def is_enabled() -> bool:
+        """是否输出进度事件"""
+        return os.environ.get(Progress.SWITCH_ENV) == "1"
+    
+    @staticmethod
+    def get_interval() -> float:
+        """获取最小输出间隔（秒）"""
+        try:
+            return int(os.environ.get(Progress.INTERVAL_ENV, Progress.DEFAULT_INTERVAL_MS)) / 1000
+        except ValueError:
+            return Progress.DEFAULT_INTERVAL_MS / 1000
+    
+    @staticmethod
+    def start(stage: str):
+        """设置当前脚本名（timing_decorator调用）"""
+        Progress._stage = stage
+    
+    @staticmethod
+    def begin(task: str, total: Optional[int] = None):
+        """开始一个任务（立即输出）"""
+        if not Progress.is_enabled():
+            return
+        with Progress._lock:
+            Progress._tasks[task] = {
+                'task': task,
+                'item': None,
+                'done': 0,
+                'total': total,
+                'bytes': 0,
+                'start': time.perf_counter(),
+                'state': 'running'
+            }
+            Progress._mark_dirty(task)
+        Progress.flush()
+    
+    @staticmethod
+    def advance(task: str, item: Optional[str] = None, size: int = 0, count: int = 1):
+        """记录完成了count个项目，按最小间隔合并输出"""
+        if not Progress.is_enabled():
+            return
+        with Progress._lock:
+            state = Progress._tasks.get(task)
+            if state is None:
+                state = Progress._tasks[task] = {
+                    'task': task, 'item': None, 'done': 0, 'total': None,
+                    'bytes': 0, 'start': time.perf_counter(), 'state': 'running'
+                }
+            state['done'] += count
+            state['bytes'] += size or 0
+            if item is not None:
+                state['item'] = str(item)
+            Progress._mark_dirty(task)
+            due = time.perf_counter() - Progress._last_flush >= Progress.get_interval()
+        if due:
+            Progress.flush()
+    
+    @staticmethod
+    def end(task: str):
+        """结束一个任务（立即输出）"""
+        if not Progress.is_enabled():
+            return
+        with Progress._lock:
+            state = Progress._tasks.get(task)
+            if state is None:
+                return
+            state['state'] = 'done'
+            Progress._mark_dirty(task)
+        Progress.flush()
+        with Progress._lock:
+            Progress._tasks.pop(task, None)
+    
+    @staticmethod
+    def _mark_dirty(task: str):
+        """标记任务有未输出的状态（调用方持有锁）"""
+        if task not in Progress._dirty:
+            Progress._dirty.append(task)
+    
+    @staticmethod
+    def flush():
+        """输出所有未输出的任务状态（一行）"""
+        with Progress._lock:
+            if not Progress._dirty:
+                return
+            now = time.perf_counter()
+            events = []
+            for task in Progress._dirty:
+                state = Progress._tasks.get(task)
+                if state is None:
+                    continue
+                events.append({
+                    'stage': Progress._stage,
+                    'task': task,
+                    'item': state['item'],
+                    'done': state['done'],
+                    'total': state['total'],
+                    'bytes': state['bytes'],
+                    'ms': int((now - state['start']) * 1000),
+                    'state': state['state']
+                })
+            Progress._dirty.clear()
+            Progress._last_flush = now
+            line = Progress.PREFIX + json.dumps(events, ensure_ascii=False, separators=(',', ':'))
+            # 在锁内输出，多个线程的进度行不会交错
+            print(line, flush=True)
+    
+    @staticmethod
+    def track(task: str, iterable, total: Optional[int] = None, item=None, size=None):
+        """
+        迭代并上报进度，调用方处理完一个元素（取下一个元素）时记为完成一项
+        
+        用法：
+            for result in Progress.track("minify", executor.map(minify, files), total=len(files)):
+                ...
+        
+        参数：
+        - item: 从元素得到项目名称的函数
+        - size: 从元素得到字节数的函数
+        """
+        if total is None and hasattr(iterable, '__len__'):
+            total = len(iterable)
+        Progress.begin(task, total)
+        try:
+            for element in iterable:
+                yield element
+                Progress.advance(
+                    task,
+                    item=item(element) if item else None,
+                    size=size(element) if size else 0
+                )
+        finally:
+            Progress.end(task)
+
+
 def timing_decorator(func):
-    """时间统计装饰器"""
+    """时间统计装饰器（同时把脚本执行记录到构建时间线，见Tracer；设置进度事件的脚本名，见Progress）"""
     @wraps(func)
     def wrapper(*args, **kwargs):
         # 获取脚本名称
         script_name = Path(func.__code__.co_filename).stem
         Logger.info(f"{script_name}开始执行")
         
+        # 标准参数 <input_folder> <output_folder> <chip_config_json>，时间线写入output_folder
+        output_folder = sys.argv[2] if len(sys.argv) > 2 else None
+        tracing = bool(output_folder) and Tracer.start(output_folder)
+        Progress.start(script_name)
+        
         start_time = time.time()
         try:
-            result = func(*args, **kwargs)
+            with Tracer.span(script_name, "script"):
+                result = func(*args, **kwargs)
             end_time = time.time()
             elapsed_time = end_time - start_time
             Logger.success(f"{script_name}执行完成")
@@ -519,6 +1565,12 @@ def timing_decorator(func):
             elapsed_time = end_time - start_time
             Logger.error(f"脚本执行失败，耗时: {elapsed_time:.2f} 秒，错误: {e}")
             raise
+        finally:
+            if tracing:
+                try:
+                    Tracer.merge(output_folder)
+                except Exception as e:
+                    Logger.warning(f"合并构建时间线失败: {e}")
     return wrapper
 
 
@@ -23,7 +23,7 @@ if str(current_dir) not in sys.path:
 
 from common_utils import (
     Logger, PathUtils, FileUtils, 
-    timing_decorator, ArgumentParser
+    Tracer, Progress, timing_decorator, ArgumentParser
 )
 
 # 使用7zip命令行工具进行解压
@@ -42,13 +42,13 @@ class DocsDecompressor:
     def _find_sevenzip_executable(self):
         """查找7zip可执行文件"""
         # 优先使用7z.exe（完整版本）
-        sevenzip_path = self.project_root / "tools" / "7z" / "7z.exe"
+        sevenzip_path = PathUtils.get_tool_path("7z", "7z.exe")
         
         if sevenzip_path.exists() and sevenzip_path.is_file():
             return str(sevenzip_path)
         
         # 备用：尝试7za.exe
-        sevenza_path = self.project_root / "tools" / "7z" / "7za.exe"
+        sevenza_path = PathUtils.get_tool_path("7z", "7za.exe")
         if sevenza_path.exists() and sevenza_path.is_file():
             return str(sevenza_path)
         
@@ -293,6 +293,8 @@ class DocsDecompressor:
         extracted_dirs = []  # 记录解压后的目录，用于递归解压
         
         round_name = "递归解压" if is_recursive else "原始解压"
+        progress_task = "unzip_nested" if is_recursive else "unzip"
+        Progress.begin(progress_task, len(zip_files))
         
         for i, zip_file in enumerate(zip_files, 1):
             # 分析zip文件结构
@@ -301,10 +303,17 @@ class DocsDecompressor:
             # 检查是否已经解压
             if self.is_already_extracted(zip_file, extract_info):
                 skip_count += 1
+                Progress.advance(progress_task, item=zip_file.name)
                 continue
             
-            # 执行解压
-            if self.extract_zip_file(zip_file, extract_info):
+            # 执行解压（记录到构建时间线，并上报进度）
+            zip_size = zip_file.stat().st_size
+            with Tracer.span(zip_file.name, "unzip", round=round_name, size=zip_size):
+                extracted = self.extract_zip_file(zip_file, extract_info)
+            Tracer.counter("unzip", done=i, total=len(zip_files))
+            Progress.advance(progress_task, item=zip_file.name, size=zip_size)
+            
+            if extracted:
                 success_count += 1
                 # 记录解压后的目录，用于递归解压
                 if extract_info['extract_to_folder']:
@@ -321,6 +330,7 @@ class DocsDecompressor:
                 self.failed_files.append(zip_file)
                 Logger.error(f"解压失败: {zip_file.name}")
         
+        Progress.end(progress_task)
         return success_count, skip_count, extracted_dirs
     
     def run(self):
@@ -15,7 +15,7 @@ current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from common_utils import BaseGenerator, ArgumentParser, Logger, timing_decorator,ConfigManager
+from common_utils import BaseGenerator, ArgumentParser, Logger, timing_decorator,ConfigManager, BuildFileRegistry
 
 
 class ConfigGenerator(BaseGenerator):
@@ -79,6 +79,10 @@ class ConfigGenerator(BaseGenerator):
             config_file = extra_dir / "Config.html"
             from common_utils import FileUtils
             if FileUtils.write_file(config_file, config_content):
+                # 登记构建产物
+                file_registry = BuildFileRegistry(self.output_folder, "docs_gen_config")
+                file_registry.add(config_file)
+                file_registry.save()
                 return True
             else:
                 return False
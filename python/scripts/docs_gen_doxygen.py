@@ -12,6 +12,8 @@ Doxygen文档生成脚本
 5. 在执行doxygen前清除对应的输出目录
 6. 支持超时控制（50分钟超时）
 7. 生成详细的执行报告和统计信息
+8. 跨项目去重静态资源（css、js、图片），相同内容只在output/sub/_shared下保留一份
+9. 批量构建时按指纹缓存子项目的Doxygen输出，多个芯片中相同的子项目只运行一次doxygen
 
 技术特点：
 - 多进程并行处理，最大并发数6个
@@ -24,14 +26,16 @@ Doxygen文档生成脚本
 """
 
 import os
+import re
 import sys
+import hashlib
 import subprocess
 import time
 import shutil
 from datetime import datetime
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Tuple
 
 # 设置默认编码
 if sys.platform.startswith('win'):
@@ -62,9 +66,375 @@ from common_utils import (
     BaseGenerator,
     Logger,
     ArgumentParser,
+    BuildFileRegistry,
+    FileUtils,
+    PathUtils,
+    HashUtils,
+    CacheUtils,
+    Tracer,
+    Progress,
+    WorkerBudget,
     timing_decorator
 )
 
+# 共享静态资源目录（位于 output/sub 下）
+SHARED_ASSET_DIR_NAME = "_shared"
+
+# 参与跨项目去重的静态资源扩展名
+SHARED_ASSET_EXTENSIONS = {'.css', '.js', '.png', '.gif', '.svg', '.jpg', '.jpeg'}
+
+# 需要改写资源引用的文件扩展名
+ASSET_REFERENCE_FILE_EXTENSIONS = ('.html', '.htm', '.css')
+
+# Doxygen输出缓存目录（位于共享缓存目录下）和缓存格式版本（指纹规则变化时递增）
+DOXYGEN_CACHE_DIR_NAME = "doxygen"
+DOXYGEN_CACHE_VERSION = 1
+
+# Doxyfile中引用的、内容会影响输出的文件
+DOXYFILE_FILE_KEYS = ('PROJECT_LOGO', 'HTML_HEADER', 'HTML_FOOTER', 'HTML_STYLESHEET', 'HTML_EXTRA_STYLESHEET', 'HTML_EXTRA_FILES')
+
+# 计算缓存指纹时替换为占位符的路径配置（与构建目录位置有关）
+DOXYFILE_PATH_KEYS = ('OUTPUT_DIRECTORY', 'INPUT', 'STRIP_FROM_PATH') + DOXYFILE_FILE_KEYS
+
+# Doxyfile配置行：KEY = VALUE
+DOXYFILE_OPTION_PATTERN = re.compile(r'^\s*([A-Z_]+)\s*=(.*)$')
+
+# Doxyfile配置值中的各个路径：带引号的路径或以空白分隔的路径
+DOXYFILE_VALUE_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# 页面和样式表中的资源引用：src="x"、href="x"、url(x)（不含协议、锚点和查询参数）
+ASSET_REFERENCE_PATTERN = re.compile(
+    r'((?:\bsrc|\bhref)\s*=\s*["\']|url\(\s*["\']?)([^"\'()#?:\s]+)',
+    re.IGNORECASE
+)
+
+# 脚本中以字符串形式出现的资源文件名（脚本按页面位置拼接路径，这些资源不能移动）
+SCRIPT_ASSET_NAME_PATTERN = re.compile(
+    r'["\']([^"\'/\\\s]+\.(?:css|js|png|gif|svg|jpe?g))["\']',
+    re.IGNORECASE
+)
+
+
+def rewrite_shared_asset_references(task: Tuple[str, str, List[str]]) -> int:
+    """
+    改写一个html目录下页面和样式表中对已共享资源的引用（在工作进程中执行）
+    
+    参数：
+    - task: (html目录, 共享目录, 已移到共享目录的文件名列表)
+    
+    返回：
+    - int: 修改的文件数
+    """
+    html_dir, shared_dir, moved_names = task
+    html_dir = os.path.normpath(html_dir)
+    moved_names = set(moved_names)
+    changed_count = 0
+    
+    for root, dirs, files in os.walk(html_dir):
+        for file_name in files:
+            if not file_name.lower().endswith(ASSET_REFERENCE_FILE_EXTENSIONS):
+                continue
+            if root == html_dir and file_name in moved_names:
+                continue
+            
+            def replace_reference(match):
+                target = os.path.normpath(os.path.join(root, match.group(2)))
+                if os.path.dirname(target) != html_dir or os.path.basename(target) not in moved_names:
+                    return match.group(0)
+                shared_file = os.path.join(shared_dir, os.path.basename(target))
+                return match.group(1) + os.path.relpath(shared_file, root).replace(os.sep, '/')
+            
+            file_path = os.path.join(root, file_name)
+            content = FileUtils.read_file_with_encoding(file_path)
+            new_content = ASSET_REFERENCE_PATTERN.sub(replace_reference, content)
+            if new_content != content and FileUtils.write_file(file_path, new_content):
+                changed_count += 1
+    
+    return changed_count
+
+
+class DoxygenAssetDeduplicator:
+    """
+    Doxygen静态资源跨项目去重器
+    
+    每个子项目的Doxygen输出都带有一份doxygen.css、tabs.css、jquery.js、dynsections.js、导航图片
+    以及customdoxygen.css、custom_scripts.js。本类按内容哈希找出多个项目中相同的静态资源，
+    只在output/sub/_shared下保留一份，并改写页面和样式表中的引用。
+    
+    安全规则：
+    - 同名资源只共享出现次数最多的内容版本，其它版本留在项目内
+    - 样式表通过url()引用的资源必须同时被共享且内容一致，否则样式表留在项目内
+    - 脚本中以字符串出现的资源名不共享（脚本按页面位置拼接路径）
+    """
+    
+    def __init__(self, sub_dir: Path, max_workers: int = 6):
+        """初始化去重器"""
+        self.sub_dir = Path(sub_dir)
+        self.shared_dir = self.sub_dir / SHARED_ASSET_DIR_NAME
+        self.max_workers = max_workers
+    
+    def find_html_dirs(self) -> List[str]:
+        """查找output/sub下所有Doxygen的html输出目录"""
+        html_dirs = []
+        for root, dirs, files in os.walk(self.sub_dir):
+            if root == str(self.sub_dir) and SHARED_ASSET_DIR_NAME in dirs:
+                dirs.remove(SHARED_ASSET_DIR_NAME)
+            if 'html' in dirs:
+                html_dirs.append(os.path.join(root, 'html'))
+                dirs.remove('html')
+        return sorted(html_dirs)
+    
+    @staticmethod
+    def scan_assets(html_dir: str) -> Dict[str, str]:
+        """
+        扫描html目录第一层的静态资源
+        
+        返回：
+        - dict: 文件名 -> 内容哈希
+        """
+        assets = {}
+        with os.scandir(html_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SHARED_ASSET_EXTENSIONS:
+                    assets[entry.name] = HashUtils.get_file_hash(entry.path)
+        return assets
+    
+    @staticmethod
+    def get_stylesheet_references(css_file: str) -> Set[str]:
+        """获取样式表中url()引用的本地资源（包含子目录的引用原样返回）"""
+        content = FileUtils.read_file_with_encoding(css_file)
+        return {
+            match.group(2) for match in ASSET_REFERENCE_PATTERN.finditer(content)
+            if match.group(1).lower().startswith('url')
+        }
+    
+    def plan(self, dir_assets: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+        """
+        选择需要共享的资源
+        
+        参数：
+        - dir_assets: html目录 -> {文件名: 内容哈希}
+        
+        返回：
+        - dict: 共享文件名 -> 内容哈希
+        """
+        # 统计每个 (文件名, 内容哈希) 出现的项目数
+        occurrences = {}
+        for html_dir, assets in dir_assets.items():
+            for name, content_hash in assets.items():
+                occurrences.setdefault((name, content_hash), []).append(html_dir)
+        
+        # 同名资源只共享出现次数最多的版本
+        shared = {}
+        for (name, content_hash), html_dirs in sorted(occurrences.items()):
+            if len(html_dirs) < 2:
+                continue
+            if name not in shared or len(html_dirs) > len(occurrences[(name, shared[name])]):
+                shared[name] = content_hash
+        
+        # 脚本中以字符串出现的资源名不共享（包括上次运行已共享的脚本）
+        script_files = [
+            os.path.join(html_dirs[0], name) for (name, _), html_dirs in occurrences.items()
+            if name.lower().endswith('.js')
+        ]
+        if self.shared_dir.exists():
+            script_files.extend(str(path) for path in self.shared_dir.glob("*.js"))
+        script_names = set()
+        for script_file in script_files:
+            content = FileUtils.read_file_with_encoding(script_file)
+            script_names.update(SCRIPT_ASSET_NAME_PATTERN.findall(content))
+        for name in script_names:
+            shared.pop(name, None)
+        
+        # 样式表引用的资源必须同时共享且在每个项目中内容一致，反复检查直到稳定
+        stylesheet_refs = {
+            name: self.get_stylesheet_references(os.path.join(occurrences[(name, content_hash)][0], name))
+            for name, content_hash in shared.items() if name.lower().endswith('.css')
+        }
+        changed = True
+        while changed:
+            changed = False
+            for name, refs in stylesheet_refs.items():
+                if name not in shared:
+                    continue
+                for ref in refs:
+                    consistent = '/' not in ref and ref in shared and all(
+                        dir_assets[html_dir].get(ref, shared[ref]) == shared[ref]
+                        for html_dir in occurrences[(name, shared[name])]
+                    )
+                    if not consistent:
+                        del shared[name]
+                        changed = True
+                        break
+        
+        return shared
+    
+    def run(self) -> Dict[str, int]:
+        """
+        执行去重
+        
+        返回：
+        - dict: 统计信息（shared_files、removed_files、saved_bytes、changed_files）
+        """
+        stats = {'shared_files': 0, 'removed_files': 0, 'saved_bytes': 0, 'changed_files': 0}
+        
+        html_dirs = self.find_html_dirs()
+        dir_assets = {html_dir: self.scan_assets(html_dir) for html_dir in html_dirs}
+        shared = self.plan(dir_assets)
+        
+        # 删除上次运行遗留的共享资源：只有所有项目都有自己的副本时才确定不再被引用
+        self.shared_dir.mkdir(parents=True, exist_ok=True)
+        for stale_file in self.shared_dir.iterdir():
+            if stale_file.is_file() and stale_file.name not in shared and all(
+                stale_file.name in assets for assets in dir_assets.values()
+            ):
+                stale_file.unlink()
+        
+        moved = {}
+        for html_dir, assets in dir_assets.items():
+            moved[html_dir] = sorted(
+                name for name, content_hash in assets.items() if shared.get(name) == content_hash
+            )
+            for name in moved[html_dir]:
+                shared_file = self.shared_dir / name
+                if not shared_file.exists() or HashUtils.get_file_hash(shared_file) != shared[name]:
+                    shutil.copy2(os.path.join(html_dir, name), shared_file)
+        stats['shared_files'] = len(shared)
+        
+        if not any(moved.values()):
+            return stats
+        
+        # 改写引用后再删除项目内的副本
+        tasks = [(html_dir, str(self.shared_dir), names) for html_dir, names in moved.items() if names]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            stats['changed_files'] = sum(executor.map(rewrite_shared_asset_references, tasks))
+        
+        for html_dir, names in moved.items():
+            for name in names:
+                file_path = os.path.join(html_dir, name)
+                stats['saved_bytes'] += os.path.getsize(file_path)
+                os.remove(file_path)
+                stats['removed_files'] += 1
+        
+        # 节省的字节数扣除共享目录中保留的一份
+        moved_names = set().union(*moved.values())
+        stats['saved_bytes'] -= sum((self.shared_dir / name).stat().st_size for name in moved_names)
+        
+        return stats
+
+
+class DoxygenOutputCache:
+    """
+    Doxygen输出缓存
+    
+    多个芯片的资料包中常有相同的子项目（如Common_Platform下的公共驱动和中间件），
+    批量构建时每个芯片都运行一次doxygen代价很高。本类按以下内容计算子项目的指纹，
+    指纹相同时直接复制上次生成的输出：
+    - Doxyfile内容（输入、输出目录和引用的文件路径替换为占位符）
+    - INPUT目录相对STRIP_FROM_PATH的路径，以及目录下所有文件的相对路径和内容哈希
+    - 页眉、页脚、样式表等Doxyfile引用的文件内容
+    - doxygen.exe的大小和修改时间
+    
+    缓存保存的是doxygen的原始输出（静态资源去重之前），位于共享缓存目录的doxygen子目录下。
+    """
+    
+    def __init__(self, cache_dir: Path, doxygen_exe: str):
+        """初始化缓存目录"""
+        self.cache_dir = Path(cache_dir)
+        self.doxygen_exe = doxygen_exe
+    
+    @staticmethod
+    def hash_file(hash_obj, file_path: str):
+        """把文件内容追加到哈希对象"""
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hash_obj.update(chunk)
+    
+    def get_fingerprint(self, doxyfile_path: str) -> str:
+        """
+        计算子项目的指纹
+        
+        返回：
+        - str: 指纹，INPUT目录不存在等无法计算时返回None
+        """
+        hash_obj = hashlib.md5(f"v{DOXYGEN_CACHE_VERSION}\n".encode('utf-8'))
+        exe_stat = os.stat(self.doxygen_exe)
+        hash_obj.update(f"doxygen:{exe_stat.st_size}:{exe_stat.st_mtime_ns}\n".encode('utf-8'))
+        
+        # 路径配置：键 -> 路径列表（值可以包含多个路径，并可用行尾的"\"续行）
+        config = {}
+        continued_key = None
+        with open(doxyfile_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if continued_key:
+                    key, value = continued_key, line.strip()
+                else:
+                    match = DOXYFILE_OPTION_PATTERN.match(line)
+                    if not match or match.group(1) not in DOXYFILE_PATH_KEYS:
+                        hash_obj.update(line.encode('utf-8'))
+                        continue
+                    key, value = match.group(1), match.group(2).strip()
+                    hash_obj.update(f"{key} = {{{key}}}\n".encode('utf-8'))
+                
+                continued_key = key if value.endswith('\\') else None
+                paths = config.setdefault(key, [])
+                for quoted, plain in DOXYFILE_VALUE_PATTERN.findall(value.rstrip('\\')):
+                    paths.append(quoted or plain)
+        
+        # Doxyfile引用的页眉、页脚、样式表等文件（每个键可以引用多个文件）
+        for key in DOXYFILE_FILE_KEYS:
+            for file_path in config.get(key, []):
+                if os.path.isfile(file_path):
+                    hash_obj.update(f"{key}:{os.path.basename(file_path)}\n".encode('utf-8'))
+                    self.hash_file(hash_obj, file_path)
+        
+        # 输入目录：页面中显示的文件路径相对于STRIP_FROM_PATH
+        input_dir = next(iter(config.get('INPUT', [])), None)
+        if not input_dir or not os.path.isdir(input_dir):
+            return None
+        strip_from_path = next(iter(config.get('STRIP_FROM_PATH', [])), None) or input_dir
+        relative_input = os.path.relpath(input_dir, strip_from_path).replace(os.sep, '/')
+        hash_obj.update(f"INPUT:{relative_input}\n".encode('utf-8'))
+        
+        for root, dirs, files in os.walk(input_dir):
+            dirs.sort()
+            for file_name in sorted(files):
+                file_path = os.path.join(root, file_name)
+                relative_file = os.path.relpath(file_path, input_dir).replace(os.sep, '/')
+                hash_obj.update(f"{relative_file}\n".encode('utf-8'))
+                self.hash_file(hash_obj, file_path)
+        
+        return hash_obj.hexdigest()
+    
+    def restore(self, fingerprint: str, output_dir: str) -> bool:
+        """缓存命中时把缓存的输出复制到输出目录，返回是否命中"""
+        entry_dir = self.cache_dir / fingerprint
+        if not entry_dir.is_dir():
+            return False
+        FileUtils.copy_tree(entry_dir, output_dir, mirror=True)
+        return True
+    
+    def store(self, fingerprint: str, output_dir: str) -> bool:
+        """把doxygen的输出保存到缓存（其它进程已保存相同指纹时直接返回）"""
+        entry_dir = self.cache_dir / fingerprint
+        if entry_dir.is_dir():
+            return True
+        
+        # 先复制到临时目录再重命名，避免其它构建读到不完整的输出
+        temp_dir = self.cache_dir / f"{fingerprint}.{os.getpid()}.tmp"
+        try:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            FileUtils.copy_tree(output_dir, temp_dir)
+            os.rename(temp_dir, entry_dir)
+            return True
+        except OSError as e:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if entry_dir.is_dir():
+                return True
+            Logger.warning(f"保存Doxygen输出缓存失败: {e}")
+            return False
+
+
 class DoxygenGenerator(BaseGenerator):
     """
     Doxygen文档生成器类
@@ -82,11 +452,15 @@ class DoxygenGenerator(BaseGenerator):
         """初始化Doxygen生成器"""
         super().__init__(input_folder, output_folder, chip_config)
         
-        # 设置最大并发数
-        self.max_workers = 6
+        # 设置最大并发数（多个芯片同时构建时受CHM_MAX_WORKERS限制）
+        self.max_workers = WorkerBudget.get_max_workers()
         
         # 构建doxygen/sub目录路径
         self.doxygen_sub_path = self.output_folder / "doxygen" / "sub"
+        
+        # Doxygen输出缓存：默认只在多个芯片共享缓存目录时启用（见batch_build.py），可通过Doxygen_Cache配置
+        self.output_cache_enabled = bool(chip_config.get('Doxygen_Cache', bool(os.environ.get(CacheUtils.SHARED_CACHE_ENV))))
+        self.output_cache_dir = CacheUtils.get_shared_cache_dir(self.output_folder) / DOXYGEN_CACHE_DIR_NAME
     
     def get_doxygen_executable_path(self) -> str:
         """
@@ -96,12 +470,8 @@ class DoxygenGenerator(BaseGenerator):
         - str: doxygen.exe的绝对路径，如果未找到则返回None
         """
         try:
-            # 获取当前脚本所在目录
-            current_dir = Path(__file__).parent
-            
-            # 构建doxygen.exe路径：当前脚本目录 -> .. -> .. -> tools -> doxygen -> doxygen.exe
-            doxygen_exe = current_dir / ".." / ".." / "tools" / "doxygen" / "doxygen.exe"
-            doxygen_exe = doxygen_exe.resolve()
+            # 构建doxygen.exe路径：项目根目录 -> tools -> doxygen -> doxygen.exe
+            doxygen_exe = PathUtils.get_tool_path("doxygen", "doxygen.exe")
             
             # 检查文件是否存在
             if doxygen_exe.exists():
@@ -308,48 +678,71 @@ class DoxygenGenerator(BaseGenerator):
             # 执行doxygen命令，使用项目中的doxygen.exe
             start_time = time.time()
             
-            # 使用subprocess.Popen来更好地控制进程
-            process = subprocess.Popen(
-                [doxygen_exe, doxyfile_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                encoding='utf-8',
-                errors='replace'
-            )
+            # 输出缓存命中时直接复制相同子项目上次生成的输出，不再运行doxygen
+            output_cache = None
+            fingerprint = None
+            if self.output_cache_enabled:
+                output_cache = DoxygenOutputCache(self.output_cache_dir, doxygen_exe)
+                output_dir = self.parse_doxyfile_output_directory(doxyfile_path)
+                with Tracer.span(dir_name, "doxygen_cache", path=str(directory_info['path'])):
+                    fingerprint = output_cache.get_fingerprint(doxyfile_path) if output_dir else None
+                    if fingerprint and output_cache.restore(fingerprint, output_dir):
+                        return {
+                            'name': dir_name,
+                            'path': directory_info['path'],
+                            'success': True,
+                            'cached': True,
+                            'duration': time.time() - start_time
+                        }
             
-            # 等待进程完成，设置超时
-            try:
-                stdout, stderr = process.communicate(timeout=3000)  # 50分钟超时
-                returncode = process.returncode
-                end_time = time.time()
-                
-                # 创建result对象，保持兼容性
-                result = type('Result', (), {
-                    'returncode': returncode,
-                    'stdout': stdout,
-                    'stderr': stderr
-                })()
+            # 记录到构建时间线（在进程池的工作进程中执行）
+            with Tracer.span(dir_name, "doxygen", path=str(directory_info['path'])):
+                # 使用subprocess.Popen来更好地控制进程
+                process = subprocess.Popen(
+                    [doxygen_exe, doxyfile_path],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
                 
-            except subprocess.TimeoutExpired:
-                # 超时，强制终止进程
-                process.kill()
-                process.communicate()
-                Logger.error(f"[{dir_name}] Doxygen执行超时（50分钟），已强制终止进程")
-                return {
-                    'name': dir_name,
-                    'path': directory_info['path'],
-                    'success': False,
-                    'error': '执行超时（50分钟）',
-                    'duration': 3000
-                }
+                # 等待进程完成，设置超时
+                try:
+                    stdout, stderr = process.communicate(timeout=3000)  # 50分钟超时
+                    returncode = process.returncode
+                    end_time = time.time()
+                    
+                    # 创建result对象，保持兼容性
+                    result = type('Result', (), {
+                        'returncode': returncode,
+                        'stdout': stdout,
+                        'stderr': stderr
+                    })()
+                    
+                except subprocess.TimeoutExpired:
+                    # 超时，强制终止进程
+                    process.kill()
+                    process.communicate()
+                    Logger.error(f"[{dir_name}] Doxygen执行超时（50分钟），已强制终止进程")
+                    return {
+                        'name': dir_name,
+                        'path': directory_info['path'],
+                        'success': False,
+                        'error': '执行超时（50分钟）',
+                        'duration': 3000
+                    }
             
             # 检查doxygen进程是否正常结束
             duration = end_time - start_time
             if result.returncode == 0:
-                # Doxygen执行成功，不进行任何文件检查
+                # Doxygen执行成功，HHC标签平衡的输出保存到缓存（不平衡的输出会在验证后重试）
+                if fingerprint:
+                    hhc_file_path = os.path.join(output_dir, "html", "index.hhc")
+                    if not os.path.exists(hhc_file_path) or self.check_hhc_ul_balance(hhc_file_path):
+                        output_cache.store(fingerprint, output_dir)
                 return {
                     'name': dir_name,
                     'path': directory_info['path'],
@@ -397,6 +790,7 @@ class DoxygenGenerator(BaseGenerator):
         total_count = len(doxyfile_dirs)
         
         # 使用ProcessPoolExecutor进行并行处理
+        Progress.begin("doxygen", total_count)
         with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
             # 提交所有任务
             future_to_dir = {
@@ -411,7 +805,7 @@ class DoxygenGenerator(BaseGenerator):
                     result = future.result()
                     results.append(result)
                     completed_count += 1
-                    
+                    Progress.advance("doxygen", item=result['name'])
                     
                     if not result['success'] and 'error' in result:
                         Logger.error(f"[{result['name']}] 执行失败: {result['error']}")
@@ -427,6 +821,8 @@ class DoxygenGenerator(BaseGenerator):
                         'duration': 0
                     })
                     completed_count += 1
+                    Progress.advance("doxygen", item=dir_info['name'])
+        Progress.end("doxygen")
         
         return results
     
@@ -603,6 +999,7 @@ class DoxygenGenerator(BaseGenerator):
                 retry_stats[retry_round]['failed'] += 1
         
         # 添加重试统计信息
+        summary['cached_count'] = sum(1 for r in results if r.get('cached'))
         summary['retry_count'] = retry_count
         summary['hhc_balanced_count'] = hhc_balanced_count
         summary['hhc_validation_passed'] = hhc_balanced_count == len(results)
@@ -613,6 +1010,24 @@ class DoxygenGenerator(BaseGenerator):
         
         return summary
     
+    def deduplicate_assets(self):
+        """跨项目去重静态资源，失败时保留各项目自己的副本"""
+        try:
+            stats = DoxygenAssetDeduplicator(self.output_folder / "output" / "sub", self.max_workers).run()
+            if stats['removed_files']:
+                Logger.info(
+                    f"静态资源去重: 共享 {stats['shared_files']} 个文件，删除 {stats['removed_files']} 个副本，"
+                    f"改写 {stats['changed_files']} 个文件，节省 {stats['saved_bytes']} 字节"
+                )
+        except Exception as e:
+            Logger.warning(f"静态资源去重失败: {e}")
+    
+    def register_build_files(self):
+        """登记output/sub下的所有构建产物"""
+        file_registry = BuildFileRegistry(self.output_folder, "docs_gen_doxygen")
+        file_registry.add_tree(self.output_folder / "output" / "sub")
+        file_registry.save()
+    
     def run(self) -> bool:
         """运行Doxygen文档生成"""
         try:
@@ -640,6 +1055,8 @@ class DoxygenGenerator(BaseGenerator):
             
             if not hhc_files:
                 Logger.warning("未找到任何HHC文件，跳过标签平衡验证")
+                self.deduplicate_assets()
+                self.register_build_files()
                 # 生成执行报告
                 summary = self.generate_execution_report(results)
                 return summary['failed_count'] == 0
@@ -657,6 +1074,10 @@ class DoxygenGenerator(BaseGenerator):
             else:
                 all_results = results
             
+            # 跨项目去重静态资源并登记构建产物
+            self.deduplicate_assets()
+            self.register_build_files()
+            
             # 生成最终执行报告
             summary = self.generate_execution_report(all_results)
             
@@ -19,6 +19,7 @@ docs_gen_examples.py - Examples生成脚本
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # 添加当前目录到Python路径
@@ -26,7 +27,62 @@ current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from common_utils import BaseGenerator, DirectoryScanner, FileUtils, JsonUtils, Logger, ArgumentParser, timing_decorator
+from common_utils import BaseGenerator, FileUtils, JsonUtils, Logger, ArgumentParser, TextProcessor, WorkerBudget, timing_decorator
+
+
+# readme解析缓存文件（位于output_folder/json下）
+README_CACHE_FILE = "examples_readme_cache.json"
+README_CACHE_VERSION = 1
+
+# 待解析的readme数量达到该值时才启用进程池
+PARALLEL_PARSE_THRESHOLD = 64
+
+# 描述提取规则
+CHINESE_DESCRIPTION_PATTERN = re.compile(r'1、\s*功能说明\s*\n(.*?)(?=\n\s*2、\s*使用环境|\Z)', re.DOTALL)
+ENGLISH_DESCRIPTION_PATTERN = re.compile(
+    r'1\.\s*Function description\s*\n\s*(.*?)(?=\n\s*2\.\s*Development environment|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def extract_brief_description(readme_path):
+    """
+    从readme.txt文件中提取Brief Description_CN和Brief Description_EN（模块级函数，供进程池调用）
+    Brief Description_CN: 1、功能说明 到 2、使用环境之间的内容
+    Brief Description_EN: 1. Function description 到 2. Development environment之间的内容
+    """
+    try:
+        # 使用FileUtils智能读取文件
+        content = FileUtils.read_file_with_encoding(readme_path)
+        
+        if not content:
+            return {
+                "Brief Description_CN": "",
+                "Brief Description_EN": ""
+            }
+        
+        # 提取中文描述，并使用TextProcessor清理描述文本
+        chinese_description = ""
+        chinese_match = CHINESE_DESCRIPTION_PATTERN.search(content)
+        if chinese_match:
+            chinese_description = TextProcessor.clean_text(chinese_match.group(1).strip())
+        
+        # 提取英文描述，并使用TextProcessor清理描述文本
+        english_description = ""
+        english_match = ENGLISH_DESCRIPTION_PATTERN.search(content)
+        if english_match:
+            english_description = TextProcessor.clean_text(english_match.group(1).strip())
+        
+        return {
+            "Brief Description_CN": chinese_description,
+            "Brief Description_EN": english_description
+        }
+        
+    except Exception as e:
+        return {
+            "Brief Description_CN": "",
+            "Brief Description_EN": ""
+        }
 
 
 class ExamplesGenerator(BaseGenerator):
@@ -54,6 +110,9 @@ class ExamplesGenerator(BaseGenerator):
         - chip_config: 芯片配置（可选，为了兼容BaseGenerator）
         """
         super().__init__(input_folder, output_folder, chip_config or {})
+        
+        # 设置readme解析的最大并发数
+        self.max_workers = WorkerBudget.get_max_workers()
     
     def extract_brief_description(self, readme_path):
         """
@@ -62,126 +121,149 @@ class ExamplesGenerator(BaseGenerator):
         Brief Description_CN: 1、功能说明 到 2、使用环境之间的内容
         Brief Description_EN: 1. Function description 到 2. Development environment之间的内容
         """
-        try:
-            # 使用FileUtils智能读取文件
-            content = FileUtils.read_file_with_encoding(readme_path)
-            
-            if not content:
-                return {
-                    "Brief Description_CN": "",
-                    "Brief Description_EN": ""
-                }
-            
-            # 提取中文描述：1、功能说明 到 2、使用环境之间的内容
-            chinese_pattern = r'1、\s*功能说明\s*\n(.*?)(?=\n\s*2、\s*使用环境|\Z)'
-            chinese_match = re.search(chinese_pattern, content, re.DOTALL)
-            
-            chinese_description = ""
-            if chinese_match:
-                chinese_description = chinese_match.group(1).strip()
-                # 使用TextProcessor清理描述文本
-                from common_utils import TextProcessor
-                chinese_description = TextProcessor.clean_text(chinese_description)
-            
-            # 提取英文描述：1. Function description 到 2. Development environment之间的内容
-            english_pattern = r'1\.\s*Function description\s*\n\s*(.*?)(?=\n\s*2\.\s*Development environment|\Z)'
-            english_match = re.search(english_pattern, content, re.DOTALL | re.IGNORECASE)
-            
-            english_description = ""
-            if english_match:
-                english_description = english_match.group(1).strip()
-                # 使用TextProcessor清理描述文本
-                from common_utils import TextProcessor
-                english_description = TextProcessor.clean_text(english_description)
-            
-            return {
-                "Brief Description_CN": chinese_description,
-                "Brief Description_EN": english_description
-            }
-            
-        except Exception as e:
-            return {
-                "Brief Description_CN": "",
-                "Brief Description_EN": ""
-            }
+        return extract_brief_description(readme_path)
     
-    def has_code_files(self, directory):
+    def scan_input_folder(self):
         """
-        检查目录是否包含.c或.h文件
+        使用os.scandir单次遍历input_folder
+        
+        同时记录：
+        - readme.txt的位置（与rglob相同的先序遍历顺序）
+        - 每个目录下"包含.c/.h文件的子目录"列表（按不区分大小写的名称排序），用于生成level字符串
+        
+        返回：
+        - tuple: (readme路径列表, {目录路径: 排序后的代码子目录名列表})
         """
-        try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith(('.c', '.h')):
-                        return True
-            return False
-        except (OSError, PermissionError):
-            return False
+        readme_files = []
+        code_children = {}
+        readme_name = os.path.normcase('readme.txt')
+        
+        def walk(directory):
+            """递归遍历目录，返回该目录树中是否包含.c或.h文件"""
+            has_code = False
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry)
+                            elif os.path.normcase(entry.name) == readme_name:
+                                readme_files.append(Path(entry.path))
+                            elif entry.name.endswith(('.c', '.h')):
+                                has_code = True
+                        except OSError:
+                            continue
+            except (OSError, PermissionError):
+                return False
+            
+            code_dirs = []
+            for subdir in subdirs:
+                if walk(subdir.path):
+                    code_dirs.append(subdir.name)
+            
+            # 使用Windows默认排序（不区分大小写）
+            code_dirs.sort(key=str.lower)
+            code_children[directory] = code_dirs
+            
+            return has_code or bool(code_dirs)
+        
+        walk(str(self.input_folder))
+        return readme_files, code_children
     
-    def generate_level_string(self, input_folder, readme_dir):
+    def generate_level_string(self, input_parts, code_children):
         """
         生成level字符串，格式为row_x_x_x_x_
-        根据实际文件路径的层级结构生成，第二层级默认为0
+        根据实际文件路径的层级结构生成，前两个层级默认为0
         过滤逻辑：只计算包含.h或.c文件的文件夹，与Doxygen生成逻辑保持一致
-        """
-        # 获取从input_folder开始的相对路径
-        input_rel_path = os.path.relpath(readme_dir, input_folder)
-        path_parts = input_rel_path.split(os.sep)
         
+        参数：
+        - input_parts: readme.txt所在目录相对input_folder的路径段
+        - code_children: scan_input_folder返回的代码子目录映射
+        """
         level_parts = []
         
-        # 从input_folder的子目录开始计算索引
-        current_path = input_folder
-        for i, part in enumerate(path_parts):
-            # 获取父目录
-            parent_dir = current_path
-            
+        current_path = str(self.input_folder)
+        for i, part in enumerate(input_parts):
             # 前两个层级默认为0
             if i < 2:
                 level_parts.append("0")
             else:
-                # 从第三个层级开始，计算当前目录在同级中的索引
-                try:
-                    # 获取所有同级目录
-                    all_siblings = [d for d in os.listdir(parent_dir) if os.path.isdir(os.path.join(parent_dir, d))]
-                    
-                    # 过滤：只保留包含.h或.c文件的文件夹
-                    filtered_siblings = []
-                    for sibling in all_siblings:
-                        sibling_path = os.path.join(parent_dir, sibling)
-                        if self.has_code_files(sibling_path):
-                            filtered_siblings.append(sibling)
-                    
-                    # 使用Windows默认排序（按名称排序）
-                    filtered_siblings.sort(key=str.lower)  # 不区分大小写的排序
-                    
-                    # 计算当前目录在过滤后的同级目录中的索引
-                    if part in filtered_siblings:
-                        current_index = filtered_siblings.index(part)
-                        level_parts.append(str(current_index))
-                    else:
-                        # 如果当前目录不在过滤后的列表中，说明它不包含代码文件
-                        # 这种情况下，我们需要检查当前目录本身是否包含代码文件
-                        current_dir_path = os.path.join(parent_dir, part)
-                        if self.has_code_files(current_dir_path):
-                            # 如果包含代码文件，但在过滤列表中没有找到，说明排序有问题
-                            # 这种情况下，我们将其添加到过滤列表中并重新排序
-                            filtered_siblings.append(part)
-                            filtered_siblings.sort(key=str.lower)
-                            current_index = filtered_siblings.index(part)
-                            level_parts.append(str(current_index))
-                        else:
-                            # 如果不包含代码文件，设为0
-                            level_parts.append("0")
-                        
-                except (ValueError, OSError):
-                    # 如果出错，设为0
-                    level_parts.append("0")
+                # 计算当前目录在包含代码文件的同级目录中的索引，不包含代码文件时设为0
+                siblings = code_children.get(current_path, [])
+                level_parts.append(str(siblings.index(part)) if part in siblings else "0")
             
             current_path = os.path.join(current_path, part)
         
         return "row_" + "_".join(level_parts) + "_"
     
+    def load_readme_cache(self):
+        """加载readme解析缓存（按readme路径、大小和修改时间命中）"""
+        cache_file = self.output_folder / "json" / README_CACHE_FILE
+        try:
+            if cache_file.exists():
+                data = JsonUtils.load_json(cache_file)
+                if data.get("version") == README_CACHE_VERSION:
+                    return data.get("entries", {})
+        except Exception as e:
+            Logger.warning(f"readme缓存无效，将重新解析: {e}")
+        return {}
+    
+    def save_readme_cache(self, entries):
+        """保存readme解析缓存"""
+        cache_file = self.output_folder / "json" / README_CACHE_FILE
+        JsonUtils.save_json({"version": README_CACHE_VERSION, "entries": entries}, cache_file, indent=None)
+    
+    def parse_readme_files(self, readme_files):
+        """
+        解析所有readme.txt的描述信息
+        
+        未变化的readme（路径、大小、修改时间一致）直接使用缓存结果，
+        其余的分发到进程池中并行解析
+        
+        参数：
+        - readme_files: readme路径列表
+        
+        返回：
+        - dict: readme路径字符串 -> Brief Description字典
+        """
+        cache = self.load_readme_cache()
+        new_cache = {}
+        descriptions = {}
+        pending = []
+        
+        for readme_path in readme_files:
+            key = str(readme_path)
+            try:
+                stat = readme_path.stat()
+            except OSError:
+                continue
+            
+            signature = [stat.st_size, stat.st_mtime_ns]
+            cached = cache.get(key)
+            if cached and cached.get("signature") == signature:
+                descriptions[key] = cached["description"]
+                new_cache[key] = cached
+            else:
+                pending.append((key, signature))
+        
+        if pending:
+            paths = [key for key, _ in pending]
+            if len(paths) < PARALLEL_PARSE_THRESHOLD or self.max_workers <= 1:
+                results = [extract_brief_description(path) for path in paths]
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    chunksize = max(1, len(paths) // (self.max_workers * 4))
+                    results = list(executor.map(extract_brief_description, paths, chunksize=chunksize))
+            
+            for (key, signature), description in zip(pending, results):
+                descriptions[key] = description
+                new_cache[key] = {"signature": signature, "description": description}
+        
+        Logger.info(f"readme解析: 共 {len(readme_files)} 个，缓存命中 {len(readme_files) - len(pending)} 个")
+        self.save_readme_cache(new_cache)
+        return descriptions
+    
     def find_examples_in_input_folder(self):
         """
         在input_folder目录下递归查找所有的readme.txt文件
@@ -191,49 +273,46 @@ class ExamplesGenerator(BaseGenerator):
         if not self.input_folder.exists():
             return examples_data
         
-        # 使用DirectoryScanner查找readme.txt文件
-        readme_files = DirectoryScanner.find_files_by_name(self.input_folder, ['readme.txt'], recursive=True)
+        # 单次遍历：readme位置和代码目录信息一起收集
+        readme_files, code_children = self.scan_input_folder()
         
+        # 只有至少两层目录的readme才需要解析
+        candidates = []
         for readme_path in readme_files:
-            # 获取readme.txt文件所在目录的路径
-            readme_dir = readme_path.parent
+            input_parts = readme_path.parent.relative_to(self.input_folder).parts
+            if len(input_parts) >= 2:
+                candidates.append((readme_path, input_parts))
+        
+        descriptions = self.parse_readme_files([readme_path for readme_path, _ in candidates])
+        
+        for readme_path, input_parts in candidates:
+            brief_description = descriptions.get(str(readme_path))
+            if not brief_description:
+                continue
             
-            # 确定IP Module和Name
-            # 从input_folder目录开始计算相对路径
-            input_rel_path = readme_dir.relative_to(self.input_folder)
-            input_parts = input_rel_path.parts
+            # 只要有中文描述或英文描述就添加到数据列表
+            cn_desc = brief_description["Brief Description_CN"]
+            en_desc = brief_description["Brief Description_EN"]
             
-            if len(input_parts) >= 2:
-                # Name是最后一层
+            if cn_desc or en_desc:  # 改为"或"的关系
+                # Name是最后一层，IP Module是Name的上一层（倒数第二层）
                 name = input_parts[-1]
-                # IP Module是Name的上一层（倒数第二层）
-                ip_module = input_parts[-2] if len(input_parts) >= 2 else input_parts[0]
+                ip_module = input_parts[-2]
                 
                 # 生成level字符串
-                level = self.generate_level_string(self.input_folder, str(readme_dir))
-                
-                # 提取Brief Description
-                brief_description = self.extract_brief_description(readme_path)
-                
-                # 处理Path字段，只取input_folder后面的部分
-                # 从完整路径中提取相对路径部分
-                relative_path = readme_path.relative_to(self.input_folder)
-                # 转换为正斜杠格式
-                final_path = str(relative_path).replace('\\', '/')
+                level = self.generate_level_string(input_parts, code_children)
                 
-                # 只要有中文描述或英文描述就添加到数据列表
-                cn_desc = brief_description["Brief Description_CN"]
-                en_desc = brief_description["Brief Description_EN"]
+                # 处理Path字段，只取input_folder后面的部分，转换为正斜杠格式
+                final_path = str(readme_path.relative_to(self.input_folder)).replace('\\', '/')
                 
-                if cn_desc or en_desc:  # 改为"或"的关系
-                    examples_data.append({
-                        "IP Module": ip_module,
-                        "Name": name,
-                        "Path": final_path,
-                        "Level": level,
-                        "Brief Description_CN": cn_desc,
-                        "Brief Description_EN": en_desc
-                    })
+                examples_data.append({
+                    "IP Module": ip_module,
+                    "Name": name,
+                    "Path": final_path,
+                    "Level": level,
+                    "Brief Description_CN": cn_desc,
+                    "Brief Description_EN": en_desc
+                })
         
         return examples_data
     
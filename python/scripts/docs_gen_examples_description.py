@@ -14,8 +14,10 @@ docs_gen_examples_description.py - Examples描述信息添加脚本
 import os
 import sys
 import re
+import html
+import bisect
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from bs4 import BeautifulSoup
 
 # 添加当前目录到Python路径（必须在导入common_utils之前）
 current_dir = Path(__file__).parent
@@ -30,6 +32,9 @@ from common_utils import (
     FileUtils,
     JsonUtils,
     HashUtils,
+    ExamplesIndex,
+    Progress,
+    WorkerBudget,
     timing_decorator
 )
 
@@ -49,6 +54,8 @@ class ExamplesDescriptionAdder(BaseGenerator):
         """初始化Examples描述信息添加器"""
         super().__init__("", output_folder, chip_config)  # input_folder 在此脚本中不使用
         
+        # 设置最大并发数
+        self.max_workers = WorkerBudget.get_max_workers()
     
     def load_examples_data(self) -> list:
         """加载examples.json数据"""
@@ -70,12 +77,13 @@ class ExamplesDescriptionAdder(BaseGenerator):
             Logger.error(f"详细错误信息: {traceback.format_exc()}")
             return []
     
-    def extract_path_from_files_html(self, files_html_path):
+    def extract_path_from_files_html(self, files_html_path, examples_index):
         """
         从files.html的路径中提取关键路径信息
         
         参数：
         - files_html_path: files.html的完整路径
+        - examples_index: ExamplesIndex实例，用于hash路径反向查找
         
         返回：
         - str: 提取的关键路径，用于过滤examples.json
@@ -97,9 +105,6 @@ class ExamplesDescriptionAdder(BaseGenerator):
             if match:
                 key_path = match.group(1)
                 
-                # 检查是否是hash路径，如果是则反向查找原始路径
-                hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-                
                 # 统一路径分隔符为正斜杠，因为映射表使用正斜杠
                 normalized_key_path = key_path.replace('\\', '/')
                 
@@ -108,12 +113,8 @@ class ExamplesDescriptionAdder(BaseGenerator):
                 hash_part = path_parts[-1] if path_parts else normalized_key_path
                 
                 
-                # 查找原始路径
-                original_path = None
-                for mapping in hash_mapping:
-                    if mapping.get("hash_path") == hash_part:
-                        original_path = mapping.get("original_path")
-                        break
+                # 检查是否是hash路径，如果是则反向查找原始路径
+                original_path = examples_index.resolve_hash(hash_part)
                 
                 # 如果找到原始路径，使用原始路径；否则使用hash路径
                 if original_path:
@@ -176,153 +177,6 @@ class ExamplesDescriptionAdder(BaseGenerator):
         
         return True
     
-    def filter_examples_by_path(self, examples_data, target_path):
-        """
-        根据目标路径过滤examples.json数据
-        
-        参数：
-        - examples_data: examples.json中的所有数据
-        - target_path: 目标路径（用于过滤）
-        
-        返回：
-        - list: 过滤后的数据
-        """
-        if not target_path:
-            return examples_data
-        
-        filtered_data = []
-        
-        # 统一路径分隔符，将反斜杠转换为正斜杠
-        normalized_target_path = target_path.replace('\\', '/')
-        
-        for i, item in enumerate(examples_data):
-            item_path = item.get('Path', '')
-            normalized_item_path = item_path.replace('\\', '/')
-            
-            # 多种匹配策略
-            is_match = False
-            match_reason = ""
-            
-            # 1. 精确前缀匹配
-            if normalized_item_path.startswith(normalized_target_path + '/'):
-                is_match = True
-                match_reason = "前缀匹配"
-            # 2. 完全匹配
-            elif normalized_item_path == normalized_target_path:
-                is_match = True
-                match_reason = "完全匹配"
-            # 3. 检查是否包含hash路径的最后一部分
-            else:
-                target_parts = normalized_target_path.split('/')
-                if len(target_parts) >= 2:
-                    target_hash = target_parts[-1]  # 获取hash部分
-                    item_parts = normalized_item_path.split('/')
-                    if len(item_parts) >= 2:
-                        item_hash = item_parts[-1]  # 获取item的hash部分
-                        # 如果hash部分相同，且前面的目录结构匹配
-                        if target_hash == item_hash:
-                            # 检查前面的目录结构是否匹配
-                            target_dir = '/'.join(target_parts[:-1])
-                            item_dir = '/'.join(item_parts[:-1])
-                            if target_dir == item_dir:
-                                is_match = True
-                                match_reason = "Hash匹配"
-            
-            if is_match:
-                filtered_data.append(item)
-        
-        return filtered_data
-    
-    def filter_examples_by_hash_mapping(self, examples_data, target_path):
-        """
-        使用hash路径映射进行反向查找过滤
-        
-        参数：
-        - examples_data: examples.json中的所有数据
-        - target_path: 目标路径（包含hash）
-        
-        返回：
-        - list: 过滤后的数据
-        """
-        
-        # 获取hash路径映射
-        hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-        
-        # 提取hash部分
-        normalized_target_path = target_path.replace('\\', '/')
-        target_parts = normalized_target_path.split('/')
-        if len(target_parts) < 2:
-            return []
-        
-        target_hash = target_parts[-1]
-        target_dir = '/'.join(target_parts[:-1])
-        
-        # 查找对应的原始路径
-        original_path = None
-        for mapping in hash_mapping:
-            if mapping.get("hash_path") == target_hash:
-                original_path = mapping.get("original_path")
-                break
-        
-        if not original_path:
-            return []
-        
-        # 直接使用原始路径，不需要添加目录前缀
-        
-        # 使用原始路径进行过滤
-        return self.filter_examples_by_path(examples_data, original_path)
-    
-    def filter_examples_by_direct_matching(self, examples_data, target_path):
-        """
-        直接匹配examples.json中的路径格式
-        
-        参数：
-        - examples_data: examples.json中的所有数据
-        - target_path: 目标路径
-        
-        返回：
-        - list: 过滤后的数据
-        """
-        
-        # 获取hash路径映射
-        hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-        
-        # 提取hash部分
-        normalized_target_path = target_path.replace('\\', '/')
-        target_parts = normalized_target_path.split('/')
-        if len(target_parts) < 2:
-            return []
-        
-        target_hash = target_parts[-1]
-        target_dir = '/'.join(target_parts[:-1])
-        
-        # 查找对应的原始路径
-        original_path = None
-        for mapping in hash_mapping:
-            if mapping.get("hash_path") == target_hash:
-                original_path = mapping.get("original_path")
-                break
-        
-        if not original_path:
-            return []
-        
-        # 构建完整的路径，匹配examples.json中的格式
-        full_path = f"{target_dir}/{original_path}"
-        
-        filtered_data = []
-        
-        for i, item in enumerate(examples_data):
-            item_path = item.get('Path', '')
-            normalized_item_path = item_path.replace('\\', '/')
-            
-            # 检查是否以完整路径开头
-            if normalized_item_path.startswith(full_path + '/'):
-                filtered_data.append(item)
-            elif normalized_item_path == full_path:
-                filtered_data.append(item)
-        
-        return filtered_data
-    
     def find_files_html_files(self):
         """在output目录下查找所有files.html文件"""
         files_html_list = []
@@ -348,135 +202,135 @@ class ExamplesDescriptionAdder(BaseGenerator):
         
         return files_html_list
     
-    def process_html_file(self, html_file_path, examples_data):
-        """处理单个HTML文件，添加描述信息"""
-        
-        # 提取关键路径信息
-        key_path = self.extract_path_from_files_html(html_file_path)
+    @staticmethod
+    def text_to_content_items(text):
+        """将换行符分隔的描述文本转换为content-item片段"""
+        if not text:
+            return ""
+        # 将\n转换为多个content-item div
+        html_items = []
+        for p in text.split('\n'):
+            p = p.strip()
+            if p:  # 只添加非空段落
+                html_items.append('<div class="content-item"><span class="item-text">{}</span></div>'.format(html.escape(p, quote=False)))
+        return "".join(html_items)
+    
+    def build_description_html(self, item):
+        """
+        生成单个example的描述HTML片段
         
-        # 如果路径提取失败，直接返回，不处理任何数据
-        if key_path is None:
-            Logger.error("无法提取关键路径，跳过此文件")
-            return False
+        参数：
+        - item: examples.json中的数据项
         
+        返回：
+        - str: 描述HTML片段
+        """
+        # 获取中文和英文描述
+        cn_desc = item.get('Brief Description_CN', '')
+        en_desc = item.get('Brief Description_EN', '')
+        
+        # 生成HTML格式的描述
+        html_desc = '<div class="content-wrapper">'
+        
+        # 中文部分
+        if cn_desc:
+            html_desc += '<div class="chinese-section">'
+            html_desc += '<div class="section-title chinese-title"><strong>中文说明</strong></div>'
+            html_desc += '<div class="content-area chinese-content">'
+            html_desc += self.text_to_content_items(cn_desc)
+            html_desc += '</div>'
+            html_desc += '</div>'
         
-        # 读取HTML文件
-        try:
-            html_content = FileUtils.read_file_with_encoding(html_file_path)
-        except Exception as e:
-            Logger.error(f"无法读取HTML文件: {e}")
-            return False
+        # 分隔符（只有当中文和英文都存在时才添加）
+        if cn_desc and en_desc:
+            html_desc += '<div class="separator"></div>'
         
-        # 使用BeautifulSoup解析HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # 英文部分
+        if en_desc:
+            html_desc += '<div class="english-section">'
+            html_desc += '<div class="section-title english-title"><strong>English Description</strong></div>'
+            html_desc += '<div class="content-area english-content">'
+            html_desc += self.text_to_content_items(en_desc)
+            html_desc += '</div>'
+            html_desc += '</div>'
         
-        # 清空所有td.desc元素的内容
-        desc_elements = soup.find_all('td', class_='desc')
-        cleared_count = 0
+        html_desc += '</div>'
+        return html_desc
+    
+    def build_description_fragments(self, html_file_path, examples_index):
+        """
+        为单个files.html生成 行id -> 描述HTML片段 的映射
         
-        for desc_elem in desc_elements:
-            desc_elem.clear()
-            cleared_count += 1
+        参数：
+        - html_file_path: files.html路径
+        - examples_index: ExamplesIndex实例
         
+        返回：
+        - dict: 行id到描述片段的映射；无法提取关键路径时返回None
+        """
+        # 提取关键路径信息
+        key_path = self.extract_path_from_files_html(html_file_path, examples_index)
         
-        # 根据路径过滤examples数据
-        filtered_examples = self.filter_examples_by_path(examples_data, key_path)
+        # 如果路径提取失败，直接返回，不处理任何数据
+        if key_path is None:
+            return None
         
-        # 如果第一次过滤没有结果，尝试使用hash路径映射进行反向查找
-        if not filtered_examples:
-            filtered_examples = self.filter_examples_by_hash_mapping(examples_data, key_path)
+        # 根据路径查找examples数据（前缀匹配 -> hash反查 -> 目录/原始路径匹配）
+        fragments = {}
+        for item in examples_index.lookup(key_path):
+            level = item.get('Level', '')
+            if level:
+                fragments[level] = self.build_description_html(item)
         
-        # 如果还是没有结果，尝试直接匹配examples.json中的路径格式
-        if not filtered_examples:
-            filtered_examples = self.filter_examples_by_direct_matching(examples_data, key_path)
+        return fragments
+    
+    def process_html_files_parallel(self, files_html_list, examples_index):
+        """
+        并行处理files.html文件
         
-        if not filtered_examples:
-            # 即使没有匹配数据，也要保存清空后的文件
-            try:
-                FileUtils.write_file(html_file_path, str(soup))
-                return True
-            except Exception as e:
-                Logger.error(f"保存清空后的文件失败: {e}")
-                return False
+        关键路径解析和描述片段生成在主进程中完成（依赖索引），
+        HTML读写和拼接在进程池中完成
         
-        modified_count = 0
+        参数：
+        - files_html_list: files.html路径列表
+        - examples_index: ExamplesIndex实例
         
-        # 遍历过滤后的examples数据
-        for i, item in enumerate(filtered_examples, 1):
-            level = item.get('Level', '')
-            if not level:
-                continue
-            
-            
-            # 在HTML中查找对应的元素 - 精确匹配id
-            target_element = soup.find(id=level)
-            
-            if not target_element:
-                continue
-            
-            # 找到该元素的.desc子元素
-            desc_element = target_element.find(class_='desc')
-            if not desc_element:
+        返回：
+        - dict: 各状态（updated/unchanged/failed）的文件数量
+        """
+        stats = {'updated': 0, 'unchanged': 0, 'failed': 0}
+        
+        tasks = []
+        for html_file in files_html_list:
+            fragments = self.build_description_fragments(html_file, examples_index)
+            if fragments is None:
+                Logger.error(f"无法提取关键路径，跳过此文件: {html_file}")
+                stats['failed'] += 1
                 continue
-            
-            # 获取中文和英文描述
-            cn_desc = item.get('Brief Description_CN', '')
-            en_desc = item.get('Brief Description_EN', '')
-            
-            
-            # 将换行符转换为HTML内容项
-            def text_to_content_items(text):
-                if not text:
-                    return ""
-                # 将\n转换为多个content-item div
-                paragraphs = text.split('\n')
-                html_items = []
-                for p in paragraphs:
-                    p = p.strip()
-                    if p:  # 只添加非空段落
-                        html_items.append('<div class="content-item"><span class="item-text">{}</span></div>'.format(p))
-                return "".join(html_items)
-            
-            # 生成HTML格式的描述
-            html_desc = '<div class="content-wrapper">'
-            
-            # 中文部分
-            if cn_desc:
-                html_desc += '<div class="chinese-section">'
-                html_desc += '<div class="section-title chinese-title"><strong>中文说明</strong></div>'
-                html_desc += '<div class="content-area chinese-content">'
-                html_desc += text_to_content_items(cn_desc)
-                html_desc += '</div>'
-                html_desc += '</div>'
-            
-            # 分隔符（只有当中文和英文都存在时才添加）
-            if cn_desc and en_desc:
-                html_desc += '<div class="separator"></div>'
-            
-            # 英文部分
-            if en_desc:
-                html_desc += '<div class="english-section">'
-                html_desc += '<div class="section-title english-title"><strong>English Description</strong></div>'
-                html_desc += '<div class="content-area english-content">'
-                html_desc += text_to_content_items(en_desc)
-                html_desc += '</div>'
-                html_desc += '</div>'
-            
-            html_desc += '</div>'
-            
-            # 更新描述内容为HTML格式
-            desc_element.string = ""
-            desc_element.append(BeautifulSoup(html_desc, 'html.parser'))
-            modified_count += 1
-        
-        
-        # 直接在原文件中保存修改
-        try:
-            FileUtils.write_file(html_file_path, str(soup))
-            return True
-        except Exception as e:
-            Logger.error(f"更新files.html失败: {e}")
-            return False
+            tasks.append((html_file, fragments))
+        
+        if len(tasks) <= 1 or self.max_workers <= 1:
+            # 文件数量少时不启动进程池
+            for html_file, fragments in tasks:
+                stats[rewrite_files_html(html_file, fragments)] += 1
+            return stats
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_file = {
+                executor.submit(rewrite_files_html, html_file, fragments): html_file
+                for html_file, fragments in tasks
+            }
+            
+            for future in Progress.track("files_html", as_completed(future_to_file), total=len(future_to_file),
+                                         item=lambda future: Path(future_to_file[future]).parent.parent.name):
+                html_file = future_to_file[future]
+                try:
+                    stats[future.result()] += 1
+                except Exception as e:
+                    Logger.error(f"文件处理失败: {html_file}: {e}")
+                    stats['failed'] += 1
+        
+        return stats
     
     def generate(self) -> bool:
         """
@@ -498,6 +352,9 @@ class ExamplesDescriptionAdder(BaseGenerator):
             if not examples_data:
                 return False
             
+            # 构建examples索引（所有files.html共用）
+            examples_index = ExamplesIndex(examples_data, HashUtils.load_path_mapping(self.output_folder))
+            
             
             
             # 查找output目录下的所有files.html文件
@@ -507,17 +364,9 @@ class ExamplesDescriptionAdder(BaseGenerator):
                 return False
             
             
-            # 处理每个HTML文件
-            success_count = 0
-            failed_count = 0
-            
-            for i, html_file in enumerate(files_html_list, 1):
-                
-                if self.process_html_file(html_file, examples_data):
-                    success_count += 1
-                else:
-                    failed_count += 1
-                    Logger.error(f"文件处理失败: {html_file}")
+            # 并行处理所有HTML文件（内容未变化的文件不会重写）
+            stats = self.process_html_files_parallel(files_html_list, examples_index)
+            Logger.info(f"files.html处理完成: 更新 {stats['updated']} 个，未变化 {stats['unchanged']} 个，失败 {stats['failed']} 个")
             
             return True
             
@@ -528,6 +377,78 @@ class ExamplesDescriptionAdder(BaseGenerator):
             return False
 
 
+# files.html中的行起始标签（Doxygen为每一行生成 <tr id="row_x_x_" ...>）
+ROW_OPEN_PATTERN = re.compile(r'<tr\b[^>]*?\bid\s*=\s*["\']([^"\']+)["\'][^>]*>', re.IGNORECASE)
+ROW_CLOSE_PATTERN = re.compile(r'</tr\s*>', re.IGNORECASE)
+# 描述单元格：分组1为起始标签，分组2为内容，分组3为结束标签
+DESC_CELL_PATTERN = re.compile(
+    r'(<td\b[^>]*?\bclass\s*=\s*["\'](?:[^"\']*\s)?desc(?:\s[^"\']*)?["\'][^>]*>)(.*?)(</td\s*>)',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def rewrite_files_html(html_file_path, fragments):
+    """
+    流式改写files.html的描述单元格（模块级函数，供进程池调用）
+    
+    只扫描一遍文档：建立 行id -> 描述单元格 的索引，清空所有td.desc，
+    再将描述片段拼接到对应行的第一个td.desc中。其余内容按原样保留。
+    
+    参数：
+    - html_file_path: files.html路径
+    - fragments: 行id到描述HTML片段的映射
+    
+    返回：
+    - str: 'updated'、'unchanged' 或 'failed'
+    """
+    try:
+        html_content = FileUtils.read_file_with_encoding(html_file_path)
+    except Exception as e:
+        Logger.error(f"无法读取HTML文件: {e}")
+        return 'failed'
+    
+    desc_cells = list(DESC_CELL_PATTERN.finditer(html_content))
+    
+    # 行id -> 该行内第一个描述单元格的下标
+    cell_fragments = {}
+    if fragments:
+        cell_starts = [cell.start() for cell in desc_cells]
+        for row in ROW_OPEN_PATTERN.finditer(html_content):
+            fragment = fragments.get(row.group(1))
+            if fragment is None:
+                continue
+            
+            cell_index = bisect.bisect_left(cell_starts, row.end())
+            if cell_index >= len(desc_cells):
+                continue
+            
+            row_close = ROW_CLOSE_PATTERN.search(html_content, row.end())
+            if row_close and row_close.start() < cell_starts[cell_index]:
+                continue
+            
+            cell_fragments[cell_index] = fragment
+    
+    # 拼接输出：清空所有描述单元格，并填入对应的描述片段
+    parts = []
+    last_end = 0
+    for cell_index, cell in enumerate(desc_cells):
+        parts.append(html_content[last_end:cell.start(2)])
+        parts.append(cell_fragments.get(cell_index, ''))
+        last_end = cell.end(2)
+    parts.append(html_content[last_end:])
+    new_content = ''.join(parts)
+    
+    # 内容未变化时跳过写入
+    if new_content == html_content:
+        return 'unchanged'
+    
+    if not FileUtils.write_file(html_file_path, new_content):
+        Logger.error(f"更新files.html失败: {html_file_path}")
+        return 'failed'
+    
+    return 'updated'
+
+
 @timing_decorator
 def main():
     """主函数"""
@@ -11,14 +11,25 @@ docs_gen_examples_overview.py - Examples概览生成脚本
 4. 相同IP Module的行合并显示，使用斑马纹样式
 5. 生成HTML文件，文件名为Path的第二部分
 6. 支持CHM文件中的本地路径链接
+7. 样式和脚本输出为共享文件，表格数据输出为每个分组的<分组名>.data.js，在浏览器中分批渲染
 """
 
+import os
 import re
 import sys
-import winreg
+import json
+import html
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
+# 注册表只在Windows下可用，其他系统（如基准测试环境）不读取注册表中的基路径
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 # 添加当前目录到Python路径（必须在导入common_utils之前）
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
@@ -32,10 +43,37 @@ from common_utils import (
     FileUtils,
     JsonUtils,
     HashUtils,
+    ExamplesIndex,
+    TemplateProcessor,
+    BuildFileRegistry,
+    WorkerBudget,
     timing_decorator
 )
 
 
+# 模板目录及其中的共享资源（样式、脚本），所有分组页面共用一份
+OVERVIEW_TEMPLATE_DIR = "examples_overview"
+OVERVIEW_ASSETS = ("examples_overview.css", "examples_overview.js")
+OVERVIEW_PAGE_TEMPLATE = f"{OVERVIEW_TEMPLATE_DIR}/examples_overview.html.template"
+
+# 文件名中的非法字符
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+
+@lru_cache(maxsize=None)
+def ip_module_color(ip_module):
+    """根据IP Module名称生成颜色（结果缓存，同名模块只计算一次）"""
+    # 使用模块名称的哈希值生成不同的颜色
+    hash_value = int(HashUtils.generate_8char_hash(ip_module), 16)
+    
+    # 生成柔和的颜色（避免太亮或太暗）
+    r = (hash_value & 0xFF) % 128 + 128  # 128-255
+    g = ((hash_value >> 8) & 0xFF) % 128 + 128  # 128-255
+    b = ((hash_value >> 16) & 0xFF) % 128 + 128  # 128-255
+    
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 class ExamplesOverviewGenerator(BaseGenerator):
     """
     Examples概览生成器类
@@ -51,9 +89,15 @@ class ExamplesOverviewGenerator(BaseGenerator):
         """初始化Examples概览生成器"""
         super().__init__("", output_folder, chip_config)  # input_folder 在此脚本中不使用
         
-        # 斑马纹颜色（参考截图样式）
-        self.row_colors = ['#ffffff', '#f0f8ff']  # 白色和浅蓝色
+        # examples索引（在generate中构建，与docs_gen_examples_description共用同一结构）
+        self.examples_index = ExamplesIndex([])
+        
+        # 分组渲染的最大并发数
+        self.max_workers = WorkerBudget.get_max_workers()
         
+        # 预编译的页面模板（只加载一次）和链接缓存
+        self.page_template = None
+        self.link_cache = {}
     
     def get_filename_replace_rules(self):
         """获取文件名替换规则（用于HTML文件名）"""
@@ -72,6 +116,10 @@ class ExamplesOverviewGenerator(BaseGenerator):
             result = result.replace(old_char, new_char)
         return result
     
+    def get_safe_filename(self, group_name):
+        """生成分组对应的合法文件名（非法字符替换为_，并应用文件名替换规则）"""
+        return self.apply_filename_replace_rules(INVALID_FILENAME_CHARS.sub('_', group_name))
+    
     def load_examples_data(self) -> List[Dict[str, any]]:
         """
         从{output_folder}/json/examples.json加载examples数据
@@ -105,6 +153,9 @@ class ExamplesOverviewGenerator(BaseGenerator):
         返回：
         - str: 注册表中的基路径，如果不存在返回None
         """
+        if winreg is None:
+            return None
+        
         try:
             # 注册表路径：HKEY_CURRENT_USER\SOFTWARE\ChmConfig\
             reg_path = r"SOFTWARE\ChmConfig"
@@ -137,32 +188,7 @@ class ExamplesOverviewGenerator(BaseGenerator):
         返回：
         - str: 颜色值
         """
-        # 使用模块名称的哈希值生成不同的颜色
-        hash_value = int(HashUtils.generate_8char_hash(ip_module), 16)
-        
-        # 生成柔和的颜色（避免太亮或太暗）
-        r = (hash_value & 0xFF) % 128 + 128  # 128-255
-        g = ((hash_value >> 8) & 0xFF) % 128 + 128  # 128-255
-        b = ((hash_value >> 16) & 0xFF) % 128 + 128  # 128-255
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def extract_path_second_part(self, full_path):
-        """
-        从完整路径中提取第二部分作为文件名
-        
-        参数：
-        - full_path: 完整路径，如 "6-Software_Development_Kit/Nations.N32H47x_48x_Library.1.1.0/..."
-        
-        返回：
-        - str: 第二部分，如 "Nations.N32H47x_48x_Library.1.1.0"
-        """
-        # 统一路径分隔符，支持Windows和Unix路径
-        normalized_path = full_path.replace('\\', '/')
-        path_parts = normalized_path.split('/')
-        if len(path_parts) >= 2:
-            return path_parts[1]
-        return "examples_overview"
+        return ip_module_color(ip_module)
     
     def clean_path_for_display(self, full_path):
         """
@@ -182,832 +208,187 @@ class ExamplesOverviewGenerator(BaseGenerator):
         return normalized_path
     
     
-    def generate_html_table(self, examples_data, registry_base_path=None, project_name=None):
+    def get_files_html_link(self, item, anchor_level):
         """
-        生成HTML表格
+        生成指向子模块files.html对应行的链接
         
         参数：
-        - examples_data: examples.json中的数据
-        - registry_base_path: 注册表中的芯片文档基路径
-        - project_name: 项目名称，用于注册表查询
+        - item: 数据项（包含Path信息）
+        - anchor_level: 锚点（files.html中的行id）
         
         返回：
-        - str: 生成的HTML内容
+        - str: 链接路径，无法生成时返回空字符串
         """
-        # 生成IP Module导航链接
-        ip_module_links = self.generate_ip_module_links(examples_data)
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Examples Overview</title>
-    <style>
-        body {{
-            margin: 0;
-        }}
-        .container {{
-            background-color: white;
-            border: 2px solid #e2e8f0;
-            overflow: hidden;
-        }}
-        .header {{
-            background-color: #667eea;
-            color: white;
-            padding: 20px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 28px;
-            font-weight: bold;
-        }}
-        .ip-module-nav {{
-            padding: 20px;
-            background-color: #f8f9fa;
-            border-bottom: 1px solid #e2e8f0;
-        }}
-        .ip-module-nav h3 {{
-            margin: 0 0 15px 0;
-            color: #2d3748;
-            font-size: 18px;
-        }}
-        .ip-module-links {{
-            display: block;
-            margin: 0;
-            padding: 0;
-        }}
-        .ip-module-link {{
-            color: #3182ce;
-            text-decoration: none;
-            border-bottom: 1px dotted #3182ce;
-            padding: 5px 10px;
-            background-color: white;
-            border: 1px solid #e2e8f0;
-            font-size: 14px;
-            display: inline-block;
-            margin: 4px;
-        }}
-        .ip-module-link:hover {{
-            color: #2c5aa0;
-            border-bottom: 1px solid #2c5aa0;
-            background-color: #f7fafc;
-        }}
-        .table-container {{
-            overflow: hidden;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 14px;
-            border: 1px solid #e2e8f0;
-        }}
-        th {{
-            background-color: #4a5568;
-            color: white;
-            padding: 12px 8px;
-            text-align: left;
-            font-weight: bold;
-            border: 1px solid #2d3748;
-        }}
-        th:first-child {{
-            border-left: 1px solid #2d3748;
-        }}
-        th:last-child {{
-            border-right: 1px solid #2d3748;
-        }}
-        td {{
-            padding: 10px 8px;
-            border: 1px solid #e2e8f0;
-            vertical-align: middle;
-        }}
-        tr:hover {{
-            background-color: #f7fafc !important;
-        }}
-        .ip-module {{
-            font-weight: bold;
-            color: #2d3748;
-            padding: 6px 12px;
-            display: inline-block;
-            min-width: 80px;
-            text-align: center;
-            border: 1px solid #e2e8f0;
-            background-color: #f8f9fa;
-        }}
-        .ip-module-cell-link {{
-            color: #3182ce;
-            text-decoration: none;
-            border-bottom: 1px dotted #3182ce;
-            padding: 6px 12px;
-            display: inline-block;
-            min-width: 80px;
-            text-align: center;
-            border: 1px solid #e2e8f0;
-            background-color: #f8f9fa;
-            font-weight: bold;
-            transition: all 0.2s ease;
-        }}
-        .ip-module-cell-link:hover {{
-            color: #2c5aa0;
-            border-bottom: 1px solid #2c5aa0;
-            background-color: #f7fafc;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .example-name {{
-            font-weight: bold;
-            color: #2b6cb0;
-        }}
-        .example-name-link {{
-            color: #2b6cb0;
-            text-decoration: none;
-            border-bottom: 1px dotted #2b6cb0;
-        }}
-        .example-name-link:hover {{
-            color: #2c5aa0;
-            border-bottom: 1px solid #2c5aa0;
-        }}
-        .description-cn {{
-            color: #2d3748;
-            margin-bottom: 8px;
-            line-height: 1.4;
-        }}
-        .description-en {{
-            color: #4a5568;
-            margin-bottom: 8px;
-            line-height: 1.4;
-            font-style: italic;
-        }}
-        .path {{
-            color: #718096;
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-            word-break: break-all;
-        }}
-        .path a {{
-            color: #3182ce;
-            text-decoration: none;
-            border-bottom: 1px dotted #3182ce;
-        }}
-        .path a:hover {{
-            color: #2c5aa0;
-            border-bottom: 1px solid #2c5aa0;
-        }}
-        .path-link {{
-            color: #28a745 !important;
-            text-decoration: none;
-            border-bottom: 1px dotted #28a745;
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }}
-
-        .tip-dialog-overlay {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background-color: #000;
-            background-color: rgba(0, 0, 0, 0.5);
-            z-index: 1000;
-            /* IE8兼容 */
-            zoom: 1;
-        }}
-        .tip-dialog {{
-            background: white;
-            border: 2px solid #ccc;
-            max-width: 500px;
-            width: 90%;
-            /* IE8兼容 */
-            zoom: 1;
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            margin-left: -250px;
-            margin-top: -150px;
-        }}
-        .tip-dialog-header {{
-            padding: 20px 20px 0 20px;
-            border-bottom: 1px solid #e2e8f0;
-            /* IE8兼容 */
-            zoom: 1;
-        }}
-        .tip-dialog-header h3 {{
-            margin: 0;
-            color: #2d3748;
-            font-size: 18px;
-            float: left;
-        }}
-        .tip-language-toggle {{
-            background: #3182ce;
-            color: white;
-            border: none;
-            padding: 5px 10px;
-            cursor: pointer;
-            font-size: 12px;
-            float: right;
-            /* IE8兼容 */
-            zoom: 1;
-        }}
-        .tip-language-toggle:hover {{
-            background: #2c5aa0;
-        }}
-        .tip-dialog-content {{
-            padding: 20px;
-            clear: both;
-        }}
-        .tip-dialog-content p {{
-            margin: 0 0 15px 0;
-            color: #4a5568;
-            line-height: 1.5;
-        }}
-        .tip-dialog-footer {{
-            padding: 0 20px 20px 20px;
-            text-align: right;
-            /* IE8兼容 */
-            zoom: 1;
-        }}
-        .tip-btn {{
-            padding: 10px 20px;
-            border: none;
-            cursor: pointer;
-            font-size: 14px;
-            margin-left: 10px;
-            /* IE8兼容 */
-            zoom: 1;
-        }}
-        .tip-btn-primary {{
-            background: #3182ce;
-            color: white;
-        }}
-        .tip-btn-primary:hover {{
-            background: #2c5aa0;
-        }}
-        .tip-btn-secondary {{
-            background: #718096;
-            color: white;
-        }}
-        .tip-btn-secondary:hover {{
-            background: #4a5568;
-        }}
-        .col-ip-module {{
-            width: 12%;
-        }}
-        .col-name {{
-            width: 15%;
-        }}
-        .col-description-cn {{
-            width: 25%;
-        }}
-        .col-description-en {{
-            width: 25%;
-        }}
-        .col-path {{
-            width: 23%;
-        }}
-    </style>
-    
-    <script>
-    // 项目名称（从Python传入）
-    var currentProjectName = "{project_name}";
-    
-    // 双语提示配置
-    var tipConfig = {{
-        cn: {{
-            title: "配置提示",
-            message: "请在Config页面中配置芯片文档基路径以查看此文件",
-            configBtn: "打开配置",
-            cancelBtn: "取消"
-        }},
-        en: {{
-            title: "Configuration Tip",
-            message: "Please configure the chip document base path in Config page to view this file",
-            configBtn: "Open Config",
-            cancelBtn: "Cancel"
-        }}
-    }};
-
-    // 当前语言（默认中文）
-    var currentTipLanguage = "cn";
-
-    // 切换提示语言
-    function switchTipLanguage() {{
-        currentTipLanguage = currentTipLanguage === "cn" ? "en" : "cn";
-        updateTipLanguage();
-    }}
-
-    // 更新提示语言
-    function updateTipLanguage() {{
-        var lang = tipConfig[currentTipLanguage];
-        var titleElement = document.getElementById("tipTitle");
-        var messageElement = document.getElementById("tipMessage");
-        var configBtnElement = document.getElementById("tipConfigBtn");
-        var cancelBtnElement = document.getElementById("tipCancelBtn");
-        var languageToggleElement = document.getElementById("tipLanguageToggle");
-        
-        if (titleElement) {{
-            if (titleElement.textContent !== undefined) {{
-                titleElement.textContent = lang.title;
-            }} else if (titleElement.innerText !== undefined) {{
-                // IE8兼容
-                titleElement.innerText = lang.title;
-            }}
-        }}
+        path = item.get('Path', '')
         
-        if (messageElement) {{
-            if (messageElement.textContent !== undefined) {{
-                messageElement.textContent = lang.message;
-            }} else if (messageElement.innerText !== undefined) {{
-                // IE8兼容
-                messageElement.innerText = lang.message;
-            }}
-        }}
+        # 处理Path：分割获取第一部分和第二部分
+        path_parts = path.split('/')
+        if not anchor_level or len(path_parts) < 2:
+            return ""
         
-        if (configBtnElement) {{
-            if (configBtnElement.textContent !== undefined) {{
-                configBtnElement.textContent = lang.configBtn;
-            }} else if (configBtnElement.innerText !== undefined) {{
-                // IE8兼容
-                configBtnElement.innerText = lang.configBtn;
-            }}
-        }}
+        path_part1 = path_parts[0]  # 6-Software_Development_Kit
+        path_part2 = path_parts[1]  # Nations.N32G4FR_Library.2.4.0
         
-        if (cancelBtnElement) {{
-            if (cancelBtnElement.textContent !== undefined) {{
-                cancelBtnElement.textContent = lang.cancelBtn;
-            }} else if (cancelBtnElement.innerText !== undefined) {{
-                // IE8兼容
-                cancelBtnElement.innerText = lang.cancelBtn;
-            }}
-        }}
+        cache_key = (path_part1, path_part2, anchor_level)
+        link_path = self.link_cache.get(cache_key)
+        if link_path is None:
+            # 通过path_mapping.json索引获取hash值，找不到时使用原始值
+            hash_path = self.examples_index.get_hash_path(f"{path_part1}/{path_part2}")
+            final_path2 = hash_path or path_part2  # hash值，如299332ec
+            
+            # 生成链接：../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}
+            link_path = f"../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}"
+            self.link_cache[cache_key] = link_path
         
-        if (languageToggleElement) {{
-            var toggleText = (currentTipLanguage === "cn" ? "EN" : "中文");
-            if (languageToggleElement.textContent !== undefined) {{
-                languageToggleElement.textContent = toggleText;
-            }} else if (languageToggleElement.innerText !== undefined) {{
-                // IE8兼容
-                languageToggleElement.innerText = toggleText;
-            }}
-        }}
-    }}
-
-    // 显示配置提示
-    function showConfigTip(filePath) {{
-        // 首先尝试从注册表读取基路径
-        var basePath = getRegistryBasePath();
-        if (basePath) {{
-            // 有注册表配置，直接打开文件
-            var fullPath = basePath + '/' + filePath;
-            var fileUrl = 'file:///' + fullPath.replace(/\\\\/g, '/');
-            try {{
-                if (window.open) {{
-                    window.open(fileUrl, '_blank');
-                }} else {{
-                    window.location.href = fileUrl;
-                }}
-            }} catch (e) {{
-                // 如果打开失败，显示弹窗
-                showConfigDialog(filePath);
-            }}
-        }} else {{
-            // 没有注册表配置，显示配置提示弹窗
-            showConfigDialog(filePath);
-        }}
-    }}
+        return link_path
     
-    // 显示配置提示弹窗
-    function showConfigDialog(filePath) {{
-        var lang = tipConfig[currentTipLanguage];
-        
-        // 创建提示对话框
-        var tipDialog = document.createElement('div');
-        tipDialog.className = 'tip-dialog-overlay';
-        tipDialog.innerHTML = 
-            '<div class="tip-dialog">' +
-                '<div class="tip-dialog-header">' +
-                    '<h3 id="tipTitle">' + lang.title + '</h3>' +
-                    '<button id="tipLanguageToggle" class="tip-language-toggle">' +
-                        (currentTipLanguage === "cn" ? "EN" : "中文") +
-                    '</button>' +
-                '</div>' +
-                '<div class="tip-dialog-content">' +
-                    '<p id="tipMessage">' + lang.message + '</p>' +
-                '</div>' +
-                '<div class="tip-dialog-footer">' +
-                    '<button id="tipConfigBtn" class="tip-btn tip-btn-primary">' +
-                        lang.configBtn +
-                    '</button>' +
-                    '<button id="tipCancelBtn" class="tip-btn tip-btn-secondary">' +
-                        lang.cancelBtn +
-                    '</button>' +
-                '</div>' +
-            '</div>';
-        
-        document.body.appendChild(tipDialog);
+    def generate_ip_module_cell_link(self, ip_module, item):
+        """
+        为IP Module单元格和导航生成链接地址
         
-        // 绑定事件 - 使用IE8兼容的方式
-        var configBtn = document.getElementById("tipConfigBtn");
-        var cancelBtn = document.getElementById("tipCancelBtn");
-        var languageToggle = document.getElementById("tipLanguageToggle");
+        参数：
+        - ip_module: IP Module名称
+        - item: 当前数据项（包含Level和Path信息）
         
-        if (configBtn) {{
-            if (configBtn.attachEvent) {{
-                // IE8兼容
-                configBtn.attachEvent('onclick', openConfig);
-            }} else if (configBtn.addEventListener) {{
-                // 现代浏览器
-                configBtn.addEventListener('click', openConfig);
-            }} else {{
-                // 降级方案
-                configBtn.onclick = openConfig;
-            }}
-        }}
+        返回：
+        - str: 链接路径，无法生成时返回空字符串（页面中显示为普通span）
+        """
+        level = item.get('Level', '')
+        if not level or not item.get('Path', ''):
+            return ""
         
-        if (cancelBtn) {{
-            if (cancelBtn.attachEvent) {{
-                // IE8兼容
-                cancelBtn.attachEvent('onclick', closeTipDialog);
-            }} else if (cancelBtn.addEventListener) {{
-                // 现代浏览器
-                cancelBtn.addEventListener('click', closeTipDialog);
-            }} else {{
-                // 降级方案
-                cancelBtn.onclick = closeTipDialog;
-            }}
-        }}
+        # 处理Level：去除最后2项
+        level_parts = level.split('_')
+        if len(level_parts) >= 2:
+            anchor_level = '_'.join(level_parts[:-2]) + '_'
+        else:
+            anchor_level = level
         
-        if (languageToggle) {{
-            if (languageToggle.attachEvent) {{
-                // IE8兼容
-                languageToggle.attachEvent('onclick', function() {{
-                    switchTipLanguage();
-                }});
-            }} else if (languageToggle.addEventListener) {{
-                // 现代浏览器
-                languageToggle.addEventListener('click', function() {{
-                    switchTipLanguage();
-                }});
-            }} else {{
-                // 降级方案
-                languageToggle.onclick = function() {{
-                    switchTipLanguage();
-                }};
-            }}
-        }}
-    }}
+        return self.get_files_html_link(item, anchor_level)
     
-    // 从注册表读取基路径 - 使用与Config.html相同的方法
-    function getRegistryBasePath() {{
-        // 使用与Config.html相同的注册表读取方法
-        var ChmStorageManager = {{
-            // 注册表路径
-            regPath: "HKEY_CURRENT_USER\\\\SOFTWARE\\\\ChmConfig\\\\",
-            
-            // 创建WScript.Shell对象来访问注册表
-            createShell: function () {{
-                try {{
-                    var shell = new ActiveXObject("WScript.Shell");
-                    return shell;
-                }} catch (e) {{
-                    return null;
-                }}
-            }},
-            
-            // 从注册表读取PDF路径
-            getPath: function (projectName) {{
-                var shell = this.createShell();
-                if (shell) {{
-                    try {{
-                        var keyName = "pdfBasePath_" + projectName;
-                        var path = shell.RegRead(this.regPath + keyName);
-                        if (path && path !== "") {{
-                            return path;
-                        }}
-                    }} catch (e) {{
-                    }}
-                }} else {{
-                }}
-                return null;
-            }}
-        }};
-        
-        // 使用ChmStorageManager读取注册表
-        var basePath = ChmStorageManager.getPath(currentProjectName);
-        
-        return basePath;
-    }}
-
-    // 打开配置页面
-    function openConfig() {{
-        // 尝试打开Config.html
-        try {{
-            var configUrl = "./Config.html";
-            if (window.open) {{
-                window.open(configUrl, "_self");
-            }} else {{
-                // 如果无法打开新窗口，尝试在当前窗口打开
-                window.location.href = configUrl;
-            }}
-        }} catch (e) {{
-            alert("无法打开配置页面，请手动访问Config.html");
-        }}
-        closeTipDialog();
-    }}
-
-    // 关闭提示对话框
-    function closeTipDialog() {{
-        var tipDialog;
-        if (document.querySelector) {{
-            tipDialog = document.querySelector('.tip-dialog-overlay');
-        }} else {{
-            // IE8兼容
-            var elements = document.getElementsByTagName('div');
-            for (var i = 0; i < elements.length; i++) {{
-                if (elements[i].className && elements[i].className.indexOf('tip-dialog-overlay') !== -1) {{
-                    tipDialog = elements[i];
-                    break;
-                }}
-            }}
-        }}
-        
-        if (tipDialog) {{
-            if (tipDialog.parentNode) {{
-                tipDialog.parentNode.removeChild(tipDialog);
-            }}
-        }}
-    }}
-
-    // 页面加载完成后初始化语言
-    if (document.addEventListener) {{
-        document.addEventListener('DOMContentLoaded', function() {{
-            updateTipLanguage();
-        }});
-    }} else {{
-        // IE8兼容
-        document.attachEvent('onreadystatechange', function() {{
-            if (document.readyState === 'complete') {{
-                updateTipLanguage();
-            }}
-        }});
-        
-        // 额外的IE8兼容性检查
-        if (document.readyState === 'complete') {{
-            updateTipLanguage();
-        }}
-    }}
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Examples Overview</h1>
-        </div>
-        
-        <div class="ip-module-nav">
-            <h3>The package contains the following examples:</h3>
-            <div class="ip-module-links">
-                {ip_module_links}
-            </div>
-        </div>
+    def generate_group_data(self, examples_data, project_name=None):
+        """
+        生成分组数据（紧凑的数组格式，由共享脚本在浏览器中渲染）
         
-        <div class="table-container">
-            <table>
-                <thead>
-                    <tr>
-                        <th class="col-ip-module">IP Module</th>
-                        <th class="col-name">Name</th>
-                        <th class="col-description-cn">Brief Description (CN)</th>
-                        <th class="col-description-en">Brief Description (EN)</th>
-                        <th class="col-path">Path</th>
-                    </tr>
-                </thead>
-                <tbody>
-"""
+        参数：
+        - examples_data: 该分组的examples数据
+        - project_name: 项目名称，用于注册表查询
         
+        返回：
+        - dict: {"project": 项目名称, "modules": [[名称, 颜色, 单元格链接, 导航链接, 行列表], ...]}
+          行格式为 [名称, 名称链接, 中文描述, 英文描述, 路径]
+        """
         # 按IP Module分组数据
         grouped_data = {}
         for item in examples_data:
-            ip_module = item.get('IP Module', 'Unknown')
-            if ip_module not in grouped_data:
-                grouped_data[ip_module] = []
-            grouped_data[ip_module].append(item)
-        
-        # 获取排序后的IP Module列表（与导航链接顺序一致）
-        sorted_ip_modules = sorted(grouped_data.keys())
+            grouped_data.setdefault(item.get('IP Module', 'Unknown'), []).append(item)
         
-        # 生成表格行（实现IP Module列的单元格合并效果）
-        row_index = 0
-        for ip_module in sorted_ip_modules:
+        modules = []
+        for ip_module in sorted(grouped_data.keys()):
             items = grouped_data[ip_module]
-            ip_module_color = self.get_ip_module_color(ip_module)
-            
-            # 斑马纹效果：不同IP Module之间交替颜色
-            row_color = self.row_colors[row_index % len(self.row_colors)]
             
-            for i, item in enumerate(items):
-                name = item.get('Name', '')
-                brief_cn = item.get('Brief Description_CN', '')
-                brief_en = item.get('Brief Description_EN', '')
-                path = item.get('Path', '')
-                clean_path = self.clean_path_for_display(path)
-                
-                # 如果是同一IP Module的第一行，使用rowspan合并单元格
-                if i == 0:
-                    # 为IP Module生成可点击链接
-                    ip_module_link = self.generate_ip_module_cell_link(ip_module, item)
-                    ip_module_cell = f'<td rowspan="{len(items)}" style="background-color: {ip_module_color}; vertical-align: middle; text-align: center;">{ip_module_link}</td>'
-                else:
-                    ip_module_cell = ''  # 后续行不需要IP Module列
-                
-                # 为Name列生成跳转链接
-                level = item.get('Level', '')
-                name_link = name  # 默认显示名称
-                
-                if level and path:
-                    # 1. 处理Path：分割获取第一部分和第二部分
-                    path_parts = path.split('/')
-                    if len(path_parts) >= 2:
-                        path_part1 = path_parts[0]  # 6-Software_Development_Kit
-                        path_part2 = path_parts[1]  # Nations.N32G4FR_Library.2.4.0
-                        
-                        # 2. 通过path_mapping.json获取hash值
-                        hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-                        # 查找原始路径对应的hash路径
-                        original_path = f"{path_part1}/{path_part2}"
-                        hash_path = None
-                        
-                        # 遍历映射找到对应的hash路径
-                        for mapping in hash_mapping:
-                            if mapping.get("original_path") == original_path:
-                                hash_path = mapping.get("hash_path")
-                                break
-                        
-                        # 如果找到hash映射，使用hash值；否则使用原始值
-                        if hash_path:
-                            # hash_path 直接就是8位hash值，不需要分割
-                            final_path2 = hash_path  # 直接使用hash值，如299332ec
-                        else:
-                            final_path2 = path_part2
-                        
-                        # 3. 生成链接：../sub/{path_part1}/{final_path2}/html/files.html#{level}
-                        link_path = f"../sub/{path_part1}/{final_path2}/html/files.html#{level}"
-                        
-                        name_link = f'<a href="{link_path}" class="example-name-link">{name}</a>'
-                
-                # 为Path列生成链接
-                path_link = f'<a href="#" onclick="showConfigTip(\'{clean_path}\'); return false;">{clean_path}</a>'
-                
-                html_content += f"""
-                    <tr style="background-color: {row_color};">
-                        {ip_module_cell}
-                        <td class="example-name">{name_link}</td>
-                        <td class="description-cn">{brief_cn}</td>
-                        <td class="description-en">{brief_en}</td>
-                        <td class="path">/{path_link}</td>
-                    </tr>
-"""
+            rows = []
+            for item in items:
+                rows.append([
+                    item.get('Name', ''),
+                    self.get_files_html_link(item, item.get('Level', '')),
+                    item.get('Brief Description_CN', ''),
+                    item.get('Brief Description_EN', ''),
+                    self.clean_path_for_display(item.get('Path', ''))
+                ])
             
-            # 每处理完一个IP Module，增加行索引
-            row_index += 1
+            modules.append([
+                ip_module,
+                self.get_ip_module_color(ip_module),
+                # 单元格链接使用该模块的第一项，导航链接使用最后一项（与原导航生成逻辑一致）
+                self.generate_ip_module_cell_link(ip_module, items[0]),
+                self.generate_ip_module_cell_link(ip_module, items[-1]),
+                rows
+            ])
+        
+        return {"project": project_name or "", "modules": modules}
+    
+    def generate_data_script(self, examples_data, project_name=None):
+        """
+        生成分组数据脚本 <分组名>.data.js 的内容
         
-        html_content += """
-                </tbody>
-            </table>
-        </div>
-    </div>
-</body>
-</html>
-"""
+        参数：
+        - examples_data: 该分组的examples数据
+        - project_name: 项目名称
         
-        return html_content
+        返回：
+        - str: 数据脚本内容
+        """
+        data = self.generate_group_data(examples_data, project_name)
+        return "ExamplesOverview.render(" + json.dumps(data, ensure_ascii=False, separators=(',', ':')) + ");\n"
     
-    def generate_ip_module_cell_link(self, ip_module, item):
+    def generate_html_table(self, data_file):
         """
-        为表格中的IP Module单元格生成可点击链接
+        生成分组页面HTML（只包含页面骨架，样式、脚本和表格数据均为外部文件）
         
         参数：
-        - ip_module: IP Module名称
-        - item: 当前数据项（包含Level和Path信息）
+        - data_file: 分组数据脚本文件名
         
         返回：
-        - str: 生成的HTML链接内容
+        - str: 生成的HTML内容
         """
-        level = item.get('Level', '')
-        path = item.get('Path', '')
+        return self.get_page_template().replace("{DATA_FILE}", html.escape(data_file))
+    
+    def get_page_template(self):
+        """
+        加载并预编译页面模板：共享资源占位符只替换一次，
+        每个分组只需替换{DATA_FILE}
+        """
+        if self.page_template is None:
+            processor = TemplateProcessor({
+                "{ASSETS_CSS}": OVERVIEW_ASSETS[0],
+                "{ASSETS_JS}": OVERVIEW_ASSETS[1],
+            })
+            template_content = FileUtils.read_file_with_encoding(self.get_template_path(OVERVIEW_PAGE_TEMPLATE))
+            self.page_template = processor.process_template(template_content)
+        return self.page_template
+    
+    def copy_shared_assets(self, output_dir):
+        """
+        复制所有分组页面共用的样式和脚本到output/extra
         
-        if level and path:
-            # 1. 处理Level：去除最后2项
-            level_parts = level.split('_')
-            if len(level_parts) >= 2:
-                anchor_level = '_'.join(level_parts[:-2]) + '_'
-            else:
-                anchor_level = level
-            
-            # 2. 处理Path：分割获取第一部分和第二部分
-            path_parts = path.split('/')
-            if len(path_parts) >= 2:
-                path_part1 = path_parts[0]  # 6-Software_Development_Kit
-                path_part2 = path_parts[1]  # Nations.N32G4FR_Library.2.4.0
-                
-                # 3. 通过path_mapping.json获取hash值
-                hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-                # 查找原始路径对应的hash路径
-                original_path = f"{path_part1}/{path_part2}"
-                hash_path = None
-                
-                # 遍历映射找到对应的hash路径
-                for mapping in hash_mapping:
-                    if mapping.get("original_path") == original_path:
-                        hash_path = mapping.get("hash_path")
-                        break
-                
-                # 如果找到hash映射，使用hash值；否则使用原始值
-                if hash_path:
-                    # hash_path 直接就是8位hash值，不需要分割
-                    final_path2 = hash_path  # 直接使用hash值，如299332ec
-                else:
-                    final_path2 = path_part2
-                
-                # 4. 生成链接：../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}
-                link_path = f"../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}"
-                
-                return f'<a href="{link_path}" class="ip-module-cell-link">{ip_module}</a>'
+        参数：
+        - output_dir: output/extra目录
         
-        # 如果无法生成链接，返回普通的span标签
-        return f'<span class="ip-module">{ip_module}</span>'
-
-    def generate_ip_module_links(self, examples_data):
+        返回：
+        - bool: 是否成功
         """
-        生成IP Module导航链接
+        for asset_name in OVERVIEW_ASSETS:
+            src = self.get_template_path(OVERVIEW_TEMPLATE_DIR) / asset_name
+            content = FileUtils.read_file_with_encoding(src)
+            if not FileUtils.write_file_if_changed(output_dir / asset_name, content):
+                return False
+        return True
+    
+    def render_group(self, output_dir, safe_filename, group_data, project_name):
+        """
+        渲染单个分组的HTML页面和数据脚本，内容未变化的文件不会重写
         
         参数：
-        - examples_data: examples.json中的数据
+        - output_dir: output/extra目录
+        - safe_filename: 分组文件名（不含扩展名）
+        - group_data: 该分组的examples数据
+        - project_name: 项目名称
         
         返回：
-        - str: 生成的HTML链接内容
+        - bool: 是否成功
         """
-        # 收集所有唯一的IP Module
-        unique_ip_modules = set()
-        ip_module_items = {}
+        data_file = f"{safe_filename}.data.js"
         
-        for item in examples_data:
-            ip_module = item.get('IP Module', '')
-            if ip_module:
-                unique_ip_modules.add(ip_module)
-                ip_module_items[ip_module] = item  # 保存第一个找到的item作为代表
-        
-        # 生成链接HTML
-        links_html = ""
-        for ip_module in sorted(unique_ip_modules):
-            item = ip_module_items.get(ip_module, {})
-            level = item.get('Level', '')
-            path = item.get('Path', '')
-            
-            if level and path:
-                # 1. 处理Level：去除最后2项
-                level_parts = level.split('_')
-                if len(level_parts) >= 2:
-                    anchor_level = '_'.join(level_parts[:-2]) + '_'
-                else:
-                    anchor_level = level
-                
-                # 2. 处理Path：分割获取第一部分和第二部分
-                path_parts = path.split('/')
-                if len(path_parts) >= 2:
-                    path_part1 = path_parts[0]  # 6-Software_Development_Kit
-                    path_part2 = path_parts[1]  # Nations.N32G4FR_Library.2.4.0
-                    
-                    # 3. 通过path_mapping.json获取hash值
-                    hash_mapping = HashUtils.load_path_mapping(self.output_folder)
-                    # 查找原始路径对应的hash路径
-                    original_path = f"{path_part1}/{path_part2}"
-                    hash_path = None
-                    
-                    # 遍历映射找到对应的hash路径
-                    for mapping in hash_mapping:
-                        if mapping.get("original_path") == original_path:
-                            hash_path = mapping.get("hash_path")
-                            break
-                    
-                    # 如果找到hash映射，使用hash值；否则使用原始值
-                    if hash_path:
-                        # hash_path 直接就是8位hash值，不需要分割
-                        final_path2 = hash_path  # 直接使用hash值，如299332ec
-                    else:
-                        final_path2 = path_part2
-                    
-                    # 4. 生成链接：../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}
-                    link_path = f"../sub/{path_part1}/{final_path2}/html/files.html#{anchor_level}"
-                    
-                    links_html += f'<a href="{link_path}" class="ip-module-link">{ip_module}</a>'
-                else:
-                    links_html += f'<span class="ip-module-link">{ip_module}</span>'
-            else:
-                links_html += f'<span class="ip-module-link">{ip_module}</span>'
+        html_content = self.generate_html_table(data_file)
+        data_content = self.generate_data_script(group_data, project_name)
         
-        return links_html
+        for output_file, content in ((output_dir / f"{safe_filename}.html", html_content),
+                                     (output_dir / data_file, data_content)):
+            if not FileUtils.write_file_if_changed(output_file, content):
+                Logger.error(f"写入文件失败: {output_file}")
+                return False
+        return True
     
     def generate(self) -> bool:
         """
@@ -1032,41 +413,42 @@ class ExamplesOverviewGenerator(BaseGenerator):
             # 获取项目名称
             project_name = self.project_info['chip_name'] + "_V" + self.project_info['chip_version']
             
-            # 获取注册表中的芯片文档基路径
-            registry_base_path = self.get_registry_pdf_base_path(project_name)
+            # 构建examples索引（hash路径映射只加载一次）
+            self.examples_index = ExamplesIndex(examples_data, HashUtils.load_path_mapping(self.output_folder))
+            
             # 按Path的第二部分分组数据
-            path_groups = {}
-            for item in examples_data:
-                path = item.get('Path', '')
-                path_second = self.extract_path_second_part(path)
-                if path_second not in path_groups:
-                    path_groups[path_second] = []
-                path_groups[path_second].append(item)
+            path_groups = self.examples_index.group_by_segment(1, "examples_overview")
+            
+            
+            # 创建输出目录，并复制共享的样式和脚本
+            output_dir = self.ensure_output_dir("output/extra")
+            if not self.copy_shared_assets(output_dir):
+                Logger.error("复制Examples概览共享资源失败")
+                return False
+            
+            # 预编译页面模板
+            self.get_page_template()
             
+            # 使用线程池并行渲染各分组的HTML页面和数据脚本
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self.render_group, output_dir, self.get_safe_filename(group_name),
+                                    group_data, project_name)
+                    for group_name, group_data in path_groups.items()
+                ]
+                results = [future.result() for future in futures]
             
-            # 为每个分组生成HTML文件
-            for group_name, group_data in path_groups.items():
-                
-                # 生成HTML内容
-                html_content = self.generate_html_table(group_data, registry_base_path, project_name)
-                
-                # 确保文件名合法
-                safe_filename = re.sub(r'[<>:"/\\|?*]', '_', group_name)
-                
-                # 应用文件名替换规则（将&替换为_等）
-                safe_filename = self.apply_filename_replace_rules(safe_filename)
-                
-                # 创建输出目录
-                output_dir = self.ensure_output_dir("output/extra")
-                
-                # 生成HTML文件
-                output_file = output_dir / f"{safe_filename}.html"
-                
-                if not FileUtils.write_file(output_file, html_content):
-                    Logger.error(f"写入HTML文件失败: {output_file}")
-                    return False
+            # 登记构建产物（共享资源、各分组页面和数据脚本）
+            file_registry = BuildFileRegistry(self.output_folder, "docs_gen_examples_overview")
+            for asset_name in OVERVIEW_ASSETS:
+                file_registry.add(output_dir / asset_name)
+            for group_name in path_groups:
+                safe_filename = self.get_safe_filename(group_name)
+                file_registry.add(output_dir / f"{safe_filename}.html")
+                file_registry.add(output_dir / f"{safe_filename}.data.js")
+            file_registry.save()
             
-            return True
+            return all(results)
             
         except Exception as e:
             Logger.error(f"生成Examples概览HTML文件时出错: {e}")
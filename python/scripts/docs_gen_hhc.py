@@ -59,17 +59,12 @@ from common_utils import (
     HashUtils,
     JsonUtils,
     ArgumentParser,
+    CacheUtils,
+    TranslationCache,
     timing_decorator,
     ConfigManager
 )
 
-try:
-    from deep_translator import GoogleTranslator
-    TRANSLATOR_AVAILABLE = True
-except ImportError:
-    TRANSLATOR_AVAILABLE = False
-    Logger.warning("deep_translator未安装，将跳过中文翻译功能")
-
 
 class HHCGenerator(BaseGenerator):
     """
@@ -104,13 +99,26 @@ class HHCGenerator(BaseGenerator):
         self.base_config = self.load_base_config()
         self.technical_terms = self.load_technical_terms()
         
-        # 初始化翻译器
-        if TRANSLATOR_AVAILABLE:
-            self.translator = GoogleTranslator(source='zh-CN', target='en')
-        else:
-            self.translator = None
+        # 翻译器在第一次翻译中文内容时才创建（见translator属性）
+        self._translator = None
+        self._translator_loaded = False
+        
+        # 翻译结果缓存（批量构建时多个芯片共享）
+        self.translation_cache = TranslationCache(CacheUtils.get_shared_cache_dir(self.output_folder))
         
     
+    @property
+    def translator(self):
+        """翻译器（第一次使用时导入deep_translator，没有中文内容时不加载；未安装时为None）"""
+        if not self._translator_loaded:
+            self._translator_loaded = True
+            try:
+                from deep_translator import GoogleTranslator
+                self._translator = GoogleTranslator(source='zh-CN', target='en')
+            except ImportError:
+                Logger.warning("deep_translator未安装，将跳过中文翻译功能")
+        return self._translator
+    
     def load_base_config(self) -> Dict:
         """加载base.json配置"""
         try:
@@ -204,11 +212,16 @@ class HHCGenerator(BaseGenerator):
         - str: 翻译后的英文文本
         """
         try:
-            if not text or not self.is_chinese_text(text) or not self.translator:
+            if not text or not self.is_chinese_text(text):
                 return text
             
-            # 使用deep_translator翻译
-            translated = self.translator.translate(text)
+            # 优先使用翻译缓存，未命中时使用deep_translator翻译
+            translated = self.translation_cache.get(text)
+            if translated is None:
+                if not self.translator:
+                    return text
+                translated = self.translator.translate(text)
+                self.translation_cache.set(text, translated)
             
             # 应用专业术语替换
             result = self.apply_technical_terms(translated)
@@ -788,6 +801,7 @@ class HHCGenerator(BaseGenerator):
             
             # 生成HHC内容
             hhc_content = self.generate_hhc_content(structure, template_contents)
+            self.translation_cache.save()
             
             # 确保输出目录存在
             self.ensure_output_dir()
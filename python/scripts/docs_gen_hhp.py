@@ -2,10 +2,10 @@
 # -*- coding: utf-8 -*-
 """
 docs_gen_hhp.py - HHP文件生成脚本
-功能：在output_folder/output目录下扫描所有文件，生成index.hhp文件
+功能：根据构建产物登记表（json/build_files）生成index.hhp文件，登记表不存在时扫描output_folder/output目录
 
 主要功能：
-1. 在output_folder/output目录下查找main、pdf、sub、extra子目录
+1. 读取各脚本登记的产物（某个区域的登记不完整时扫描该区域）；没有登记表时在output_folder/output目录下查找main、pdf、sub、extra子目录
 2. 收集所有HTML、JS、CSS、PNG、SVG等文件
 3. 生成完整的HHP文件内容，包括[OPTIONS]和[FILES]部分
 4. 支持CHM文件中的本地路径链接
@@ -31,7 +31,8 @@ from common_utils import (
     Logger,
     ArgumentParser,
     timing_decorator,
-    ConfigManager
+    ConfigManager,
+    BuildFileRegistry
 )
 
 class HHPGenerator:
@@ -79,6 +80,14 @@ class HHPGenerator:
         chip_series = f"{chip_name}_V{chip_version}"
         return chip_series
     
+    def is_included(self, relative_path: str) -> bool:
+        """检查文件扩展名是否需要包含在CHM中"""
+        return os.path.splitext(relative_path)[1].lower() in self.include_extensions
+    
+    def to_hhp_path(self, relative_path: str) -> str:
+        """转换为Windows路径格式（使用反斜杠）"""
+        return relative_path.replace('/', '\\')
+    
     def scan_directory(self, directory_path: Path) -> Set[str]:
         """
         扫描指定目录下的所有文件
@@ -89,31 +98,48 @@ class HHPGenerator:
         返回：
         - Set[str]: 文件路径集合（相对于output目录）
         """
-        files = set()
-        
         if not directory_path.exists():
-            return files
+            return set()
         
-        # 递归扫描所有文件
-        for root, dirs, filenames in os.walk(directory_path):
-            root_path = Path(root)
-            
-            for filename in filenames:
-                file_path = root_path / filename
-                
-                # 检查文件扩展名
-                if file_path.suffix.lower() in self.include_extensions:
-                    # 计算相对于output目录的路径
-                    try:
-                        relative_path = file_path.relative_to(self.output_dir)
-                        # 转换为Windows路径格式（使用反斜杠）
-                        relative_path_str = str(relative_path).replace('/', '\\')
-                        files.add(relative_path_str)
-                    except ValueError:
-                        # 如果无法计算相对路径，跳过
-                        continue
+        # 使用scandir递归扫描所有文件
+        return {
+            self.to_hhp_path(relative_path)
+            for relative_path in BuildFileRegistry.scan_tree(directory_path, self.output_dir)
+            if self.is_included(relative_path)
+        }
+    
+    def collect_files(self) -> Set[str]:
+        """
+        收集需要包含在CHM中的文件
+        
+        优先使用构建产物登记表（登记不完整的区域改为扫描），登记表不存在时扫描main、pdf、sub、extra目录和output根目录
+        
+        返回：
+        - Set[str]: 文件路径集合（相对于output目录）
+        """
+        registered_files = BuildFileRegistry.load_all(self.output_folder)
+        if registered_files is not None:
+            return {
+                self.to_hhp_path(relative_path)
+                for relative_path in registered_files
+                if self.is_included(relative_path)
+            }
         
-        return files
+        Logger.warning("未找到构建产物登记表，扫描output目录")
+        
+        all_files = set()
+        
+        # 扫描main、pdf、sub、extra目录
+        for sub_dir_name in ("main", "pdf", "sub", "extra"):
+            all_files.update(self.scan_directory(self.output_dir / sub_dir_name))
+        
+        # 扫描output根目录下的其他文件
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and self.is_included(entry.name):
+                    all_files.add(entry.name)
+        
+        return all_files
     
     def generate_hhp_content(self, all_files: Set[str], chip_series: str) -> str:
         """
@@ -143,14 +169,8 @@ main="{chip_series} Documentation","index.hhc","index.hhk","main/en/html/index.h
 
 """
         
-        # 生成[FILES]部分
-        files_section = "[FILES]\n"
-        
-        # 按目录分组排序文件
-        sorted_files = sorted(all_files)
-        
-        for file_path in sorted_files:
-            files_section += f"{file_path}\n"
+        # 生成[FILES]部分（按目录分组排序文件）
+        files_section = "[FILES]\n" + "".join(f"{file_path}\n" for file_path in sorted(all_files))
         
         # 组合完整内容
         hhp_content = options_section + files_section
@@ -191,39 +211,8 @@ main="{chip_series} Documentation","index.hhc","index.hhk","main/en/html/index.h
                 Logger.error(f"输出目录不存在: {self.output_dir}")
                 return False
             
-            # 扫描各个子目录
-            all_files = set()
-            
-            # 扫描main目录
-            main_dir = self.output_dir / "main"
-            if main_dir.exists():
-                main_files = self.scan_directory(main_dir)
-                all_files.update(main_files)
-            
-            # 扫描pdf目录
-            pdf_dir = self.output_dir / "pdf"
-            if pdf_dir.exists():
-                pdf_files = self.scan_directory(pdf_dir)
-                all_files.update(pdf_files)
-            
-            # 扫描sub目录
-            sub_dir = self.output_dir / "sub"
-            if sub_dir.exists():
-                sub_files = self.scan_directory(sub_dir)
-                all_files.update(sub_files)
-            
-            # 扫描extra目录
-            extra_dir = self.output_dir / "extra"
-            if extra_dir.exists():
-                extra_files = self.scan_directory(extra_dir)
-                all_files.update(extra_files)
-            
-            # 扫描output根目录下的其他文件
-            for item in self.output_dir.iterdir():
-                if item.is_file() and item.suffix.lower() in self.include_extensions:
-                    relative_path = item.relative_to(self.output_dir)
-                    relative_path_str = str(relative_path).replace('/', '\\')
-                    all_files.add(relative_path_str)
+            # 收集所有文件（优先使用构建产物登记表）
+            all_files = self.collect_files()
             
             # 生成HHP内容
             hhp_content = self.generate_hhp_content(all_files, chip_series)
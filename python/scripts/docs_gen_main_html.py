@@ -3,9 +3,9 @@
 """
 docs_gen_main_html.py - 生成 Doxygen HTML 模板脚本
 功能：复制template/html目录到output_folder/doxygen/main，并替换占位符
+说明：增量复制，内容未变化的文件不重新复制，只有Doxyfile*文件需要替换占位符
 """
 
-import shutil
 import sys
 from pathlib import Path
 
@@ -15,7 +15,7 @@ if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
 from common_utils import (
-    ArgumentParser, timing_decorator, Logger, ConfigManager
+    ArgumentParser, timing_decorator, Logger, ConfigManager, FileUtils
 )
 
 class MainHtmlGenerator:
@@ -49,62 +49,26 @@ class MainHtmlGenerator:
         
         return content
     
-    def copy_and_process_file(self, src_file, dst_file):
-        """
-        复制并处理单个文件
-        
-        参数：
-        - src_file: 源文件路径
-        - dst_file: 目标文件路径
-        """
-        try:
-            # 确保目标目录存在
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 如果是Doxyfile文件，需要处理占位符
-            if src_file.name.startswith('Doxyfile'):
-                # 读取源文件内容
-                with open(src_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # 替换占位符
-                processed_content = self.replace_placeholders(content)
-                
-                # 写入目标文件
-                with open(dst_file, 'w', encoding='utf-8') as f:
-                    f.write(processed_content)
-                
-            else:
-                # 普通文件直接复制
-                shutil.copy2(src_file, dst_file)
-                
-        except Exception as e:
-            raise Exception(f"处理文件失败 {src_file.name}: {e}")
-    
     def copy_directory_recursively(self, src_dir, dst_dir):
         """
-        递归复制目录并处理文件
+        复制目录并处理文件（目标目录与源目录保持一致）
         
         参数：
         - src_dir: 源目录
         - dst_dir: 目标目录
+        
+        返回：
+        - dict: 复制统计信息
         """
         try:
-            # 确保目标目录存在
-            dst_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 遍历源目录中的所有内容
-            for item in src_dir.iterdir():
-                src_path = src_dir / item.name
-                dst_path = dst_dir / item.name
-                
-                if src_path.is_file():
-                    # 复制并处理文件
-                    self.copy_and_process_file(src_path, dst_path)
-                elif src_path.is_dir():
-                    # 递归处理子目录
-                    self.copy_directory_recursively(src_path, dst_path)
-                    
+            # Doxyfile文件需要替换占位符，其余文件直接复制
+            return FileUtils.copy_tree(
+                src_dir,
+                dst_dir,
+                processor=self.replace_placeholders,
+                process_prefixes=('Doxyfile',),
+                mirror=True
+            )
         except Exception as e:
             raise Exception(f"复制目录失败 {src_dir.name}: {e}")
     
@@ -118,11 +82,7 @@ class MainHtmlGenerator:
             # 构建目标目录路径
             target_main_dir = self.output_folder / "doxygen" / "main"
             
-            # 如果目标目录已存在，先删除
-            if target_main_dir.exists():
-                shutil.rmtree(target_main_dir)
-            
-            # 复制模板目录内容
+            # 复制模板目录内容（删除目标目录中模板没有的文件，相当于先清空再复制）
             self.copy_directory_recursively(self.template_html_dir, target_main_dir)
             
             return True
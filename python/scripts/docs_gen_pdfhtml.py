@@ -3,6 +3,9 @@
 """
 docs_gen_pdfhtml.py - PDF HTML生成脚本
 功能：在input_folder目录下扫描PDF文件，生成统一的HTML页面
+
+PDF映射数据不再内嵌在页面中，而是按hash前缀分片保存在pdf/html/map/<前缀>.js，
+页面打开某个PDF时只加载对应的分片（script标签加载，CHM内的IE内核可用）
 """
 
 import sys
@@ -17,9 +20,15 @@ if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
 from common_utils import (
-    ArgumentParser, timing_decorator, ConfigManager, Logger
+    ArgumentParser, timing_decorator, ConfigManager, Logger, BuildFileRegistry
 )
 
+# PDF映射分片目录（位于 output/pdf/html 下）
+PDF_MAPPING_DIR_NAME = "map"
+
+# 分片使用的hash前缀长度（1位十六进制，最多16个分片）
+PDF_MAPPING_SHARD_LENGTH = 1
+
 
 class PDFHTMLGenerator:
     """PDF HTML生成器类"""
@@ -107,36 +116,110 @@ class PDFHTMLGenerator:
             '3-UserManual': '3-User_Manual',
         }
     
-    def generate_script_content(self, pdf_files, base_config, registry_project_name):
-        """生成JavaScript代码"""
-        pdf_mappings = {}
-        for pdf_file in pdf_files:
+    def build_pdf_mappings(self, pdf_files):
+        """
+        构建紧凑的PDF映射数据
+        
+        返回：
+        - tuple: (目录列表 [[目录名, 映射后目录名], ...], 分片 {hash前缀: {hash: [目录序号, 文件名]}})
+        """
+        directory_mapping_rules = self.get_directory_mapping_rules()
+        dir_names = []
+        dir_index = {}
+        shards = {}
+        
+        for pdf_file in sorted(pdf_files, key=lambda path: (path.parent.name, path.name)):
             hash_name = self.generate_8char_hash(pdf_file.stem)
             dir_name = pdf_file.parent.name
-            file_name = pdf_file.name
             
-            # 应用目录名称映射规则
-            directory_mapping_rules = self.get_directory_mapping_rules()
-            mapped_dir_name = directory_mapping_rules.get(dir_name, dir_name)
+            if dir_name not in dir_index:
+                dir_index[dir_name] = len(dir_names)
+                # 应用目录名称映射规则
+                dir_names.append([dir_name, directory_mapping_rules.get(dir_name, dir_name)])
             
-            # 构建在线PDF路径
-            online_path = f"{base_config['Base_DownloadUrl']}/{self.project_name}/{mapped_dir_name}/{file_name}"
-            
-            pdf_mappings[hash_name] = {
-                'fileName': file_name,
-                'dirName': dir_name,
-                'mappedDirName': mapped_dir_name,
-                'onlinePath': online_path
-            }
+            shard_key = hash_name[:PDF_MAPPING_SHARD_LENGTH]
+            shards.setdefault(shard_key, {})[hash_name] = [dir_index[dir_name], pdf_file.name]
         
-        # 将映射数据转换为JavaScript对象
-        mappings_json = json.dumps(pdf_mappings, ensure_ascii=False, indent=2)
+        return dir_names, shards
+    
+    def generate_script_content(self, pdf_files, base_config, registry_project_name):
+        """生成JavaScript代码"""
+        dir_names, _ = self.build_pdf_mappings(pdf_files)
+        
+        # 页面只保存在线路径前缀和目录表，文件映射按需从分片加载
+        mapping_config = {
+            'baseUrl': f"{base_config['Base_DownloadUrl']}/{self.project_name}",
+            'dirs': dir_names,
+            'shardLength': PDF_MAPPING_SHARD_LENGTH,
+            'shardDir': PDF_MAPPING_DIR_NAME
+        }
+        mapping_config_json = json.dumps(mapping_config, ensure_ascii=False, separators=(',', ':'))
         
         # 生成JavaScript代码
         script_content = f"""
     <script>
-    // PDF映射数据
-    var pdfMappings = {mappings_json};
+    // PDF映射配置（文件映射按hash前缀分片保存，打开PDF时按需加载）
+    var pdfMappingConfig = {mapping_config_json};
+    var pdfMappingShards = {{}};
+    var pdfMappingCallbacks = {{}};
+    
+    // 分片脚本加载完成后调用
+    function pdfMappingShard(key, entries) {{
+        pdfMappingShards[key] = entries;
+        var callbacks = pdfMappingCallbacks[key] || [];
+        pdfMappingCallbacks[key] = null;
+        for (var i = 0; i < callbacks.length; i++) {{
+            callbacks[i]();
+        }}
+    }}
+    
+    // 检查锚点是否为PDF的hash（只允许8位十六进制，避免拼接任意脚本路径）
+    function isPdfHash(hashName) {{
+        return /^[0-9a-f]{{8}}$/.test(hashName);
+    }}
+    
+    // 把分片中的紧凑条目还原为映射对象
+    function toPdfMapping(entry) {{
+        if (!entry) {{
+            return null;
+        }}
+        var dir = pdfMappingConfig.dirs[entry[0]];
+        return {{
+            fileName: entry[1],
+            dirName: dir[0],
+            mappedDirName: dir[1],
+            onlinePath: pdfMappingConfig.baseUrl + "/" + dir[1] + "/" + entry[1]
+        }};
+    }}
+    
+    // 查找PDF映射，分片未加载时先加载分片
+    function findPdfMapping(hashName, callback) {{
+        if (!isPdfHash(hashName)) {{
+            callback(null);
+            return;
+        }}
+        var key = hashName.substring(0, pdfMappingConfig.shardLength);
+        var lookup = function() {{
+            callback(toPdfMapping(pdfMappingShards[key][hashName]));
+        }};
+        if (pdfMappingShards[key]) {{
+            lookup();
+            return;
+        }}
+        if (pdfMappingCallbacks[key]) {{
+            pdfMappingCallbacks[key].push(lookup);
+            return;
+        }}
+        pdfMappingCallbacks[key] = [lookup];
+        var script = document.createElement('script');
+        script.type = 'text/javascript';
+        script.charset = 'utf-8';
+        script.onerror = function() {{
+            pdfMappingShard(key, {{}});
+        }};
+        script.src = pdfMappingConfig.shardDir + '/' + key + '.js';
+        document.getElementsByTagName('head')[0].appendChild(script);
+    }}
     
     // 智能PDF加载策略
     function loadPDF() {{
@@ -174,25 +257,26 @@ class PDFHTMLGenerator:
     
     // 智能PDF加载函数
     function loadPDFByHash(hashName) {{
-        var mapping = pdfMappings[hashName];
-        if (!mapping) {{
-            alert('未找到对应的PDF文件');
-            return;
-        }}
-        
-        var pdfViewer = document.getElementById('pdfViewer');
-        var loading = document.getElementById('loading');
-        
-        loading.style.display = 'block';
-        loading.innerHTML = '正在检测网络连接...';
-        pdfViewer.style.display = 'none';
-        
-        checkNetworkAndLoadPDF(mapping, pdfViewer, loading);
-        
-        var currentHash = window.location.hash.substring(1);
-        if (currentHash !== hashName) {{
-            window.location.hash = hashName;
-        }}
+        findPdfMapping(hashName, function(mapping) {{
+            if (!mapping) {{
+                alert('未找到对应的PDF文件');
+                return;
+            }}
+            
+            var pdfViewer = document.getElementById('pdfViewer');
+            var loading = document.getElementById('loading');
+            
+            loading.style.display = 'block';
+            loading.innerHTML = '正在检测网络连接...';
+            pdfViewer.style.display = 'none';
+            
+            checkNetworkAndLoadPDF(mapping, pdfViewer, loading);
+            
+            var currentHash = window.location.hash.substring(1);
+            if (currentHash !== hashName) {{
+                window.location.hash = hashName;
+            }}
+        }});
     }}
     
     // 检测网络并加载PDF
@@ -278,17 +362,21 @@ class PDFHTMLGenerator:
     // 页面加载完成后检查URL锚点
     function checkHashOnLoad() {{
         var hash = window.location.hash.substring(1);
-        if (hash && pdfMappings[hash]) {{
-            setTimeout(function() {{ loadPDFByHash(hash); }}, 100);
-        }}
+        findPdfMapping(hash, function(mapping) {{
+            if (mapping) {{
+                setTimeout(function() {{ loadPDFByHash(hash); }}, 100);
+            }}
+        }});
     }}
     
     // 监听锚点变化
     function checkHashChange() {{
         var hash = window.location.hash.substring(1);
-        if (hash && pdfMappings[hash]) {{
-            loadPDFByHash(hash);
-        }}
+        findPdfMapping(hash, function(mapping) {{
+            if (mapping) {{
+                loadPDFByHash(hash);
+            }}
+        }});
     }}
     
     // 页面加载完成后执行
@@ -408,13 +496,15 @@ class PDFHTMLGenerator:
                 except Exception as e:
                     pass
             
-            # 清空映射文件
-            mapping_file = html_dir.parent / "filename_mapping.json"
-            if mapping_file.exists():
-                try:
-                    mapping_file.unlink()
-                except Exception as e:
-                    pass
+            # 清空映射分片和旧版本的映射文件
+            mapping_files = list((html_dir / PDF_MAPPING_DIR_NAME).glob("*.js"))
+            mapping_files.append(html_dir.parent / "filename_mapping.json")
+            for mapping_file in mapping_files:
+                if mapping_file.exists():
+                    try:
+                        mapping_file.unlink()
+                    except Exception as e:
+                        pass
         
         try:
             html_dir.mkdir(parents=True, exist_ok=True)
@@ -423,22 +513,17 @@ class PDFHTMLGenerator:
             Logger.error(f"创建输出目录失败: {e}")
             return None
     
-    def save_filename_mapping(self, pdf_files):
-        """保存文件名映射"""
+    def save_filename_mapping(self, pdf_files, html_dir):
+        """保存PDF映射分片（pdf/html/map/<hash前缀>.js，由页面按需加载）"""
         try:
-            mapping_file = self.output_folder / "output" / "pdf" / "filename_mapping.json"
-            mappings = {}
+            mapping_dir = html_dir / PDF_MAPPING_DIR_NAME
+            mapping_dir.mkdir(parents=True, exist_ok=True)
             
-            for pdf_file in pdf_files:
-                hash_name = self.generate_8char_hash(pdf_file.stem)
-                mappings[hash_name] = {
-                    'original_name': pdf_file.stem,
-                    'dir_name': pdf_file.parent.name,
-                    'file_name': pdf_file.name
-                }
-            
-            with open(mapping_file, 'w', encoding='utf-8') as f:
-                json.dump(mappings, f, ensure_ascii=False, indent=2)
+            _, shards = self.build_pdf_mappings(pdf_files)
+            for shard_key, entries in shards.items():
+                entries_json = json.dumps(entries, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+                with open(mapping_dir / f"{shard_key}.js", 'w', encoding='utf-8') as f:
+                    f.write(f'pdfMappingShard("{shard_key}",{entries_json});\n')
             
             return True
         except Exception as e:
@@ -473,11 +558,6 @@ class PDFHTMLGenerator:
             with open(html_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             
-            # 保存文件名映射（用于HHC生成）
-            for pdf_file in pdf_files:
-                hash_name = self.generate_8char_hash(pdf_file.stem)
-                # 这里可以添加更多映射保存逻辑
-            
             return True
             
         except Exception as e:
@@ -512,9 +592,14 @@ class PDFHTMLGenerator:
             # 生成统一的HTML页面
             success = self.generate_unified_html_for_project(pdf_files, html_dir, base_config, registry_project_name)
             
+            # 保存PDF映射分片（页面依赖分片，保存失败时视为生成失败）
+            success = success and self.save_filename_mapping(pdf_files, html_dir)
+            
             if success:
-                # 保存文件名映射
-                self.save_filename_mapping(pdf_files)
+                # 登记构建产物
+                file_registry = BuildFileRegistry(self.output_folder, "docs_gen_pdfhtml")
+                file_registry.add_tree(html_dir)
+                file_registry.save()
                 return True
             else:
                 return False
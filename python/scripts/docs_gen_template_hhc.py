@@ -78,6 +78,9 @@ from common_utils import (
     HashUtils,
     PathUtils,
     TextProcessor,
+    BuildFileRegistry,
+    Tracer,
+    Progress,
     timing_decorator
 )
 
@@ -103,6 +106,9 @@ class HHCContentExtractor(BaseGenerator):
         
         # 加载base.json配置
         self.base_config = self.load_base_config()
+        
+        # 构建产物登记表（空目录HTML）
+        self.file_registry = BuildFileRegistry(self.output_folder, "docs_gen_template_hhc")
     
     def get_template_path(self, template_filename: str) -> Path:
         """获取模板文件路径"""
@@ -289,7 +295,8 @@ class HHCContentExtractor(BaseGenerator):
         try:
             extra_dir = self.ensure_output_dir("output", "extra")
             html_file = extra_dir / f"{dir_name}.html"
-            FileUtils.write_file(html_file, html_content)
+            if FileUtils.write_file(html_file, html_content):
+                self.file_registry.add(html_file)
             
         except Exception as e:
             Logger.error(f"保存HTML文件 {dir_name}.html 时出错: {e}")
@@ -396,15 +403,18 @@ class HHCContentExtractor(BaseGenerator):
         failed_count = 0
         skipped_count = 0  # 因为缺少files.html而跳过的文件数量
         
-        for i, hhc_file in enumerate(hhc_files, 1):
+        hhc_items = Progress.track("hhc_template", hhc_files, item=lambda hhc_file: Path(hhc_file).parent.name)
+        for i, hhc_file in enumerate(hhc_items, 1):
             try:
                 # 检查前置条件：是否存在files.html文件
                 if not self.check_files_html_exists(hhc_file):
                     skipped_count += 1
                     continue
                 
-                self.process_hhc_file(hhc_file)
+                with Tracer.span(Path(hhc_file).parent.name, "hhc_template"):
+                    self.process_hhc_file(hhc_file)
                 processed_count += 1
+                Tracer.counter("hhc_template", done=i, total=len(hhc_files))
             except Exception as e:
                 Logger.error(f"处理文件 {hhc_file} 时出错: {e}")
                 failed_count += 1
@@ -1048,6 +1058,9 @@ class HHCContentExtractor(BaseGenerator):
             
             # 6. 显示生成的模板文件
             self.show_generated_template_files()
+            
+            # 7. 登记构建产物
+            self.file_registry.save()
             return True
             
         except Exception as e:
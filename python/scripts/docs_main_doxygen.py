@@ -15,7 +15,7 @@ current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from common_utils import BaseGenerator, ArgumentParser, Logger, ConfigManager, timing_decorator
+from common_utils import BaseGenerator, ArgumentParser, Logger, ConfigManager, BuildFileRegistry, PathUtils, timing_decorator
 
 
 class DoxygenGenerator(BaseGenerator):
@@ -30,9 +30,7 @@ class DoxygenGenerator(BaseGenerator):
         """执行doxygen命令"""
         try:
             # 先获取doxygen.exe的绝对路径（相对于当前脚本位置）
-            script_dir = Path(__file__).parent
-            doxygen_exe = script_dir / ".." / ".." / "tools" / "doxygen" / "doxygen.exe"
-            doxygen_exe = doxygen_exe.resolve()  # 转换为绝对路径
+            doxygen_exe = PathUtils.get_tool_path("doxygen", "doxygen.exe")
             
             # 切换到doxygen目录
             os.chdir(self.doxygen_dir)
@@ -117,6 +115,11 @@ class DoxygenGenerator(BaseGenerator):
                 else:
                     Logger.error("中文版Doxygen生成失败")
             
+            # 登记构建产物
+            file_registry = BuildFileRegistry(self.output_folder, "docs_main_doxygen")
+            file_registry.add_tree(self.output_folder / "output" / "main")
+            file_registry.save()
+            
             # 检查结果
             if success_count == total_count and total_count > 0:
                 return True
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+docs_minify_html.py - CHM页面压缩脚本
+功能：在编译CHM之前压缩output_folder/output目录下的HTML页面，减小CHM体积和hhc.exe编译时间
+
+主要功能：
+1. 扫描output目录下的所有HTML页面（不处理index.hhc、index.hhk等目录和索引文件）
+2. 删除HTML注释（保留IE条件注释），把包含换行的空白（缩进）压缩为一个换行
+3. pre、textarea、script、style以及Doxygen代码行（div.line，pre-wrap样式）原样保留
+4. 压缩结果按内容哈希缓存在output_folder/cache/html下，再次运行时直接复用
+5. 使用进程池并行处理，最后输出节省的字节数
+
+说明：
+- 按字节处理，不需要识别页面编码（UTF-8和GBK页面都可以安全处理）
+- 只去掉浏览器渲染时会被合并的空白，页面显示效果不变
+- 芯片配置 Html_Minify 为false时跳过本步骤
+
+参数：
+- input_folder: 输入目录（未使用，但保持接口一致性）
+- output_folder: 输出目录路径
+- chip_config_json: 芯片配置JSON，可选字段 Html_Minify（默认true）
+"""
+
+import os
+import re
+import sys
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 添加当前目录到Python路径
+current_dir = Path(__file__).parent
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
+
+from common_utils import (
+    BaseGenerator,
+    Logger,
+    ArgumentParser,
+    ConfigManager,
+    CacheUtils,
+    Progress,
+    WorkerBudget,
+    timing_decorator
+)
+
+# 需要压缩的页面扩展名
+HTML_EXTENSIONS = ('.html', '.htm')
+
+# 页面缓存目录（位于 output_folder/cache 下）
+HTML_CACHE_DIR_NAME = "html"
+
+# 压缩算法版本，算法变化时递增以使旧缓存失效
+HTML_MINIFIER_VERSION = 1
+
+# 注释和需要原样保留的区域（按出现顺序匹配，先出现的优先）
+HTML_TOKEN_PATTERN = re.compile(
+    rb'(?P<comment><!--.*?-->)'
+    rb'|(?P<block><(?P<tag>pre|textarea|script|style)\b.*?</(?P=tag)\s*>)'
+    rb'|(?P<line><div\s+class\s*=\s*["\']line["\'][^>]*>.*?</div\s*>)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# 需要保留的注释：IE条件注释
+KEEP_COMMENT_PREFIXES = (b'<!--[if', b'<!--<![endif]')
+
+# 包含换行的空白
+NEWLINE_WHITESPACE_PATTERN = re.compile(rb'[ \t\r\f\v]*\n\s*')
+
+
+def minify_html(data):
+    """
+    压缩HTML页面
+    
+    参数：
+    - data: 页面原始数据（bytes）
+    
+    返回：
+    - bytes: 压缩后的数据
+    """
+    output = []
+    text = []
+    position = 0
+    
+    for match in HTML_TOKEN_PATTERN.finditer(data):
+        text.append(data[position:match.start()])
+        position = match.end()
+        
+        token = match.group(0)
+        if match.group('comment') and not token.startswith(KEEP_COMMENT_PREFIXES):
+            # 删除的注释两侧的文本合并后再压缩空白，保证重复压缩结果不变
+            continue
+        
+        output.append(NEWLINE_WHITESPACE_PATTERN.sub(b'\n', b''.join(text)))
+        output.append(token)
+        text = []
+    
+    text.append(data[position:])
+    output.append(NEWLINE_WHITESPACE_PATTERN.sub(b'\n', b''.join(text)))
+    return b''.join(output).strip()
+
+
+def minify_html_file(task):
+    """
+    压缩单个页面（在工作进程中执行）
+    
+    参数：
+    - task: (页面路径, 缓存目录)
+    
+    返回：
+    - tuple: (原始字节数, 压缩后字节数, 是否命中缓存)
+    """
+    file_path, cache_dir = task
+    
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    content_hash = hashlib.md5(data).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{content_hash}_v{HTML_MINIFIER_VERSION}.html")
+    
+    cached = os.path.exists(cache_file)
+    if cached:
+        with open(cache_file, 'rb') as f:
+            minified = f.read()
+    else:
+        minified = minify_html(data)
+        # 只缓存有变化的页面，已经压缩过的页面再次处理时结果不变
+        if len(minified) < len(data):
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(minified)
+            os.replace(temp_file, cache_file)
+    
+    if len(minified) >= len(data):
+        return len(data), len(data), cached
+    
+    temp_file = f"{file_path}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(minified)
+    os.replace(temp_file, file_path)
+    return len(data), len(minified), cached
+
+
+class HtmlMinifier(BaseGenerator):
+    """
+    CHM页面压缩器类
+    
+    主要职责：
+    - 扫描output目录下的HTML页面
+    - 并行压缩，结果按内容哈希缓存
+    - 覆盖变小的页面并统计节省的字节数
+    """
+    
+    def __init__(self, output_folder, chip_config):
+        """初始化页面压缩器"""
+        super().__init__("", output_folder, chip_config)  # input_folder 在此脚本中不使用
+        
+        self.output_dir = self.output_folder / "output"
+        self.cache_dir = CacheUtils.get_shared_cache_dir(self.output_folder) / HTML_CACHE_DIR_NAME
+        self.enabled = chip_config.get('Html_Minify', True)
+        
+        # 设置最大并发数
+        self.max_workers = WorkerBudget.get_max_workers()
+    
+    def scan_pages(self):
+        """扫描output目录下的所有HTML页面"""
+        pages = []
+        for root, dirs, filenames in os.walk(self.output_dir):
+            for filename in filenames:
+                if filename.lower().endswith(HTML_EXTENSIONS):
+                    pages.append(os.path.join(root, filename))
+        return pages
+    
+    def run(self):
+        """运行页面压缩"""
+        try:
+            if not self.enabled:
+                Logger.info("芯片配置Html_Minify为false，跳过页面压缩")
+                return True
+            
+            if not self.output_dir.exists():
+                Logger.error(f"输出目录不存在: {self.output_dir}")
+                return False
+            
+            pages = self.scan_pages()
+            if not pages:
+                Logger.info("没有需要压缩的页面")
+                return True
+            
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tasks = [(page, str(self.cache_dir)) for page in pages]
+            
+            if len(tasks) == 1 or self.max_workers <= 1:
+                results = [minify_html_file(task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(Progress.track("minify", executor.map(
+                        minify_html_file,
+                        tasks,
+                        chunksize=max(1, len(tasks) // (self.max_workers * 4))
+                    ), total=len(tasks), size=lambda result: result[0]))
+            
+            bytes_before = sum(before for before, _, _ in results)
+            bytes_after = sum(after for _, after, _ in results)
+            minified_files = sum(1 for before, after, _ in results if after < before)
+            cached_files = sum(1 for _, _, cached in results if cached)
+            
+            saved = bytes_before - bytes_after
+            Logger.info(f"页面总数: {len(results)}，已压缩: {minified_files}，命中缓存: {cached_files}")
+            Logger.success(f"页面压缩完成，节省 {saved} 字节（{bytes_before} -> {bytes_after}）")
+            return True
+        
+        except Exception as e:
+            Logger.error(f"页面压缩失败: {e}")
+            return False
+
+
+@timing_decorator
+def main():
+    """主函数"""
+    try:
+        # 解析命令行参数
+        input_folder, output_folder, chip_config_json = ArgumentParser.parse_standard_args(
+            3, "python docs_minify_html.py <input_folder> <output_folder> <chip_config_json>"
+        )
+        
+        config_manager = ConfigManager()
+        chip_config = config_manager.load_chip_config(chip_config_json)
+        
+        # 创建压缩器并执行
+        minifier = HtmlMinifier(output_folder, chip_config)
+        
+        if not minifier.run():
+            sys.exit(1)
+    
+    except Exception as e:
+        Logger.error(f"执行失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
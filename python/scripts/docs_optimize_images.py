@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+docs_optimize_images.py - CHM图片优化脚本
+功能：在编译CHM之前优化output_folder/output目录下的图片，减小CHM体积和hhc.exe编译时间
+
+主要功能：
+1. 扫描output目录下的所有图片，按内容哈希去重，相同内容只优化一次
+2. PNG无损重新压缩（合并IDAT并以最高压缩级别重新压缩，去除文本和时间戳块）
+3. 可选：缩小宽度超过Image_Max_Width的图片（需要Pillow，未安装时跳过）
+4. 优化结果按内容哈希缓存在output_folder/cache/images下，再次运行时直接复用
+5. 只在优化后更小时覆盖原文件，最后输出节省的字节数
+
+参数：
+- input_folder: 输入目录（未使用，但保持接口一致性）
+- output_folder: 输出目录路径
+- chip_config_json: 芯片配置JSON，可选字段 Image_Max_Width（默认0，不缩小）
+"""
+
+import io
+import os
+import sys
+import zlib
+import struct
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 添加当前目录到Python路径
+current_dir = Path(__file__).parent
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
+
+from common_utils import (
+    BaseGenerator,
+    Logger,
+    ArgumentParser,
+    ConfigManager,
+    CacheUtils,
+    Progress,
+    WorkerBudget,
+    timing_decorator
+)
+
+# 需要优化的图片扩展名
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg'}
+
+# 图片缓存目录（位于 output_folder/cache 下）
+IMAGE_CACHE_DIR_NAME = "images"
+
+# 优化算法版本，算法变化时递增以使旧缓存失效
+IMAGE_OPTIMIZER_VERSION = 1
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 重新压缩时去除的PNG辅助块（不影响显示）
+PNG_STRIP_CHUNKS = {b'tEXt', b'zTXt', b'iTXt', b'tIME'}
+
+
+def iter_png_chunks(data):
+    """遍历PNG数据块，返回 (类型, 数据) 序列，格式错误时抛出ValueError"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("不是PNG文件")
+    
+    offset = len(PNG_SIGNATURE)
+    while offset < len(data):
+        if offset + 8 > len(data):
+            raise ValueError("PNG数据块不完整")
+        length, chunk_type = struct.unpack('>I4s', data[offset:offset + 8])
+        chunk_data = data[offset + 8:offset + 8 + length]
+        if len(chunk_data) != length:
+            raise ValueError("PNG数据块不完整")
+        yield chunk_type, chunk_data
+        offset += 12 + length
+        if chunk_type == b'IEND':
+            break
+
+
+def build_png_chunk(chunk_type, chunk_data):
+    """构建PNG数据块（长度 + 类型 + 数据 + CRC）"""
+    crc = zlib.crc32(chunk_type + chunk_data) & 0xffffffff
+    return struct.pack('>I', len(chunk_data)) + chunk_type + chunk_data + struct.pack('>I', crc)
+
+
+def optimize_png(data):
+    """
+    PNG无损优化
+    
+    像素数据不变：所有IDAT块合并后以zlib最高级别重新压缩，并去除文本和时间戳块
+    
+    返回：
+    - bytes: 优化后的数据（无法优化时返回原数据）
+    """
+    try:
+        chunks = list(iter_png_chunks(data))
+    except ValueError:
+        return data
+    
+    idat_data = b''.join(chunk_data for chunk_type, chunk_data in chunks if chunk_type == b'IDAT')
+    if not idat_data:
+        return data
+    
+    try:
+        raw_data = zlib.decompress(idat_data)
+    except zlib.error:
+        return data
+    
+    output = [PNG_SIGNATURE]
+    idat_written = False
+    for chunk_type, chunk_data in chunks:
+        if chunk_type in PNG_STRIP_CHUNKS:
+            continue
+        if chunk_type == b'IDAT':
+            # 在第一个IDAT的位置写入合并后的IDAT
+            if not idat_written:
+                output.append(build_png_chunk(b'IDAT', zlib.compress(raw_data, 9)))
+                idat_written = True
+            continue
+        output.append(build_png_chunk(chunk_type, chunk_data))
+    
+    optimized = b''.join(output)
+    return optimized if len(optimized) < len(data) else data
+
+
+def resize_image(data, suffix, max_width):
+    """
+    缩小宽度超过max_width的图片（需要Pillow）
+    
+    返回：
+    - bytes: 缩小后的数据（不需要缩小或Pillow不可用时返回原数据）
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+    
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if image.width <= max_width:
+                return data
+            
+            height = max(1, round(image.height * max_width / image.width))
+            resized = image.resize((max_width, height), Image.LANCZOS)
+            
+            buffer = io.BytesIO()
+            if suffix == '.png':
+                resized.save(buffer, format='PNG', optimize=True)
+            else:
+                if resized.mode not in ('RGB', 'L'):
+                    resized = resized.convert('RGB')
+                resized.save(buffer, format='JPEG', quality=90, optimize=True)
+            return buffer.getvalue()
+    except Exception:
+        return data
+
+
+def optimize_image_data(data, suffix, max_width=0):
+    """
+    优化单个图片数据（在工作进程中执行）
+    
+    参数：
+    - data: 图片原始数据
+    - suffix: 小写扩展名
+    - max_width: 最大宽度，0表示不缩小
+    
+    返回：
+    - bytes: 优化后的数据（不会比原数据大）
+    """
+    optimized = data
+    
+    if max_width > 0:
+        optimized = resize_image(optimized, suffix, max_width)
+    
+    if suffix == '.png':
+        optimized = optimize_png(optimized)
+    
+    return optimized if len(optimized) < len(data) else data
+
+
+class ImageOptimizer(BaseGenerator):
+    """
+    CHM图片优化器类
+    
+    主要职责：
+    - 扫描output目录下的图片并按内容去重
+    - 并行优化，结果按内容哈希缓存
+    - 覆盖变小的图片并统计节省的字节数
+    """
+    
+    def __init__(self, output_folder, chip_config):
+        """初始化图片优化器"""
+        super().__init__("", output_folder, chip_config)  # input_folder 在此脚本中不使用
+        
+        self.output_dir = self.output_folder / "output"
+        self.cache_dir = CacheUtils.get_shared_cache_dir(self.output_folder) / IMAGE_CACHE_DIR_NAME
+        self.max_width = int(chip_config.get('Image_Max_Width', 0) or 0)
+        
+        # 设置最大并发数
+        self.max_workers = WorkerBudget.get_max_workers()
+    
+    def scan_images(self):
+        """
+        扫描output目录下的所有图片
+        
+        返回：
+        - dict: (内容哈希, 扩展名) -> {'suffix': 扩展名, 'data': 原始数据, 'files': [文件路径]}
+        """
+        groups = {}
+        
+        for root, dirs, filenames in os.walk(self.output_dir):
+            for filename in filenames:
+                suffix = os.path.splitext(filename)[1].lower()
+                if suffix not in IMAGE_EXTENSIONS:
+                    continue
+                
+                file_path = Path(root) / filename
+                data = file_path.read_bytes()
+                # 扩展名参与分组，避免同内容不同格式的文件被当作同一种图片处理
+                content_hash = hashlib.md5(data).hexdigest()
+                group = groups.setdefault((content_hash, suffix), {'suffix': suffix, 'data': data, 'files': []})
+                group['files'].append(file_path)
+        
+        return groups
+    
+    def get_cache_file(self, content_hash, suffix):
+        """获取优化结果的缓存文件路径"""
+        return self.cache_dir / f"{content_hash}_v{IMAGE_OPTIMIZER_VERSION}_w{self.max_width}{suffix}"
+    
+    def optimize_groups(self, groups):
+        """
+        优化所有去重后的图片，优先使用缓存
+        
+        返回：
+        - dict: (内容哈希, 扩展名) -> 优化后的数据
+        """
+        results = {}
+        pending = []
+        
+        for key, group in groups.items():
+            cache_file = self.get_cache_file(*key)
+            if cache_file.exists():
+                results[key] = cache_file.read_bytes()
+            else:
+                pending.append(key)
+        
+        if not pending:
+            return results
+        
+        if len(pending) == 1 or self.max_workers <= 1:
+            optimized_list = [optimize_image_data(groups[key]['data'], groups[key]['suffix'], self.max_width) for key in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                optimized_list = list(Progress.track("images", executor.map(
+                    optimize_image_data,
+                    [groups[key]['data'] for key in pending],
+                    [groups[key]['suffix'] for key in pending],
+                    [self.max_width] * len(pending),
+                    chunksize=max(1, len(pending) // (self.max_workers * 4))
+                ), total=len(pending), size=len))
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for key, optimized in zip(pending, optimized_list):
+            results[key] = optimized
+            try:
+                cache_file = self.get_cache_file(*key)
+                temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                temp_file.write_bytes(optimized)
+                os.replace(temp_file, cache_file)
+            except Exception as e:
+                Logger.warning(f"保存图片优化缓存失败: {e}")
+        
+        return results
+    
+    def run(self):
+        """运行图片优化"""
+        try:
+            if not self.output_dir.exists():
+                Logger.error(f"输出目录不存在: {self.output_dir}")
+                return False
+            
+            if self.max_width > 0:
+                try:
+                    import PIL  # noqa: F401
+                except ImportError:
+                    Logger.warning("未安装Pillow，跳过图片缩小，只进行无损压缩")
+            
+            groups = self.scan_images()
+            if not groups:
+                Logger.info("没有需要优化的图片")
+                return True
+            
+            results = self.optimize_groups(groups)
+            
+            total_files = 0
+            optimized_files = 0
+            bytes_before = 0
+            bytes_after = 0
+            
+            for key, group in groups.items():
+                original = group['data']
+                optimized = results[key]
+                
+                for file_path in group['files']:
+                    total_files += 1
+                    bytes_before += len(original)
+                    bytes_after += len(optimized)
+                    
+                    if len(optimized) < len(original):
+                        temp_file = file_path.with_name(f"{file_path.name}.tmp")
+                        temp_file.write_bytes(optimized)
+                        os.replace(temp_file, file_path)
+                        optimized_files += 1
+            
+            saved = bytes_before - bytes_after
+            Logger.info(f"图片总数: {total_files}，去重后: {len(groups)}，已优化: {optimized_files}")
+            Logger.success(f"图片优化完成，节省 {saved} 字节（{bytes_before} -> {bytes_after}）")
+            return True
+        
+        except Exception as e:
+            Logger.error(f"图片优化失败: {e}")
+            return False
+
+
+@timing_decorator
+def main():
+    """主函数"""
+    try:
+        # 解析命令行参数
+        input_folder, output_folder, chip_config_json = ArgumentParser.parse_standard_args(
+            3, "python docs_optimize_images.py <input_folder> <output_folder> <chip_config_json>"
+        )
+        
+        config_manager = ConfigManager()
+        chip_config = config_manager.load_chip_config(chip_config_json)
+        
+        # 创建优化器并执行
+        optimizer = ImageOptimizer(output_folder, chip_config)
+        
+        if not optimizer.run():
+            sys.exit(1)
+    
+    except Exception as e:
+        Logger.error(f"执行失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,18 @@ generate_chm_hhc.py - 基于Microsoft HTML Help Workshop的CHM文件生成脚本
 - 检查output目录下的index.hhk文件
 - 确保所有必要文件都存在
 
+编译前链接检查：
+- 解析index.hhp的[FILES]文件列表
+- 并行检查index.hhc和template/*.txt中所有Local=路径是否在[FILES]中
+- 并行检查HTML页面中所有href/src引用的本地文件是否在[FILES]中
+- 目录项缺失时在调用hhc.exe之前失败，页面断链和孤立文件只报告
+
+分区编译（芯片配置Chm_Partition为true时启用）：
+- 按顶层文档区域（pdf、sub下的每个一级目录）把[FILES]拆分为多个子项目，过大的区域按文件数再分桶
+- 主项目保留main、extra等文件，通过[MERGE FILES]合并子CHM，目录和索引项改为"ms-its:子CHM::/路径"形式
+- 页面和数据脚本中指向其它CHM的引用改写为"ms-its:CHM::/路径"形式，恢复单项目编译时改回相对路径
+- 子项目并行编译，文件未变化的子CHM不重新编译
+
 HHP文件优化：
 - 更新HHP文件使用正确的CHM文件名
 - 自动优化性能设置（禁用全文搜索以提升编译速度）
@@ -73,10 +85,16 @@ CHM文件生成：
 """
 
 import os
+import posixpath
+import re
+import hashlib
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import unescape
 from pathlib import Path
+from urllib.parse import quote, unquote
 
 # 添加当前目录到Python路径（必须在导入common_utils之前）
 current_dir = Path(__file__).parent
@@ -89,10 +107,636 @@ from common_utils import (
     ArgumentParser,
     ConfigManager,
     FileUtils,
+    JsonUtils,
+    PathUtils,
+    CacheUtils,
+    Tracer,
+    Progress,
+    WorkerBudget,
     timing_decorator
 )
 
 
+# 目录文件中的Local参数
+LOCAL_PARAM_PATTERN = re.compile(r'<param\s+name="Local"\s+value="([^"]*)"', re.IGNORECASE)
+
+# HTML页面中的href/src引用
+PAGE_LINK_PATTERN = re.compile(r'\b(?:href|src)\s*=\s*["\']([^"\'<>]*)["\']', re.IGNORECASE)
+
+# 不需要检查的链接前缀（外部链接、脚本、CHM内部协议等）
+EXTERNAL_LINK_PREFIXES = (
+    'http:', 'https:', 'ftp:', 'mailto:', 'javascript:', 'data:', 'file:',
+    'ms-its:', 'mk:', 'its:', 'about:', '#', '$', '{'
+)
+
+# 合并CHM之间的引用：ms-its:<CHM>::/<路径>
+MERGED_LINK_PATTERN = re.compile(r'^ms-its:([^:/\\]+\.chm)::/?([^#?]*)(.*)$', re.IGNORECASE | re.DOTALL)
+
+# 需要检查引用的页面扩展名
+PAGE_EXTENSIONS = ('.html', '.htm')
+
+# 分区编译：数据脚本（如例程概览的*.data.js）中带引号的页面路径，按脚本所在目录（即加载它的页面目录）解析
+SCRIPT_LINK_PATTERN = re.compile(r'"([\w./%:~+-]+\.html?(?:#[\w./%:~+-]*)?)"', re.IGNORECASE | re.ASCII)
+
+# 分区编译：需要改写引用的数据脚本扩展名
+SCRIPT_EXTENSIONS = ('.js',)
+
+# 每类问题最多显示的条数
+MAX_REPORTED_ISSUES = 20
+
+# 分区编译：主项目保留的顶层目录（默认主题和配置页所在区域）
+MASTER_AREAS = ("main", "extra")
+
+# 分区编译：子项目共享的Doxygen静态资源目录（由docs_gen_doxygen生成），
+# 合并的CHM之间不能用相对路径互相引用，因此该目录的文件会加入每个sub子项目
+SHARED_ASSET_AREA = "sub/_shared"
+
+# 分区编译：单个子项目的最大文件数，超过时按下一级目录分桶
+MAX_PART_FILES = 20000
+
+# 分区编译：子CHM指纹缓存文件（位于 output_folder/cache 下）
+CHM_PART_CACHE_FILE = "chm_parts.json"
+
+# 工作进程中的[FILES]文件集合（小写，"/"分隔）
+_worker_file_set = None
+
+# 工作进程中的文件所在CHM（标准化路径 -> (原始路径, CHM文件名元组)）
+_worker_file_chms = None
+
+
+def normalize_chm_path(path_str):
+    """标准化CHM内路径：去掉锚点和查询参数，统一为小写和"/"分隔"""
+    path_str = path_str.split('#', 1)[0].split('?', 1)[0]
+    path_str = unquote(path_str).replace('\\', '/').strip()
+    parts = []
+    for part in path_str.split('/'):
+        if part in ('', '.'):
+            continue
+        if part == '..':
+            if parts:
+                parts.pop()
+            continue
+        parts.append(part)
+    return '/'.join(parts).lower()
+
+
+def init_link_worker(file_set):
+    """初始化链接检查工作进程"""
+    global _worker_file_set
+    _worker_file_set = file_set
+
+
+def check_page_links(task):
+    """
+    检查一批HTML页面中的本地引用（在工作进程中执行）
+    
+    参数：
+    - task: (output目录, [页面相对路径])
+    
+    返回：
+    - tuple: (被引用的文件集合, [(页面, 缺失的引用)])
+    """
+    output_dir, pages = task
+    referenced = set()
+    missing = []
+    
+    for page in pages:
+        try:
+            with open(os.path.join(output_dir, page), 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            continue
+        
+        page_dir = page.rsplit('/', 1)[0] if '/' in page else ''
+        for link in set(PAGE_LINK_PATTERN.findall(content)):
+            link = unescape(link).strip()
+            merged = MERGED_LINK_PATTERN.match(link)
+            if merged:
+                # 分区编译改写过的引用：只记录指向[FILES]中文件的引用
+                target = normalize_chm_path(merged.group(2))
+                if target in _worker_file_set:
+                    referenced.add(target)
+                continue
+            if not link or link.lower().startswith(EXTERNAL_LINK_PREFIXES):
+                continue
+            
+            target = normalize_chm_path(f"{page_dir}/{link}" if page_dir else link)
+            if not target:
+                continue
+            if target in _worker_file_set:
+                referenced.add(target)
+            else:
+                missing.append((page, link))
+    
+    return referenced, missing
+
+
+def get_merged_link(chm_name, file_path, suffix=''):
+    """生成指向合并CHM中文件的引用（file_path为"/"分隔的相对于output目录的路径）"""
+    return f"ms-its:{chm_name}::/{file_path.lstrip('/')}{suffix}"
+
+
+def init_rewrite_worker(file_chms):
+    """初始化页面引用改写工作进程"""
+    global _worker_file_chms
+    _worker_file_chms = file_chms
+
+
+def resolve_page_link(page_dir, page_chm, link):
+    """
+    按页面所在的CHM改写一个引用：指向其它CHM的改为ms-its形式，指向本CHM的ms-its引用改回相对路径
+    
+    返回：
+    - str: 改写后的引用，不需要改写时返回None
+    """
+    value = unescape(link).strip()
+    merged = MERGED_LINK_PATTERN.match(value)
+    if merged:
+        target_path, suffix = merged.group(2), merged.group(3)
+    elif not value or value.lower().startswith(EXTERNAL_LINK_PREFIXES):
+        return None
+    else:
+        split_index = min((index for index in (value.find('#'), value.find('?')) if index >= 0), default=len(value))
+        target_path, suffix = value[:split_index], value[split_index:]
+        target_path = f"{page_dir}/{target_path}" if page_dir else target_path
+    
+    target = _worker_file_chms.get(normalize_chm_path(target_path))
+    if target is None:
+        return None
+    file_path, chm_names = target
+    if page_chm not in chm_names:
+        return get_merged_link(chm_names[0], quote(file_path), suffix)
+    if merged:
+        return quote(posixpath.relpath(file_path, page_dir or '.')) + suffix
+    return None
+
+
+def rewrite_page_links(task):
+    """
+    改写一批HTML页面和数据脚本中跨CHM的引用（在工作进程中执行）
+    
+    参数：
+    - task: (output目录, [(页面或脚本相对路径, 所在CHM)])
+    
+    返回：
+    - int: 内容有变化的页面数
+    """
+    output_dir, pages = task
+    rewritten = 0
+    
+    for page, page_chm in pages:
+        page_file = os.path.join(output_dir, page)
+        try:
+            with open(page_file, 'r', encoding='utf-8', errors='surrogateescape', newline='') as f:
+                content = f.read()
+        except OSError:
+            continue
+        
+        page_dir = page.rsplit('/', 1)[0] if '/' in page else ''
+        link_pattern = SCRIPT_LINK_PATTERN if page.lower().endswith(SCRIPT_EXTENSIONS) else PAGE_LINK_PATTERN
+        
+        def replace_link(match):
+            new_link = resolve_page_link(page_dir, page_chm, match.group(1))
+            if new_link is None:
+                return match.group(0)
+            start, end = match.start(1) - match.start(), match.end(1) - match.start()
+            return match.group(0)[:start] + new_link + match.group(0)[end:]
+        
+        new_content = link_pattern.sub(replace_link, content)
+        if new_content != content:
+            with open(page_file, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+                f.write(new_content)
+            rewritten += 1
+    
+    return rewritten
+
+
+class CHMLinkChecker:
+    """
+    CHM编译前链接检查器
+    
+    以index.hhp的[FILES]为准，检查目录（index.hhc和template/*.txt）中的Local路径和
+    HTML页面中的href/src引用，在调用hhc.exe之前报告缺失和孤立的文件
+    """
+    
+    def __init__(self, output_folder, max_workers=None):
+        """初始化检查器"""
+        self.output_folder = Path(output_folder)
+        self.output_dir = self.output_folder / "output"
+        self.max_workers = max_workers or WorkerBudget.get_max_workers()
+    
+    def load_hhp_files(self, hhp_file_path):
+        """
+        读取HHP文件[FILES]部分的文件列表
+        
+        返回：
+        - list: 相对于output目录的文件路径（"/"分隔，保持原始大小写）
+        """
+        files = []
+        in_files_section = False
+        with open(hhp_file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('[') and line.endswith(']'):
+                    in_files_section = line.upper() == '[FILES]'
+                    continue
+                if in_files_section and line:
+                    files.append(line.replace('\\', '/'))
+        return files
+    
+    def collect_toc_entries(self):
+        """
+        收集目录文件中需要检查的Local路径（HTML实体已还原，跳过外部链接和CHM协议链接）
+        
+        返回：
+        - list: (目录文件名, Local值)
+        """
+        toc_files = [self.output_dir / "index.hhc"]
+        template_dir = self.output_folder / "template"
+        if template_dir.exists():
+            toc_files.extend(sorted(template_dir.glob("*.txt")))
+        
+        entries = []
+        for toc_file in toc_files:
+            if not toc_file.exists():
+                continue
+            content = FileUtils.read_file_with_encoding(toc_file)
+            for local_value in LOCAL_PARAM_PATTERN.findall(content):
+                local_value = unescape(local_value).strip()
+                if local_value and not local_value.lower().startswith(EXTERNAL_LINK_PREFIXES):
+                    entries.append((toc_file.name, local_value))
+        return entries
+    
+    def check_pages(self, pages, file_set):
+        """
+        并行检查HTML页面中的引用
+        
+        返回：
+        - tuple: (被引用的文件集合, [(页面, 缺失的引用)])
+        """
+        referenced = set()
+        missing = []
+        if not pages:
+            return referenced, missing
+        
+        chunk_size = max(1, min(200, len(pages) // (self.max_workers * 4) or 1))
+        tasks = [(str(self.output_dir), pages[i:i + chunk_size]) for i in range(0, len(pages), chunk_size)]
+        
+        if len(tasks) == 1 or self.max_workers <= 1:
+            init_link_worker(file_set)
+            results = [check_page_links(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_link_worker,
+                                     initargs=(file_set,)) as executor:
+                results = list(executor.map(check_page_links, tasks))
+        
+        for chunk_referenced, chunk_missing in results:
+            referenced.update(chunk_referenced)
+            missing.extend(chunk_missing)
+        return referenced, missing
+    
+    def check(self, hhp_file_path=None):
+        """
+        执行链接检查
+        
+        返回：
+        - dict: 检查结果，包含 toc_missing、page_missing、unlisted_files、orphaned_files 和 passed
+        """
+        hhp_file_path = Path(hhp_file_path or self.output_dir / "index.hhp")
+        hhp_files = self.load_hhp_files(hhp_file_path)
+        file_set = {normalize_chm_path(file_path) for file_path in hhp_files}
+        
+        # [FILES]中列出但磁盘上不存在的文件
+        unlisted_files = [file_path for file_path in hhp_files if not (self.output_dir / file_path).exists()]
+        
+        # 目录中的Local路径
+        toc_missing = []
+        referenced = set()
+        for toc_name, local_value in self.collect_toc_entries():
+            target = normalize_chm_path(local_value)
+            if target in file_set:
+                referenced.add(target)
+            else:
+                toc_missing.append((toc_name, local_value))
+        
+        # 页面中的href/src引用
+        pages = [file_path for file_path in hhp_files if file_path.lower().endswith(PAGE_EXTENSIONS)]
+        page_referenced, page_missing = self.check_pages(pages, file_set)
+        referenced.update(page_referenced)
+        
+        # 没有被目录和任何页面引用的页面
+        unlisted_set = set(unlisted_files)
+        orphaned_files = [
+            file_path for file_path in pages
+            if normalize_chm_path(file_path) not in referenced and file_path not in unlisted_set
+        ]
+        
+        return {
+            'total_files': len(hhp_files),
+            'total_pages': len(pages),
+            'toc_missing': toc_missing,
+            'page_missing': page_missing,
+            'unlisted_files': unlisted_files,
+            'orphaned_files': orphaned_files,
+            'passed': not toc_missing and not unlisted_files
+        }
+    
+    @staticmethod
+    def report(result):
+        """输出检查结果"""
+        def report_issues(title, issues, log):
+            if not issues:
+                return
+            log(f"{title}: {len(issues)}")
+            for issue in issues[:MAX_REPORTED_ISSUES]:
+                log(f"  - {' -> '.join(issue) if isinstance(issue, tuple) else issue}")
+            if len(issues) > MAX_REPORTED_ISSUES:
+                log(f"  ... 其余 {len(issues) - MAX_REPORTED_ISSUES} 项未显示")
+        
+        report_issues("目录项指向的文件不在[FILES]中", result['toc_missing'], Logger.error)
+        report_issues("[FILES]中的文件不存在", result['unlisted_files'], Logger.error)
+        report_issues("页面引用的本地文件不在[FILES]中", result['page_missing'], Logger.warning)
+        report_issues("没有被目录或页面引用的页面", result['orphaned_files'], Logger.warning)
+        Logger.info(f"链接检查: 文件 {result['total_files']} 个，页面 {result['total_pages']} 个")
+
+
+def read_hhp_sections(hhp_file_path):
+    """
+    按节读取HHP文件
+    
+    返回：
+    - dict: 节名称（如 "OPTIONS"、"FILES"）-> 行列表，保持原始顺序
+    """
+    sections = {}
+    current = None
+    content = FileUtils.read_file_with_encoding(hhp_file_path)
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('[') and stripped.endswith(']'):
+            current = stripped[1:-1].upper()
+            sections.setdefault(current, [])
+            continue
+        if current is not None and stripped:
+            sections[current].append(stripped)
+    return sections
+
+
+def write_hhp_sections(hhp_file_path, sections):
+    """按节写入HHP文件"""
+    content = "".join(
+        f"[{name}]\n" + "".join(f"{line}\n" for line in lines) + "\n"
+        for name, lines in sections.items()
+    )
+    return FileUtils.write_file(hhp_file_path, content)
+
+
+class CHMPartitionPlanner:
+    """
+    CHM分区编译规划器
+    
+    - 按顶层文档区域拆分index.hhp的[FILES]：pdf为一个分区，sub下每个一级目录为一个分区，
+      main、extra和output根目录下的文件留在主项目中
+    - 文件数超过max_part_files的分区按下一级目录顺序分桶
+    - sub/_shared下的共享静态资源加入每个sub分区
+    - 生成每个分区的index_<分区>.hhp，以及带[MERGE FILES]的index_master.hhp、index_master.hhc和index_master.hhk
+    - 把页面和数据脚本中指向其它CHM的引用改写为ms-its形式
+    """
+    
+    def __init__(self, output_dir, hhp_file_path=None, max_part_files=MAX_PART_FILES, max_workers=None):
+        """初始化规划器"""
+        self.output_dir = Path(output_dir)
+        self.hhp_file_path = Path(hhp_file_path or self.output_dir / "index.hhp")
+        self.max_part_files = max_part_files
+        self.max_workers = max_workers or WorkerBudget.get_max_workers()
+        self.sections = read_hhp_sections(self.hhp_file_path)
+    
+    @staticmethod
+    def get_area_key(file_path):
+        """获取文件所属的区域（"/"分隔的路径），主项目文件返回None"""
+        parts = file_path.replace('\\', '/').split('/')
+        if len(parts) == 1 or parts[0] in MASTER_AREAS:
+            return None
+        if parts[0] == "sub" and len(parts) > 2:
+            return f"sub/{parts[1]}"
+        return parts[0]
+    
+    @staticmethod
+    def get_part_name(area_key, bucket_index=None):
+        """区域路径转换为分区名称（只包含字母、数字和下划线）"""
+        name = re.sub(r'[^0-9A-Za-z]+', '_', area_key).strip('_') or "part"
+        return f"{name}_{bucket_index}" if bucket_index is not None else name
+    
+    def get_option(self, name, default=""):
+        """读取[OPTIONS]中的配置值"""
+        prefix = f"{name.lower()}="
+        for line in self.sections.get("OPTIONS", []):
+            if line.lower().startswith(prefix):
+                return line.split('=', 1)[1].strip()
+        return default
+    
+    def split_area(self, area_key, files):
+        """
+        文件数过多的区域按下一级目录顺序分桶（同一目录的文件不拆开）
+        
+        返回：
+        - list: 每个桶的文件列表
+        """
+        if len(files) <= self.max_part_files:
+            return [files]
+        
+        depth = len(area_key.split('/'))
+        groups = {}
+        for file_path in files:
+            parts = file_path.replace('\\', '/').split('/')
+            groups.setdefault('/'.join(parts[:depth + 1]), []).append(file_path)
+        
+        buckets = [[]]
+        for group_key in sorted(groups):
+            group_files = groups[group_key]
+            if buckets[-1] and len(buckets[-1]) + len(group_files) > self.max_part_files:
+                buckets.append([])
+            buckets[-1].extend(group_files)
+        return buckets
+    
+    def plan(self):
+        """
+        规划分区
+        
+        返回：
+        - dict: {'compiled_file', 'chm_name', 'master_files': [...], 'parts': [{'name', 'chm_name', 'compiled_file', 'files'}]}
+        """
+        compiled_file = self.get_option("Compiled file", "index.chm").replace('\\', '/')
+        chm_dir, chm_file_name = os.path.split(compiled_file)
+        chm_stem = os.path.splitext(chm_file_name)[0]
+        
+        master_files = []
+        shared_files = []
+        areas = {}
+        for file_path in self.sections.get("FILES", []):
+            area_key = self.get_area_key(file_path)
+            if area_key == SHARED_ASSET_AREA:
+                shared_files.append(file_path)
+            elif area_key is None:
+                master_files.append(file_path)
+            else:
+                areas.setdefault(area_key, []).append(file_path)
+        
+        parts = []
+        for area_key in sorted(areas):
+            buckets = self.split_area(area_key, areas[area_key])
+            for bucket_index, bucket_files in enumerate(buckets, 1):
+                part_name = self.get_part_name(area_key, bucket_index if len(buckets) > 1 else None)
+                chm_name = f"{chm_stem}_{part_name}.chm"
+                parts.append({
+                    'name': part_name,
+                    'chm_name': chm_name,
+                    'compiled_file': f"{chm_dir}/{chm_name}" if chm_dir else chm_name,
+                    'files': bucket_files + shared_files if area_key.startswith("sub/") else bucket_files
+                })
+        
+        if not any(area_key.startswith("sub/") for area_key in areas):
+            master_files.extend(shared_files)
+        
+        return {
+            'compiled_file': compiled_file,
+            'chm_name': chm_file_name,
+            'master_files': master_files,
+            'parts': parts
+        }
+    
+    @staticmethod
+    def get_file_chms(plan):
+        """
+        获取每个文件所在的CHM
+        
+        返回：
+        - dict: 标准化路径 -> (原始路径（"/"分隔）, CHM文件名元组)，共享资源属于多个CHM
+        """
+        file_chms = {}
+        projects = [(plan['chm_name'], plan['master_files'])]
+        projects.extend((part['chm_name'], part['files']) for part in plan['parts'])
+        for chm_name, files in projects:
+            for file_path in files:
+                file_path = file_path.replace('\\', '/')
+                _, chm_names = file_chms.setdefault(normalize_chm_path(file_path), (file_path, []))
+                chm_names.append(chm_name)
+        return {target: (file_path, tuple(chm_names)) for target, (file_path, chm_names) in file_chms.items()}
+    
+    @staticmethod
+    def rewrite_toc(toc_content, file_chms, master_chm):
+        """把目录或索引中指向子项目文件的Local路径改为"ms-its:子CHM::/路径"形式"""
+        def replace_local(match):
+            local_value = unescape(match.group(1)).strip()
+            target = file_chms.get(normalize_chm_path(local_value))
+            if target is None or master_chm in target[1]:
+                return match.group(0)
+            anchor = match.group(1)[match.group(1).index('#'):] if '#' in match.group(1) else ''
+            return f'<param name="Local" value="{get_merged_link(target[1][0], quote(target[0]), anchor)}"'
+        
+        return LOCAL_PARAM_PATTERN.sub(replace_local, toc_content)
+    
+    def rewrite_pages(self, plan):
+        """
+        并行改写所有页面和数据脚本中跨CHM的引用（内容没有变化时不写回，不影响子项目指纹）
+        
+        返回：
+        - int: 内容有变化的页面数
+        """
+        file_chms = self.get_file_chms(plan)
+        pages = [
+            (file_path, chm_names[0]) for file_path, chm_names in file_chms.values()
+            if file_path.lower().endswith(PAGE_EXTENSIONS + SCRIPT_EXTENSIONS)
+        ]
+        if not pages:
+            return 0
+        
+        chunk_size = max(1, min(200, len(pages) // (self.max_workers * 4) or 1))
+        tasks = [(str(self.output_dir), pages[i:i + chunk_size]) for i in range(0, len(pages), chunk_size)]
+        
+        if len(tasks) == 1 or self.max_workers <= 1:
+            init_rewrite_worker(file_chms)
+            return sum(rewrite_page_links(task) for task in tasks)
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=init_rewrite_worker,
+                                 initargs=(file_chms,)) as executor:
+            return sum(executor.map(rewrite_page_links, tasks))
+    
+    @staticmethod
+    def rename_project_files(line, renamed_files):
+        """替换HHP行中的目录和索引文件名（[OPTIONS]的"键=文件名"和[WINDOWS]中带引号的文件名）"""
+        key, separator, value = line.partition('=')
+        if value.strip() in renamed_files:
+            return f"{key}{separator}{renamed_files[value.strip()]}"
+        for source_file, master_file in renamed_files.items():
+            line = line.replace(f'"{source_file}"', f'"{master_file}"')
+        return line
+    
+    def write_projects(self, plan):
+        """
+        写入所有子项目和主项目
+        
+        返回：
+        - tuple: (子项目HHP路径列表, 主项目HHP路径)
+        """
+        title = self.get_option("Title", "")
+        language = self.get_option("Language", "0x409 English (United States)")
+        
+        part_hhp_files = []
+        for part in plan['parts']:
+            default_topic = next(
+                (file_path for file_path in part['files'] if file_path.lower().endswith(PAGE_EXTENSIONS)),
+                part['files'][0]
+            )
+            sections = {
+                "OPTIONS": [
+                    f"Compiled file={part['compiled_file']}",
+                    f"Default topic={default_topic}",
+                    f"Title={title} - {part['name']}",
+                    f"Language={language}",
+                    "Full-text search=No",
+                ],
+                "FILES": part['files'],
+            }
+            hhp_file = self.output_dir / f"index_{part['name']}.hhp"
+            write_hhp_sections(hhp_file, sections)
+            part_hhp_files.append(hhp_file)
+        
+        # 主项目目录和索引：子项目文件改为合并引用，[OPTIONS]和[WINDOWS]中的文件名同时替换
+        file_chms = self.get_file_chms(plan)
+        renamed_files = {}
+        for option, master_file in (("Contents file", "index_master.hhc"), ("Index file", "index_master.hhk")):
+            source_file = self.get_option(option)
+            if not source_file or not (self.output_dir / source_file).exists():
+                continue
+            content = FileUtils.read_file_with_encoding(self.output_dir / source_file)
+            FileUtils.write_file(self.output_dir / master_file, self.rewrite_toc(content, file_chms, plan['chm_name']))
+            renamed_files[source_file] = master_file
+        
+        master_sections = {}
+        for name, lines in self.sections.items():
+            if name in ("OPTIONS", "WINDOWS"):
+                master_sections[name] = [self.rename_project_files(line, renamed_files) for line in lines]
+            elif name == "FILES":
+                master_sections[name] = plan['master_files']
+            elif name != "MERGE FILES":
+                master_sections[name] = lines
+        master_sections["MERGE FILES"] = [part['chm_name'] for part in plan['parts']]
+        
+        master_hhp_file = self.output_dir / "index_master.hhp"
+        write_hhp_sections(master_hhp_file, master_sections)
+        return part_hhp_files, master_hhp_file
+    
+    def get_part_fingerprint(self, part):
+        """计算子项目的指纹（文件列表、大小和修改时间），用于判断是否需要重新编译"""
+        hash_obj = hashlib.md5()
+        for file_path in part['files']:
+            try:
+                stat = (self.output_dir / file_path).stat()
+                hash_obj.update(f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8'))
+            except OSError:
+                hash_obj.update(f"{file_path}|missing\n".encode('utf-8'))
+        return hash_obj.hexdigest()
+
+
 class HHCCHMGenerator(BaseGenerator):
     """
     基于 Microsoft hhc.exe 的 CHM文件生成器类
@@ -297,6 +941,43 @@ class HHCCHMGenerator(BaseGenerator):
         
         return True
     
+    def check_links(self, hhp_file_path):
+        """
+        编译前检查目录和页面引用
+        
+        返回：
+        - bool: 目录项和[FILES]文件都存在时返回True
+        """
+        try:
+            checker = CHMLinkChecker(self.output_folder)
+            result = checker.check(hhp_file_path)
+            checker.report(result)
+            return result['passed']
+        except Exception as e:
+            Logger.warning(f"链接检查出错，继续编译: {e}")
+            return True
+    
+    def restore_page_links(self, hhp_file_path):
+        """
+        单项目编译前恢复分区编译改写的页面引用
+        
+        存在子CHM指纹缓存（上次为分区编译）时，把页面和数据脚本中指向[FILES]文件的ms-its引用改回相对路径，并删除缓存
+        """
+        cache_file = CacheUtils.get_cache_dir(self.output_folder) / CHM_PART_CACHE_FILE
+        if not cache_file.exists():
+            return
+        
+        planner = CHMPartitionPlanner(Path(hhp_file_path).parent, hhp_file_path)
+        chm_name = os.path.basename(planner.get_option("Compiled file", "index.chm").replace('\\', '/'))
+        restored = planner.rewrite_pages({
+            'chm_name': chm_name,
+            'master_files': planner.sections.get("FILES", []),
+            'parts': []
+        })
+        if restored:
+            Logger.info(f"已恢复分区编译改写的页面引用: {restored} 个页面")
+        cache_file.unlink()
+    
     def find_hhc_exe(self):
         """
         查找项目中的 hhc.exe
@@ -304,10 +985,8 @@ class HHCCHMGenerator(BaseGenerator):
         返回：
         - str: hhc.exe的完整路径，如果未找到则返回None
         """
-        # 获取脚本所在目录，然后构建hhc.exe的绝对路径
-        script_dir = Path(__file__).parent
-        hhc_exe = script_dir / ".." / ".." / "tools" / "hhc" / "hhc.exe"
-        hhc_exe = hhc_exe.resolve()  # 转换为绝对路径
+        # 构建hhc.exe的绝对路径：项目根目录 -> tools -> hhc -> hhc.exe
+        hhc_exe = PathUtils.get_tool_path("hhc", "hhc.exe")
         
         if hhc_exe.exists():
             return str(hhc_exe)
@@ -341,6 +1020,14 @@ class HHCCHMGenerator(BaseGenerator):
         output_dir = self.output_folder / "output"
         hhp_file_path = output_dir / "index.hhp"
         
+        # 编译前链接检查：目录项缺失时直接失败，不再等待hhc.exe
+        if not self.check_links(hhp_file_path):
+            Logger.error("链接检查失败，跳过CHM生成")
+            return False, time.time() - start_time
+        
+        # 上次为分区编译时，先把页面中的跨CHM引用改回相对路径
+        self.restore_page_links(hhp_file_path)
+        
         # 额外调试信息：检查关键文件
         for file_name in ["index.hhp", "index.hhc", "index.hhk"]:
             file_path = output_dir / file_name
@@ -374,12 +1061,13 @@ class HHCCHMGenerator(BaseGenerator):
             # 执行 Microsoft HTML Help Compiler
             # 注意：hhc.exe 成功时返回代码为1，失败时返回代码为0或其他值
             # 捕获标准输出和错误输出用于调试
-            result = subprocess.run(
-                [hhc_path, os.path.basename(hhp_file_path)],
-                capture_output=True,
-                text=True,
-                cwd=output_dir
-            )
+            with Tracer.span(Path(hhp_file_path).name, "hhc"):
+                result = subprocess.run(
+                    [hhc_path, os.path.basename(hhp_file_path)],
+                    capture_output=True,
+                    text=True,
+                    cwd=output_dir
+                )
             
             return_code = result.returncode
             
@@ -411,6 +1099,104 @@ class HHCCHMGenerator(BaseGenerator):
             # 恢复原始目录
             os.chdir(original_dir)
     
+    def run_hhc(self, hhc_path, hhp_file_path):
+        """
+        执行hhc.exe编译单个HHP项目
+        
+        返回：
+        - bool: 是否成功（hhc.exe成功时返回代码为1）
+        """
+        with Tracer.span(Path(hhp_file_path).name, "hhc"):
+            result = subprocess.run(
+                [hhc_path, os.path.basename(hhp_file_path)],
+                capture_output=True,
+                text=True,
+                cwd=Path(hhp_file_path).parent
+            )
+        if result.stderr:
+            Logger.warning(f"hhc.exe 错误输出 ({Path(hhp_file_path).name}):\n{result.stderr}")
+        if result.returncode != 1:
+            Logger.error(f"编译失败: {Path(hhp_file_path).name}，返回代码: {result.returncode}")
+            return False
+        return True
+    
+    def generate_chm_partitioned(self, hhc_path=None):
+        """
+        分区编译CHM：子项目并行编译，主项目通过[MERGE FILES]合并
+        
+        参数：
+        - hhc_path: hhc.exe的路径，如果为None则自动查找
+        
+        返回：
+        - tuple: (生成是否成功, 编译时间)
+        """
+        start_time = time.time()
+        
+        # 前置检查与单项目编译一致
+        if not self.check_all_projects_templates():
+            Logger.error("template文件UL标签平衡性检查失败，跳过CHM生成")
+            return False, 0
+        if not self.check_required_files():
+            return False, 0
+        
+        output_dir = self.output_folder / "output"
+        hhp_file_path = output_dir / "index.hhp"
+        if not self.check_links(hhp_file_path):
+            Logger.error("链接检查失败，跳过CHM生成")
+            return False, time.time() - start_time
+        
+        if not self.update_hhp_file(hhp_file_path, self.get_chip_series_name()):
+            return False, 0
+        
+        if hhc_path is None:
+            hhc_path = self.find_hhc_exe()
+            if hhc_path is None:
+                return False, 0
+        
+        try:
+            # 规划分区并写入子项目和主项目
+            planner = CHMPartitionPlanner(output_dir, hhp_file_path)
+            plan = planner.plan()
+            part_hhp_files, master_hhp_file = planner.write_projects(plan)
+            rewritten = planner.rewrite_pages(plan)
+            if rewritten:
+                Logger.info(f"已改写跨CHM的页面引用: {rewritten} 个页面")
+            
+            # 只重新编译文件有变化的子项目
+            cache_file = CacheUtils.get_cache_dir(self.output_folder) / CHM_PART_CACHE_FILE
+            part_cache = JsonUtils.load_json(cache_file) if cache_file.exists() else {}
+            
+            pending = []
+            for part, part_hhp_file in zip(plan['parts'], part_hhp_files):
+                fingerprint = planner.get_part_fingerprint(part)
+                part_chm = (output_dir / part['compiled_file']).resolve()
+                if part_cache.get(part['name']) == fingerprint and part_chm.exists():
+                    continue
+                pending.append((part, part_hhp_file, fingerprint))
+            
+            Logger.info(f"CHM分区: {len(plan['parts'])} 个子项目，需要编译 {len(pending)} 个")
+            
+            # 子项目和主项目并行编译（合并在打开CHM时进行，编译时不依赖子CHM）
+            tasks = [part_hhp_file for _, part_hhp_file, _ in pending] + [master_hhp_file]
+            with ThreadPoolExecutor(max_workers=WorkerBudget.get_max_workers(len(tasks))) as executor:
+                results = list(Progress.track(
+                    "hhc", executor.map(lambda hhp_file: self.run_hhc(hhc_path, hhp_file), tasks), total=len(tasks)
+                ))
+            
+            for (part, _, fingerprint), success in zip(pending, results):
+                if success:
+                    part_cache[part['name']] = fingerprint
+                else:
+                    part_cache.pop(part['name'], None)
+            JsonUtils.save_json(part_cache, cache_file)
+            
+            return all(results), time.time() - start_time
+            
+        except Exception as e:
+            total_time = time.time() - start_time
+            Logger.error(f"分区编译CHM时出错: {e}")
+            return False, total_time
+    
     def verify_chm_file(self):
         """验证生成的CHM文件"""
         chip_series = self.get_chip_series_name()
@@ -428,8 +1214,11 @@ class HHCCHMGenerator(BaseGenerator):
         # 记录总开始时间
         total_start_time = time.time()
         
-        # 生成CHM文件
-        success, compilation_time = self.generate_chm(hhc_path)
+        # 生成CHM文件（芯片配置Chm_Partition为true时分区编译）
+        if self.chip_config.get('Chm_Partition', False):
+            success, compilation_time = self.generate_chm_partitioned(hhc_path)
+        else:
+            success, compilation_time = self.generate_chm(hhc_path)
         
         # 计算总时间
         total_time = time.time() - total_start_time
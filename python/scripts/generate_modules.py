@@ -6,20 +6,83 @@ generate_modules.py - 自动生成doxygen模块的Markdown文件
 """
 
 import json
-import pandas as pd
 import sys
-import shutil
 from pathlib import Path
 
+# numpy和pandas在用到的函数中导入（与WorkbookCache.read_excel一致），参数错误等提前退出时不加载
+
 # 添加当前目录到Python路径
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
 from common_utils import (
-    ArgumentParser, timing_decorator, Logger
+    ArgumentParser, timing_decorator, Logger, CacheUtils, WorkbookCache, FileUtils
 )
 
+# 模块页面共用的样式表（与图标一起从template/assets复制，由每个页面引用）
+MODULE_STYLESHEET = "modules.css"
+
+# 复制到doxygen/main/assets的模块资源文件
+MODULE_ASSET_FILES = ["pdf.png", "pack.png", "files.png", MODULE_STYLESHEET]
+
+class ModuleIndex:
+    """
+    path.xlsx数据表的一次性索引
+    
+    - (type, keyword)、type、keyword -> 行位置
+    
+    所有位置均为升序的行号数组，选取结果保持数据表中的原始顺序
+    """
+    
+    def __init__(self, data):
+        """根据数据表构建索引"""
+        import numpy as np
+        import pandas as pd
+        
+        self.data = data
+        self.all_positions = np.arange(len(data))
+        
+        if data.empty:
+            self.by_type_keyword = {}
+            self.by_type = {}
+            self.by_keyword = {}
+            return
+        
+        type_column = data.iloc[:, 1].reset_index(drop=True)
+        keyword_column = data.iloc[:, 2].reset_index(drop=True)
+        
+        frame = pd.DataFrame({"type": type_column, "keyword": keyword_column})
+        self.by_type_keyword = frame.groupby(["type", "keyword"], sort=False).indices
+        self.by_type = frame.groupby("type", sort=False).indices
+        self.by_keyword = frame.groupby("keyword", sort=False).indices
+    
+    def module_positions(self, markdown_info):
+        """获取模块（type + keywords）对应的行位置"""
+        import numpy as np
+        
+        target_type = markdown_info.get("type", "")
+        keywords = list(dict.fromkeys(markdown_info.get("keywords", [])))
+        
+        if target_type and keywords:
+            parts = [self.by_type_keyword.get((target_type, keyword)) for keyword in keywords]
+        elif target_type:
+            parts = [self.by_type.get(target_type)]
+        elif keywords:
+            parts = [self.by_keyword.get(keyword) for keyword in keywords]
+        else:
+            return self.all_positions
+        
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return np.array([], dtype=int)
+        return np.unique(np.concatenate(parts))
+    
+    def select(self, positions):
+        """按行位置选取数据（保持原始顺序和原始索引）"""
+        return self.data.iloc[positions]
+
+
 class DoxygenGenerator:
     """
     Doxygen模块生成器类
@@ -41,8 +104,8 @@ class DoxygenGenerator:
         # 项目根目录（假设脚本在python/scripts目录下）
         self.work_dir = Path(__file__).parent.parent.parent
         
-        # Excel文件路径
-        self.excel_file = self.work_dir / "config" / "path.xlsx"
+        # Excel文件路径（芯片配置Path_Excel可指定其他数据表，如基准测试的合成数据表）
+        self.excel_file = Path(chip_config.get('Path_Excel') or self.work_dir / "config" / "path.xlsx")
         
         # 基础配置文件路径
         self.base_config_file = self.work_dir / "config" / "base.json"
@@ -51,12 +114,15 @@ class DoxygenGenerator:
         self.excel_data = None
         self.base_config = None
         
+        # 数据表索引（首次使用时构建）
+        self.module_index = None
+        
     def load_excel(self):
-        """加载Excel数据"""
+        """加载Excel数据（使用output_folder/cache下的编译缓存，工作簿变化时自动刷新）"""
         if not self.excel_file.exists():
             raise FileNotFoundError(f"Excel文件不存在: {self.excel_file}")
         
-        self.excel_data = pd.read_excel(self.excel_file)
+        self.excel_data = WorkbookCache.read_excel(self.excel_file, CacheUtils.get_shared_cache_dir(self.output_folder))
     
     def load_base_config(self):
         """加载基础配置文件"""
@@ -66,11 +132,10 @@ class DoxygenGenerator:
         with open(self.base_config_file, 'r', encoding='utf-8') as f:
             self.base_config = json.load(f)
     
-    def filter_by_chip_series(self, chip_name):
-        """根据芯片系列过滤数据"""
+    def chip_series_mask(self, chip_name):
+        """获取芯片系列对应行的布尔掩码"""
         if chip_name == "Common_Platform":
-            result = self.excel_data[self.excel_data.iloc[:, 0] == "Common_Platform"]
-            return result
+            return self.excel_data.iloc[:, 0] == "Common_Platform"
         
         # 获取芯片版本信息
         chip_version = self.chip_config.get('chipVersion', '')
@@ -79,102 +144,69 @@ class DoxygenGenerator:
         # 去除结尾所有的'x'来获取前缀
         prefix = chip_name.rstrip('x')
         
-        final_filtered = []
+        data = self.excel_data
+        series_names = data.iloc[:, 0].astype(str)
         
-        for _, row in self.excel_data.iterrows():
-            series_name = str(row.iloc[0])
-            
-            # 条件1：A列包含Common_Platform，直接满足不需要往后走了
-            if series_name == "Common_Platform":
-                final_filtered.append(row)
-                continue
-            
-            # 条件2：A列不包含Common_Platform，判断A列包含chip_name.rstrip('x')的内容
-            if prefix in series_name:
-                final_filtered.append(row)
-                continue
-            
-            # 条件3：G列或者I列包含{chip_name}_V{chip_version}的内容
-            if version_pattern:
-                g_column_value = str(row.iloc[6]) if len(row) > 6 and pd.notna(row.iloc[6]) else ""
-                i_column_value = str(row.iloc[8]) if len(row) > 8 and pd.notna(row.iloc[8]) else ""
-                
-                if (version_pattern in g_column_value or version_pattern in i_column_value):
-                    final_filtered.append(row)
+        # 条件1：A列是Common_Platform
+        mask = series_names == "Common_Platform"
+        
+        # 条件2：A列包含chip_name.rstrip('x')的内容
+        mask |= series_names.str.contains(prefix, regex=False, na=False)
         
-        result_df = pd.DataFrame(final_filtered) if final_filtered else pd.DataFrame()
+        # 条件3：G列或者I列包含{chip_name}_V{chip_version}的内容
+        if version_pattern:
+            for column_index in (6, 8):
+                if data.shape[1] > column_index:
+                    column = data.iloc[:, column_index]
+                    mask |= column.notna() & column.astype(str).str.contains(version_pattern, regex=False, na=False)
         
-        return result_df
+        return mask
     
-    def filter_by_project_path(self, project_folder_name: str):
-        """根据项目文件夹名称在G列或I列中匹配路径"""
-        if not self.excel_data.empty:
-            # 构建匹配条件：
-            # 1. A列是Common_Platform（始终保留）
-            # 2. G列包含项目文件夹名称路径
-            # 3. 如果G列不存在或为空，则使用I列匹配
-            mask = (
-                (self.excel_data.iloc[:, 0] == "Common_Platform") |  # A列是Common_Platform
-                (self.excel_data.iloc[:, 6].str.contains(f"/{project_folder_name}/", na=False)) |  # G列包含项目路径
-                (
-                    # 如果G列不存在或为空，检查I列
-                    (self.excel_data.iloc[:, 6].isna() | (self.excel_data.iloc[:, 6] == "")) &
-                    (self.excel_data.iloc[:, 8].str.contains(f"/{project_folder_name}/", na=False))  # I列包含项目路径
-                )
-            )
-            return self.excel_data[mask]
-        return pd.DataFrame()
+    def get_module_index(self):
+        """获取数据表索引（只构建一次）"""
+        if self.module_index is None:
+            self.module_index = ModuleIndex(self.excel_data)
+        return self.module_index
     
-    def filter_by_type_keywords(self, data, markdown_info):
-        """根据type和keywords过滤数据"""
-        if data.empty:
-            return data
-            
-        # 根据type过滤B列
-        target_type = markdown_info.get("type", "")
-        if target_type:
-            data = data[data.iloc[:, 1] == target_type]
-            
-        # 根据keywords过滤C列
-        keywords = markdown_info.get("keywords", [])
-        if keywords:
-            mask = data.iloc[:, 2].isin(keywords)
-            data = data[mask]
-            
-        return data
+    def select_module_data(self, chip_positions, markdown_info):
+        """
+        选取并排序芯片系列中属于某个模块（type + keywords）的数据
+        
+        参数：
+        - chip_positions: 芯片系列对应的行位置（升序）
+        - markdown_info: 模块配置
+        """
+        import numpy as np
+        
+        index = self.get_module_index()
+        positions = np.intersect1d(chip_positions, index.module_positions(markdown_info), assume_unique=True)
+        return self.sort_data_by_keywords_and_platform(index.select(positions), markdown_info)
     
     def sort_data_by_keywords_and_platform(self, data, markdown_info):
         """根据keywords顺序和Common_Platform排序数据"""
         if data.empty:
             return data
-            
+        
+        import numpy as np
+        import pandas as pd
+        
         keywords = markdown_info.get("keywords", [])
         
-        def get_sort_key(row):
-            """获取排序键值"""
-            # 获取列名列表
-            columns = list(data.columns)
-            series_name = str(row[columns[0]])  # 第一列：产品系列
-            keyword_value = str(row[columns[2]])  # 第三列：name/keywords
-            
-            # Common_Platform放在最后
-            if series_name == "Common_Platform":
-                return (999, 999)
-            
-            # 按照keywords的顺序排序
-            try:
-                keyword_index = keywords.index(keyword_value)
-                return (0, keyword_index)
-            except ValueError:
-                # 如果keyword不在keywords中，放在最后
-                return (1, 999)
-        
-        # 转换为列表进行排序
-        data_list = data.to_dict('records')
-        data_list.sort(key=get_sort_key)
-        
-        # 转换回DataFrame
-        return pd.DataFrame(data_list)
+        # 排序键1：keywords中的行为0，不在keywords中的为1，Common_Platform放在最后为999
+        series_names = data.iloc[:, 0].astype(str)
+        keyword_values = data.iloc[:, 2].astype(str)
+        
+        # 排序键2：按照keywords的顺序（分类编码，不在keywords中的编码为-1）
+        keyword_order = pd.Categorical(keyword_values, categories=list(dict.fromkeys(keywords)), ordered=True).codes
+        in_keywords = keyword_order >= 0
+        
+        is_platform = (series_names == "Common_Platform").to_numpy()
+        primary_key = np.where(is_platform, 999, np.where(in_keywords, 0, 1))
+        secondary_key = np.where(is_platform | ~in_keywords, 999, keyword_order)
+        
+        # 稳定排序，与原先的list.sort行为一致
+        order = np.lexsort((secondary_key, primary_key))
+        return data.iloc[order].reset_index(drop=True)
     
     def convert_filename_to_page_id(self, filename):
         """将文件名转换为page id格式"""
@@ -225,10 +257,9 @@ class DoxygenGenerator:
         
         return icon_configs.get(file_type, icon_configs["other"])
     
-    def copy_assets_to_output(self):
-        """将template/assets下的图片复制到输出目录的assets目录"""
+    def copy_module_assets(self, output_assets_dir: Path):
+        """将template/assets下的模块资源（图标和样式表）复制到指定的assets目录"""
         template_assets_dir = self.work_dir / "template" / "assets"
-        output_assets_dir = self.output_folder / "doxygen" / "main" / "assets"
         
         if not template_assets_dir.exists():
             return False
@@ -236,47 +267,89 @@ class DoxygenGenerator:
         # 确保输出assets目录存在
         output_assets_dir.mkdir(parents=True, exist_ok=True)
         
-        # 复制图片文件
-        image_files = ["pdf.png", "pack.png", "files.png"]
+        # 复制资源文件
         copied_count = 0
         
-        for image_file in image_files:
-            src_file = template_assets_dir / image_file
-            dst_file = output_assets_dir / image_file
+        for asset_file in MODULE_ASSET_FILES:
+            src_file = template_assets_dir / asset_file
+            dst_file = output_assets_dir / asset_file
             
             if src_file.exists():
-                shutil.copy2(src_file, dst_file)
+                FileUtils.copy_file_if_changed(src_file, dst_file)
                 copied_count += 1
         
         return copied_count > 0
     
-    def copy_assets_to_project(self, project_path: Path):
-        """将template/assets下的图片复制到项目的assets目录"""
-        template_assets_dir = self.work_dir / "template" / "assets"
-        project_assets_dir = project_path / "doxygen" / "main" / "assets"
+    def copy_assets_to_output(self):
+        """将template/assets下的资源复制到输出目录的assets目录"""
+        return self.copy_module_assets(self.output_folder / "doxygen" / "main" / "assets")
+    
+    def prepare_file_rows(self, data, base_config):
+        """
+        预处理文件列表行（与语言无关的部分），中英文两个版本共用
         
-        if not template_assets_dir.exists():
-            return False
+        参数：
+        - data: 过滤排序后的模块数据
+        - base_config: 基础配置
         
-        # 确保项目assets目录存在
-        project_assets_dir.mkdir(parents=True, exist_ok=True)
+        返回：
+        - list: 每行的标题、名称、简介、版本、G/I列链接、文件类型和图标信息
+        """
+        import pandas as pd
         
-        # 复制图片文件
-        image_files = ["pdf.png", "pack.png", "files.png"]
-        copied_count = 0
+        # 获取下载URL前缀
+        base_url = base_config.get("Md_DownloadUrl", "")
         
-        for image_file in image_files:
-            src_file = template_assets_dir / image_file
-            dst_file = project_assets_dir / image_file
+        file_rows = []
+        for row in data.itertuples(index=False):
+            file_title = str(row[3]) if len(row) > 3 else ""
+            file_name = str(row[2]) if len(row) > 2 else ""  # C列：name值
+            file_desc = str(row[4]) if len(row) > 4 else ""
+            file_version = str(row[5]) if len(row) > 5 else ""
             
-            if src_file.exists():
-                shutil.copy2(src_file, dst_file)
-                copied_count += 1
-        
-        return copied_count > 0
+            # 获取G列和I列的值
+            g_column_value = str(row[6]) if len(row) > 6 and pd.notna(row[6]) else ""
+            i_column_value = str(row[8]) if len(row) > 8 and pd.notna(row[8]) else ""
+            
+            # 统一判断文件类型（优先使用G列，G列没有就用I列）
+            if g_column_value and g_column_value != "nan":
+                # 优先从G列读取链接判断文件类型
+                if g_column_value.startswith('/'):
+                    temp_full_href = base_url + g_column_value
+                else:
+                    temp_full_href = g_column_value
+                file_type = self.get_file_type(temp_full_href)
+            elif i_column_value and i_column_value != "nan":
+                # G列没有，从I列读取链接判断文件类型
+                if i_column_value.startswith('/'):
+                    temp_full_href = base_url + i_column_value
+                else:
+                    temp_full_href = i_column_value
+                file_type = self.get_file_type(temp_full_href)
+            else:
+                # 如果G列和I列都没有链接，才根据文件名判断
+                if file_name.lower().endswith('.pdf'):
+                    file_type = "pdf"
+                elif file_name.lower().endswith('.pack'):
+                    file_type = "pack"
+                else:
+                    file_type = "other"
+            
+            file_rows.append({
+                "title": file_title,
+                "name": file_name,
+                "desc": file_desc,
+                "version": file_version,
+                "g_column": g_column_value,
+                "i_column": i_column_value,
+                "type": file_type,
+                "icon": self.get_file_icon(file_type),
+            })
+        
+        return file_rows
     
-    def generate_markdown_content(self, data, markdown_info, language, base_config):
-        """生成Markdown内容"""
+    def render_markdown_content(self, file_rows, markdown_info, language, base_config):
+        """根据预处理后的文件列表行生成指定语言的Markdown内容"""
         lang_info = markdown_info.get(language, {})
         title = lang_info.get("title", "")
         overview = lang_info.get("overview", "")
@@ -304,7 +377,7 @@ class DoxygenGenerator:
         i_column_count = 0
         
         # 生成文件列表
-        if data.empty:
+        if not file_rows:
             # 没有数据时的提示信息
             if language == "cn":
                 content += """<p style="text-align: center; color: #666; font-style: italic;">暂无中文文档</p>"""
@@ -316,43 +389,19 @@ class DoxygenGenerator:
 """
             valid_rows = 0  # 记录有效的行数
             
-            for _, row in data.iterrows():
-                file_title = str(row.iloc[3]) if len(row) > 3 else ""
-                file_name = str(row.iloc[2]) if len(row) > 2 else ""  # C列：name值
-                file_desc = str(row.iloc[4]) if len(row) > 4 else ""
-                file_version = str(row.iloc[5]) if len(row) > 5 else ""
+            for file_row in file_rows:
+                file_title = file_row["title"]
+                file_name = file_row["name"]
+                file_desc = file_row["desc"]
+                file_version = file_row["version"]
+                g_column_value = file_row["g_column"]
+                i_column_value = file_row["i_column"]
+                file_type = file_row["type"]
+                icon_info = file_row["icon"]
                 
                 # 获取文件链接 - 根据文件类型和语言调整获取逻辑
                 file_href = ""
                 
-                # 获取G列和I列的值
-                g_column_value = str(row.iloc[6]) if len(row) > 6 and pd.notna(row.iloc[6]) else ""
-                i_column_value = str(row.iloc[8]) if len(row) > 8 and pd.notna(row.iloc[8]) else ""
-                
-                # 统一判断文件类型（优先使用G列，G列没有就用I列）
-                if g_column_value and g_column_value != "nan":
-                    # 优先从G列读取链接判断文件类型
-                    if g_column_value.startswith('/'):
-                        temp_full_href = base_url + g_column_value
-                    else:
-                        temp_full_href = g_column_value
-                    file_type = self.get_file_type(temp_full_href)
-                elif i_column_value and i_column_value != "nan":
-                    # G列没有，从I列读取链接判断文件类型
-                    if i_column_value.startswith('/'):
-                        temp_full_href = base_url + i_column_value
-                    else:
-                        temp_full_href = i_column_value
-                    file_type = self.get_file_type(temp_full_href)
-                else:
-                    # 如果G列和I列都没有链接，才根据文件名判断
-                    if file_name.lower().endswith('.pdf'):
-                        file_type = "pdf"
-                    elif file_name.lower().endswith('.pack'):
-                        file_type = "pack"
-                    else:
-                        file_type = "other"
-                
                 # 根据文件类型和语言获取链接
                 if file_type == "pdf":
                     # PDF文件：严格按照语言取链接，如果为空则不生成可点击链接
@@ -392,8 +441,6 @@ class DoxygenGenerator:
                 else:
                     full_href = ""
                 
-                icon_info = self.get_file_icon(file_type)
-                
                 # 根据是否有链接决定生成链接还是纯文本
                 if full_href and full_href != "nan":
                     # 有链接，生成可点击的链接
@@ -434,66 +481,11 @@ class DoxygenGenerator:
                 content += """</table>
 """
         
-        content += """
+        content += f"""
 
 </div>
 
-<style>
-.file-type-pdf .file-icon-pdf {
-    filter: hue-rotate(0deg);
-}
-
-.file-type-pack .file-icon-pack {
-    filter: hue-rotate(240deg);
-}
-
-.file-type-other .file-icon-other {
-    filter: hue-rotate(180deg);
-}
-
-.file-link-pdf {
-    color: #d32f2f !important;
-    font-weight: bold;
-}
-
-.file-link-pack {
-    color: #388e3c !important;
-    font-weight: bold;
-}
-
-.file-link-other {
-    color: #7b1fa2 !important;
-    font-weight: bold;
-}
-
-.file-type-pdf {
-    background-color: rgba(211, 47, 47, 0.05);
-}
-
-.file-type-pack {
-    background-color: rgba(56, 142, 60, 0.05);
-}
-
-.file-type-other {
-    background-color: rgba(123, 31, 162, 0.05);
-}
-
-.file-row:hover {
-    background-color: rgba(0, 0, 0, 0.05) !important;
-    transform: translateX(2px);
-    transition: all 0.2s ease;
-}
-
-.file-title-no-link {
-    color: #999 !important;
-    font-style: italic;
-    cursor: not-allowed;
-}
-
-.file-row.no-link:hover {
-    transform: none;
-}
-</style>
+<link href="./{MODULE_STYLESHEET}" rel="stylesheet" type="text/css" />
 
 \\endhtmlonly
 """
@@ -505,17 +497,13 @@ class DoxygenGenerator:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
     
-    def ensure_project_output_dir(self, project_path: Path, module_key: str, language: str) -> Path:
-        """确保项目输出目录存在"""
-        output_dir = project_path / "doxygen" / "main" / "modules" / language
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
-    
     def generate_modules(self):
         """生成模块文件"""
         try:
-            # 根据芯片系列过滤数据
-            filtered_data = self.filter_by_chip_series(self.project_name)
+            import numpy as np
+            
+            # 芯片系列对应的行位置，每个模块的行位置从数据表索引中一次取出后求交集
+            chip_positions = np.flatnonzero(self.chip_series_mask(self.project_name).to_numpy())
             
             # 复制资源文件到输出目录
             self.copy_assets_to_output()
@@ -528,24 +516,12 @@ class DoxygenGenerator:
                 # 添加filename字段用于page id生成
                 module_info['filename'] = module_key
                 
-                # 进一步过滤数据
-                module_data = self.filter_by_type_keywords(filtered_data, module_info)
+                # 选取模块数据并排序
+                module_data = self.select_module_data(chip_positions, module_info)
                 
-                # 对数据进行排序
-                module_data = self.sort_data_by_keywords_and_platform(module_data, module_info)
-                
-                # 生成英文和中文版本
-                for lang in ['en', 'cn']:
-                    # 确保输出目录存在
-                    output_dir = self.ensure_output_dir(module_key, lang)
-                    output_file = output_dir / f"{module_key}.md"
-                    
-                    # 生成内容
-                    content, g_count, i_count = self.generate_markdown_content(module_data, module_info, lang, self.base_config)
-                    
-                    # 写入文件
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                # 生成英文和中文版本（行数据只处理一次）
+                self.write_module_markdown(module_data, module_key, module_info,
+                                           lambda lang: self.ensure_output_dir(module_key, lang))
             
             return True
             
@@ -553,57 +529,39 @@ class DoxygenGenerator:
             Logger.error(f"生成模块文件时出错: {e}")
             return False
     
-    def generate_project_modules(self, project_name: str, project_path: Path):
-        """为指定项目生成模块文件"""
-        try:
-            # 从项目路径提取项目文件夹名称
-            project_folder_name = project_path.name
-            
-            # 复制资源文件到项目目录
-            self.copy_assets_to_project(project_path)
+    def write_module_markdown(self, module_data, module_key, module_info, get_output_dir):
+        """
+        写入单个模块的英文和中文Markdown文件，两种语言共用同一份预处理行数据
+        
+        参数：
+        - module_data: 过滤排序后的模块数据
+        - module_key: 模块名称（文件名）
+        - module_info: 模块配置
+        - get_output_dir: 根据语言返回输出目录的函数
+        
+        返回：
+        - tuple: (G列链接数量, I列链接数量)
+        """
+        file_rows = self.prepare_file_rows(module_data, self.base_config)
+        
+        total_g_column_count = 0
+        total_i_column_count = 0
+        
+        for lang in ['en', 'cn']:
+            output_file = get_output_dir(lang) / f"{module_key}.md"
             
-            # 使用路径匹配逻辑，在G列中查找项目路径
-            filtered_data = self.filter_by_project_path(project_folder_name)
+            # 生成内容
+            content, g_count, i_count = self.render_markdown_content(file_rows, module_info, lang, self.base_config)
             
-            markdown_info = self.base_config.get("MarkDown_Info", {})
+            # 累计统计
+            total_g_column_count += g_count
+            total_i_column_count += i_count
             
-            # 为每个模块生成文件
-            for module_key, module_info in markdown_info.items():
-                # 添加filename字段用于page id生成
-                module_info['filename'] = module_key
-                
-                # 进一步过滤数据
-                module_data = self.filter_by_type_keywords(filtered_data, module_info)
-                
-                # 对数据进行排序
-                module_data = self.sort_data_by_keywords_and_platform(module_data, module_info)
-                
-                # 统计链接获取情况
-                total_g_column_count = 0
-                total_i_column_count = 0
-                
-                # 生成英文和中文版本
-                for lang in ['en', 'cn']:
-                    # 确保项目特定的输出目录存在
-                    output_dir = self.ensure_project_output_dir(project_path, module_key, lang)
-                    output_file = output_dir / f"{module_key}.md"
-                    
-                    # 生成内容
-                    content, g_count, i_count = self.generate_markdown_content(module_data, module_info, lang, self.base_config)
-                    
-                    # 累计统计
-                    total_g_column_count += g_count
-                    total_i_column_count += i_count
-                    
-                    # 写入文件
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
-            
-            return True
-            
-        except Exception as e:
-            Logger.error(f"为项目 {project_name} 生成模块文件时出错: {e}")
-            return False
+            # 写入文件
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+        
+        return total_g_column_count, total_i_column_count
     
     def run(self):
         """运行生成器"""
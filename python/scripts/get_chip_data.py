@@ -6,15 +6,17 @@ get_chip_data.py - 国民技术芯片信息爬取脚本
 """
 
 import os
-import requests
 import re
 import sys
 import copy
 import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
 
+# requests和bs4在用到的函数中导入，参数错误等提前退出时不加载
 
 # 添加当前目录到Python路径
 current_dir = Path(__file__).parent
@@ -23,9 +25,527 @@ if str(current_dir) not in sys.path:
 
 from common_utils import (
     ArgumentParser, timing_decorator, Logger, ConfigManager, 
-    PathUtils, FileUtils, BaseGenerator
+    PathUtils, FileUtils, JsonUtils, BaseGenerator, CacheUtils
 )
 
+# HTTP缓存目录（位于 output_folder/cache 下）
+HTTP_CACHE_DIR_NAME = "http"
+
+# 每个主机的连接池大小
+HTTP_POOL_SIZE = 8
+
+# 英文官网需要先访问主页建立Cookie
+EN_SITE_HOME_URL = "https://nsing.com.sg/"
+
+# 录制/回放夹具目录（位于 output_folder/cache 下，可通过Http_Fixture_Dir指定）
+HTTP_FIXTURE_DIR_NAME = "http_fixtures"
+
+# 夹具存储格式版本，格式变化时递增，旧版本的夹具不能回放
+HTTP_FIXTURE_VERSION = 1
+
+# HTTP模式：live（访问网络）、record（访问网络并录制）、replay（只从夹具回放）
+HTTP_MODES = ("live", "record", "replay")
+
+# 图片并发下载线程数（不超过每个主机的连接池大小）
+IMAGE_DOWNLOAD_WORKERS = HTTP_POOL_SIZE
+
+# 图片下载清单（位于 output_folder/json 下，供update_doxyfile_config读取）
+IMAGE_MANIFEST_FILE = "chip_images.json"
+
+# 图片请求头
+IMAGE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+}
+
+
+class HttpCacheMissError(Exception):
+    """不访问网络时（离线模式）请求的URL没有缓存，重试也不会成功"""
+
+
+class HttpFixtureMissingError(HttpCacheMissError):
+    """回放模式下夹具中没有请求的URL"""
+
+
+class HttpCache:
+    """
+    磁盘HTTP缓存
+    
+    每个URL保存两个文件：<md5>.body（响应体）和 <md5>.json（URL、ETag、Last-Modified等校验信息），
+    下次请求时携带If-None-Match/If-Modified-Since，服务器返回304时直接使用缓存的响应体
+    """
+    
+    def __init__(self, cache_dir):
+        """初始化缓存目录"""
+        self.cache_dir = Path(cache_dir)
+    
+    def get_entry_paths(self, url):
+        """获取URL对应的响应体文件和元数据文件路径"""
+        key = hashlib.md5(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+    
+    def load(self, url):
+        """
+        读取缓存
+        
+        返回：
+        - tuple: (元数据, 响应体)，未命中时返回 (None, None)
+        """
+        body_path, meta_path = self.get_entry_paths(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None, None
+        
+        try:
+            meta = JsonUtils.load_json(meta_path)
+            if meta.get("url") != url:
+                return None, None
+            return meta, body_path.read_bytes()
+        except Exception as e:
+            Logger.warning(f"HTTP缓存无效，将重新下载: {url}, 错误: {e}")
+            return None, None
+    
+    def store(self, url, response):
+        """保存200响应的响应体和校验信息"""
+        body_path, meta_path = self.get_entry_paths(url)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "content_type": response.headers.get("Content-Type", ""),
+            "stored_at": time.time()
+        }
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # 先写临时文件再替换，避免并发下载时读到不完整的缓存
+            temp_path = body_path.with_name(f"{body_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(response.content)
+            os.replace(temp_path, body_path)
+            JsonUtils.save_json(meta, meta_path)
+        except Exception as e:
+            Logger.warning(f"保存HTTP缓存失败: {url}, 错误: {e}")
+
+
+class HttpFixtureStore:
+    """
+    HTTP录制/回放夹具存储
+    
+    目录结构：
+    - <root>/v<版本>/index.json：URL -> 响应记录（状态码和响应体文件名，或错误类型）
+    - <root>/v<版本>/bodies/<md5>.bin：响应体
+    
+    录制时记录每个URL最后一次请求的结果（包括404和连接错误），回放时原样重现，
+    因此回放生成的overview.md与录制时一致
+    """
+    
+    INDEX_FILE = "index.json"
+    BODIES_DIR = "bodies"
+    
+    def __init__(self, root_dir, version=HTTP_FIXTURE_VERSION):
+        """初始化夹具存储"""
+        self.version = version
+        self.store_dir = Path(root_dir) / f"v{version}"
+        self.index_file = self.store_dir / self.INDEX_FILE
+        self.bodies_dir = self.store_dir / self.BODIES_DIR
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.dirty = False
+        
+        if self.index_file.exists():
+            index = JsonUtils.load_json(self.index_file)
+            if index.get("version") != version:
+                raise ValueError(f"夹具版本不匹配: {self.index_file}, 期望v{version}, 实际v{index.get('version')}")
+            self.entries = index.get("entries", {})
+    
+    def record_response(self, url, status_code, body):
+        """录制一个响应"""
+        body_name = f"{hashlib.md5(body).hexdigest()}.bin"
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        body_path = self.bodies_dir / body_name
+        if not body_path.exists():
+            body_path.write_bytes(body)
+        
+        with self.lock:
+            self.entries[url] = {"status": status_code, "body": body_name}
+            self.dirty = True
+    
+    def record_error(self, url, error):
+        """录制一个请求失败（连接错误或超时）"""
+        import requests
+        
+        error_type = "timeout" if isinstance(error, requests.exceptions.Timeout) else "connection"
+        with self.lock:
+            self.entries[url] = {"error": error_type, "message": str(error)}
+            self.dirty = True
+    
+    def replay(self, url):
+        """
+        回放URL的响应
+        
+        返回：
+        - bytes: 响应体
+        
+        录制的错误按requests的异常重新抛出
+        """
+        import requests
+        
+        with self.lock:
+            entry = self.entries.get(url)
+        
+        if entry is None:
+            raise HttpFixtureMissingError(f"回放夹具缺失: {url}（夹具目录: {self.store_dir}，请先用Http_Mode=record录制）")
+        
+        if entry.get("error") == "timeout":
+            raise requests.exceptions.Timeout(entry.get("message", url))
+        if entry.get("error"):
+            raise requests.exceptions.ConnectionError(entry.get("message", url))
+        
+        status_code = entry.get("status", 200)
+        if status_code >= 400:
+            response = requests.Response()
+            response.status_code = status_code
+            response.url = url
+            response.reason = "Replayed"
+            response.raise_for_status()
+        
+        return (self.bodies_dir / entry["body"]).read_bytes()
+    
+    def save(self):
+        """保存索引（只在录制了新内容时写入）"""
+        with self.lock:
+            if not self.dirty:
+                return True
+            index = {"version": self.version, "entries": dict(sorted(self.entries.items()))}
+            self.dirty = False
+        return JsonUtils.save_json(index, self.index_file)
+
+
+class HttpClient:
+    """
+    带连接池和条件请求缓存的HTTP客户端
+    
+    - 每个主机复用一个requests.Session（keep-alive连接池），英文官网主页只在首次访问该主机时请求一次
+    - 已缓存的URL发送条件请求，未变化的页面和图片只需要一次304往返
+    - 离线模式下只使用缓存，不访问网络
+    - record模式把访问网络的结果录制到夹具存储，replay模式只从夹具存储回放
+    """
+    
+    def __init__(self, cache_dir, offline=False, pool_size=HTTP_POOL_SIZE, mode="live", fixture_store=None):
+        """初始化客户端"""
+        if mode not in HTTP_MODES:
+            raise ValueError(f"不支持的HTTP模式: {mode}")
+        if mode != "live" and fixture_store is None:
+            raise ValueError(f"{mode}模式需要指定夹具存储")
+        
+        self.cache = HttpCache(cache_dir)
+        self.offline = offline
+        self.mode = mode
+        self.fixture_store = fixture_store
+        self.pool_size = pool_size
+        self.sessions = {}
+        self.warmed_up = set()
+        self.lock = threading.Lock()
+    
+    def get_session(self, url):
+        """获取URL所在主机的Session（不存在时创建）"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        host = urlparse(url).netloc
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.sessions[host] = session
+            return session
+    
+    def warm_up(self, session, warmup_url, headers):
+        """每个主机只访问一次主页以建立Cookie"""
+        with self.lock:
+            if warmup_url in self.warmed_up:
+                return
+            self.warmed_up.add(warmup_url)
+        
+        try:
+            session.get(warmup_url, headers=headers, timeout=10)
+            time.sleep(1)  # 等待1秒
+        except Exception as e:
+            Logger.warning(f"访问主页失败: {warmup_url}, 错误: {e}")
+    
+    def fetch(self, url, headers=None, timeout=30, warmup_url=None):
+        """
+        获取URL内容
+        
+        参数：
+        - url: 请求地址
+        - headers: 请求头
+        - timeout: 超时时间（秒）
+        - warmup_url: 首次访问该主机前需要先访问的主页地址
+        
+        返回：
+        - bytes: 响应体
+        
+        网络错误和HTTP错误按requests的异常抛出，由调用方处理
+        """
+        import requests
+        
+        if self.mode == "replay":
+            return self.fixture_store.replay(url)
+        
+        if self.mode == "record":
+            try:
+                body = self.fetch_response(url, headers, timeout, warmup_url)
+            except requests.exceptions.HTTPError as e:
+                self.fixture_store.record_response(url, e.response.status_code, b"")
+                raise
+            except requests.exceptions.RequestException as e:
+                self.fixture_store.record_error(url, e)
+                raise
+            self.fixture_store.record_response(url, 200, body)
+            return body
+        
+        return self.fetch_response(url, headers, timeout, warmup_url)
+    
+    def fetch_response(self, url, headers=None, timeout=30, warmup_url=None):
+        """获取URL内容（连接池 + 条件请求缓存）"""
+        meta, cached_body = self.cache.load(url)
+        
+        if self.offline:
+            if cached_body is None:
+                raise HttpCacheMissError(f"离线模式下缓存未命中: {url}")
+            return cached_body
+        
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+        
+        session = self.get_session(url)
+        if warmup_url:
+            self.warm_up(session, warmup_url, headers)
+        
+        response = session.get(url, headers=request_headers, timeout=timeout)
+        
+        if response.status_code == 304 and cached_body is not None:
+            return cached_body
+        
+        response.raise_for_status()
+        self.cache.store(url, response)
+        return response.content
+    
+    def close(self):
+        """关闭所有Session，录制模式下保存夹具索引"""
+        if self.mode == "record":
+            self.fixture_store.save()
+        
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+class ImageDownloader:
+    """
+    并发图片下载器
+    
+    - 有界线程池并发下载，失败时按1s、2s、4s...指数退避重试
+    - 同一URL在整个运行期间只下载一次（中英文页面共用）
+    - 内容相同的图片只保存一份，后出现的URL直接引用已保存的文件
+    - 文件名冲突（同名不同内容）时在文件名后追加内容哈希
+    - 记录下载清单，供update_doxyfile_config读取
+    """
+    
+    def __init__(self, http_client, assets_dir, max_workers=IMAGE_DOWNLOAD_WORKERS, max_retries=3):
+        """初始化下载器"""
+        self.http_client = http_client
+        self.assets_dir = Path(assets_dir)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.lock = threading.Lock()
+        
+        # 完整URL -> 文件名（下载失败为None）
+        self.url_results = {}
+        # 内容哈希 -> 文件名
+        self.hash_to_filename = {}
+        # 文件名 -> 内容哈希
+        self.filename_to_hash = {}
+        # 下载清单（按首次出现的顺序）
+        self.manifest = []
+    
+    @staticmethod
+    def resolve_image_url(img_url, base_url):
+        """将页面中的图片src解析为完整URL"""
+        if img_url.startswith("http"):
+            return img_url
+        if img_url.startswith("/"):
+            # 如果是以/开头的绝对路径，根据base_url判断使用哪个域名
+            if "nsing.com.sg" in base_url:
+                return f"https://nsing.com.sg{img_url}"
+            return f"https://www.nationstech.com{img_url}"
+        if img_url.startswith("./"):
+            # 如果是./开头的相对路径，去掉./前缀，根据base_url判断使用哪个域名
+            clean_url = img_url[2:]
+            if "nsing.com.sg" in base_url:
+                return f"https://nsing.com.sg/{clean_url}"
+            return f"https://www.nationstech.com/{clean_url}"
+        # 普通相对路径，使用urljoin
+        return urljoin(base_url, img_url)
+    
+    @staticmethod
+    def get_image_filename(full_img_url):
+        """从URL中提取文件名"""
+        filename = os.path.basename(urlparse(full_img_url).path)
+        
+        if not filename:
+            filename = "image.jpg"
+        
+        if not os.path.splitext(filename)[1]:
+            filename += ".jpg"
+        
+        return filename
+    
+    def fetch_with_backoff(self, full_img_url, base_url, page_type):
+        """下载图片数据，失败时指数退避重试"""
+        headers = dict(IMAGE_REQUEST_HEADERS)
+        headers["Referer"] = base_url
+        
+        for attempt in range(self.max_retries):
+            try:
+                return self.http_client.fetch(full_img_url, headers=headers, timeout=30)
+            except HttpCacheMissError as e:
+                # 没有访问网络，直接失败
+                Logger.error(f"[{page_type}] 下载图片失败: {e}")
+                return None
+            except Exception as e:
+                # 4xx错误和回放的录制错误重试也不会成功
+                status_code = getattr(getattr(e, "response", None), "status_code", None)
+                retryable = self.http_client.mode != "replay" and not (status_code and 400 <= status_code < 500)
+                if attempt < self.max_retries - 1 and retryable:
+                    # 不是最后一次尝试，等待后重试
+                    time.sleep(2 ** attempt)
+                else:
+                    # 最后一次尝试失败，记录错误
+                    Logger.error(f"[{page_type}] 下载图片失败，已尝试{attempt + 1}次: {full_img_url}, 错误: {e}")
+                    return None
+        return None
+    
+    def save_image(self, full_img_url, image_data, fixed_filename=None):
+        """
+        按内容去重保存图片
+        
+        返回：
+        - str: 保存（或复用）的文件名
+        """
+        content_hash = hashlib.md5(image_data).hexdigest()
+        
+        with self.lock:
+            if fixed_filename:
+                filename = fixed_filename
+            elif content_hash in self.hash_to_filename:
+                # 相同内容已经保存过，直接复用
+                filename = self.hash_to_filename[content_hash]
+                self.manifest.append({"url": full_img_url, "filename": filename, "md5": content_hash, "size": len(image_data)})
+                return filename
+            else:
+                filename = self.get_image_filename(full_img_url)
+                claimed_hash = self.filename_to_hash.get(filename)
+                if claimed_hash is not None and claimed_hash != content_hash:
+                    stem, ext = os.path.splitext(filename)
+                    filename = f"{stem}_{content_hash[:8]}{ext}"
+            
+            self.hash_to_filename.setdefault(content_hash, filename)
+            self.filename_to_hash[filename] = content_hash
+            self.manifest.append({"url": full_img_url, "filename": filename, "md5": content_hash, "size": len(image_data)})
+        
+        # 磁盘上已有相同内容时不重写文件
+        img_path = self.assets_dir / filename
+        if img_path.exists() and img_path.stat().st_size == len(image_data):
+            if hashlib.md5(img_path.read_bytes()).hexdigest() == content_hash:
+                return filename
+        
+        PathUtils.ensure_dir(self.assets_dir)
+        with open(img_path, "wb") as f:
+            f.write(image_data)
+        return filename
+    
+    def download(self, img_url, base_url, page_type="未知", fixed_filename=None):
+        """下载单个图片，返回保存的文件名，失败返回None"""
+        full_img_url = self.resolve_image_url(img_url, base_url)
+        result_key = (full_img_url, fixed_filename)
+        
+        if result_key in self.url_results:
+            return self.url_results[result_key]
+        
+        image_data = self.fetch_with_backoff(full_img_url, base_url, page_type)
+        filename = self.save_image(full_img_url, image_data, fixed_filename) if image_data is not None else None
+        self.url_results[result_key] = filename
+        return filename
+    
+    def download_many(self, img_urls, base_url, page_type="未知"):
+        """
+        并发下载多个图片
+        
+        网络请求并发执行，保存按src在页面中的顺序串行进行，保证去重后的文件名在每次运行中一致
+        
+        返回：
+        - dict: 图片src -> 保存的文件名（失败为None）
+        """
+        unique_urls = list(dict.fromkeys(img_urls))
+        full_urls = {img_url: self.resolve_image_url(img_url, base_url) for img_url in unique_urls}
+        
+        # 本次运行中尚未下载过的URL
+        pending_urls = list(dict.fromkeys(
+            full_url for full_url in full_urls.values() if (full_url, None) not in self.url_results
+        ))
+        
+        if len(pending_urls) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending_urls))) as executor:
+                fetched = dict(zip(pending_urls, executor.map(
+                    lambda full_url: self.fetch_with_backoff(full_url, base_url, page_type), pending_urls
+                )))
+        else:
+            fetched = {full_url: self.fetch_with_backoff(full_url, base_url, page_type) for full_url in pending_urls}
+        
+        for full_url in pending_urls:
+            image_data = fetched[full_url]
+            self.url_results[(full_url, None)] = self.save_image(full_url, image_data) if image_data is not None else None
+        
+        return {img_url: self.url_results[(full_url, None)] for img_url, full_url in full_urls.items()}
+    
+    def get_downloaded_files(self):
+        """获取已下载的图片文件名（去重，按首次出现的顺序）"""
+        with self.lock:
+            return list(dict.fromkeys(entry["filename"] for entry in self.manifest))
+    
+    def save_manifest(self, manifest_file):
+        """保存下载清单"""
+        with self.lock:
+            manifest = {
+                "files": list(dict.fromkeys(entry["filename"] for entry in self.manifest)),
+                "images": list(self.manifest)
+            }
+        return JsonUtils.save_json(manifest, manifest_file)
+    
+    @staticmethod
+    def load_manifest_files(manifest_file):
+        """从下载清单中读取图片文件名列表"""
+        manifest_file = Path(manifest_file)
+        if not manifest_file.exists():
+            return []
+        try:
+            return JsonUtils.load_json(manifest_file).get("files", [])
+        except Exception as e:
+            Logger.warning(f"读取图片下载清单失败: {e}")
+            return []
+
+
 class NationTechChipCrawler(BaseGenerator):
     """国民技术芯片信息爬取器"""
     
@@ -39,8 +559,30 @@ class NationTechChipCrawler(BaseGenerator):
         self.zip_url = chip_config.get('Zip_Url', '')
         self.chip_name = chip_config.get('chipName', '')
         
+        # HTTP客户端（连接池 + 条件请求缓存，Http_Offline为true时只使用缓存）
+        # Http_Mode为record/replay时录制或回放页面和图片，夹具目录可通过Http_Fixture_Dir指定
+        cache_dir = CacheUtils.get_shared_cache_dir(output_folder)
+        http_mode = chip_config.get('Http_Mode', 'live') or 'live'
+        fixture_store = None
+        if http_mode != 'live':
+            fixture_dir = chip_config.get('Http_Fixture_Dir') or cache_dir / HTTP_FIXTURE_DIR_NAME
+            fixture_store = HttpFixtureStore(fixture_dir)
+        self.http_client = HttpClient(
+            cache_dir / HTTP_CACHE_DIR_NAME,
+            offline=bool(chip_config.get('Http_Offline', False)),
+            mode=http_mode,
+            fixture_store=fixture_store
+        )
+        
+        # 图片下载器（中英文页面共用，按URL和内容去重）
+        self.assets_dir = self.output_folder / "doxygen" / "main" / "assets"
+        self.image_downloader = ImageDownloader(self.http_client, self.assets_dir)
+        self.image_manifest_file = self.output_folder / "json" / IMAGE_MANIFEST_FILE
+        
     def get_web_content(self, url, timeout=30, page_type="未知"):
         """获取网页内容，支持身份认证和重试机制"""
+        import requests
+        
         try:
             
             # 根据页面类型设置不同的请求头
@@ -75,34 +617,28 @@ class NationTechChipCrawler(BaseGenerator):
                     "Cache-Control": "max-age=0"
                 }
             
-            # 创建session以保持Cookie
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            
-            # 先访问主页建立session（对于英文网站）
+            # 先访问主页建立Cookie（对于英文网站，每次运行只访问一次）
+            warmup_url = None
             if page_type == "英文官网" and "nsing.com.sg" in url:
-                try:
-                    session.get("https://nsing.com.sg/", timeout=10)
-                    time.sleep(1)  # 等待1秒
-                except Exception as e:
-                    Logger.warning(f"[{page_type}] 访问主页失败: {e}")
+                warmup_url = EN_SITE_HOME_URL
             
-            # 访问目标页面
-            response = session.get(url, timeout=timeout)
-            response.raise_for_status()
+            # 访问目标页面（复用主机连接，未变化时使用缓存）
+            body = self.http_client.fetch(url, headers=headers, timeout=timeout, warmup_url=warmup_url)
             
             # 直接使用UTF-8解码
             try:
-                content = response.content.decode('utf-8')
+                content = body.decode('utf-8')
             except UnicodeDecodeError as e:
                 # 尝试其他编码
                 try:
-                    content = response.content.decode('gbk')
+                    content = body.decode('gbk')
                 except UnicodeDecodeError:
-                    content = response.content.decode('utf-8', errors='ignore')
+                    content = body.decode('utf-8', errors='ignore')
             
             return content
+        except HttpCacheMissError as e:
+            Logger.error(f"[{page_type}] {e}")
+            return None
         except requests.exceptions.Timeout:
             Logger.error(f"[{page_type}] 网页访问超时: {url}")
             return None
@@ -123,6 +659,7 @@ class NationTechChipCrawler(BaseGenerator):
             return {}
         
         try:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, "html.parser")
             extracted_content = {}
             
@@ -245,6 +782,7 @@ class NationTechChipCrawler(BaseGenerator):
     def _process_products_display_area(self, html_content):
         """处理产品展示表格，保持完整HTML格式并清理样式"""
         try:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, "html.parser")
             
             # 检查是否包含table
@@ -352,6 +890,7 @@ class NationTechChipCrawler(BaseGenerator):
     def download_chip_main_image(self, html_content, base_url, page_type="未知"):
         """下载芯片主图，固定命名为chip.png"""
         try:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, "html.parser")
             
             # 查找.productsDetail下的img标签
@@ -370,37 +909,14 @@ class NationTechChipCrawler(BaseGenerator):
                 Logger.warning(f"[{page_type}] img标签没有src属性")
                 return None
             
-            
-            # 确保assets目录存在
-            assets_dir = self.output_folder / "doxygen" / "main" / "assets"
-            PathUtils.ensure_dir(assets_dir)
-            
             # 解析图片URL
             if src.startswith("http"):
                 full_img_url = src
             else:
                 full_img_url = urljoin(base_url, src)
             
-            
-            # 固定文件名为chip.png
-            chip_img_path = assets_dir / "chip.png"
-            
-            # 下载图片
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                "Referer": base_url,
-            }
-            
-            response = requests.get(full_img_url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            # 保存图片（直接覆盖）
-            with open(chip_img_path, "wb") as f:
-                f.write(response.content)
-            
-            return "chip.png"
+            # 固定文件名为chip.png（直接覆盖）
+            return self.image_downloader.download(full_img_url, base_url, page_type, fixed_filename="chip.png")
         except Exception as e:
             Logger.error(f"[{page_type}] 下载芯片主图失败: {e}")
             return None
@@ -408,6 +924,7 @@ class NationTechChipCrawler(BaseGenerator):
     def download_all_images(self, html_content, base_url, page_type="未知"):
         """下载所有图片资源到doxygen/main/assets/目录"""
         try:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, "html.parser")
             downloaded_images = []
             
@@ -417,17 +934,17 @@ class NationTechChipCrawler(BaseGenerator):
             if not img_tags:
                 return str(soup), downloaded_images
             
-            # 确保assets目录存在
-            assets_dir = self.output_folder / "doxygen" / "main" / "assets"
-            PathUtils.ensure_dir(assets_dir)
+            # 并发下载所有图片，不管src是什么格式
+            downloaded = self.image_downloader.download_many(
+                [img_tag.get("src") for img_tag in img_tags if img_tag.get("src")], base_url, page_type
+            )
             
             success_count = 0
             for i, img_tag in enumerate(img_tags):
                 src = img_tag.get("src")
                 if src:
                     
-                    # 先下载图片，不管src是什么格式
-                    downloaded_filename = self._download_single_image(src, base_url, assets_dir, page_type)
+                    downloaded_filename = downloaded.get(src)
                     if downloaded_filename:
                         # 下载成功，更新图片路径为相对路径格式
                         img_tag["src"] = f"./{downloaded_filename}"
@@ -450,6 +967,7 @@ class NationTechChipCrawler(BaseGenerator):
     def process_products_display_area_images(self, html_content, base_url, page_type="未知"):
         """专门处理.productsDisplayArea中的图片下载"""
         try:
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html_content, "html.parser")
             downloaded_images = []
             
@@ -465,18 +983,17 @@ class NationTechChipCrawler(BaseGenerator):
             if not img_tags:
                 return html_content, downloaded_images
             
-            # 确保assets目录存在
-            assets_dir = self.output_folder / "doxygen" / "main" / "assets"
-            PathUtils.ensure_dir(assets_dir)
-            
+            # 并发下载图片
+            downloaded = self.image_downloader.download_many(
+                [img_tag.get("src") for img_tag in img_tags if img_tag.get("src")], base_url, page_type
+            )
             
             success_count = 0
             for i, img_tag in enumerate(img_tags):
                 src = img_tag.get("src")
                 if src:
                     
-                    # 下载图片
-                    downloaded_filename = self._download_single_image(src, base_url, assets_dir, page_type)
+                    downloaded_filename = downloaded.get(src)
                     if downloaded_filename:
                         # 下载成功，更新图片路径为相对路径格式
                         img_tag["src"] = f"./{downloaded_filename}"
@@ -499,68 +1016,6 @@ class NationTechChipCrawler(BaseGenerator):
             Logger.error(f"[{page_type}] 处理.productsDisplayArea图片失败: {e}")
             return html_content, []
     
-    def _download_single_image(self, img_url, base_url, assets_dir, page_type="未知", max_retries=3):
-        """下载单个图片，支持重试机制"""
-        for attempt in range(max_retries):
-            try:
-                # 解析图片URL
-                if img_url.startswith("http"):
-                    full_img_url = img_url
-                elif img_url.startswith("/"):
-                    # 如果是以/开头的绝对路径，根据base_url判断使用哪个域名
-                    if "nsing.com.sg" in base_url:
-                        full_img_url = f"https://nsing.com.sg{img_url}"
-                    else:
-                        full_img_url = f"https://www.nationstech.com{img_url}"
-                elif img_url.startswith("./"):
-                    # 如果是./开头的相对路径，去掉./前缀，根据base_url判断使用哪个域名
-                    clean_url = img_url[2:]  # 去掉"./"前缀
-                    if "nsing.com.sg" in base_url:
-                        full_img_url = f"https://nsing.com.sg/{clean_url}"
-                    else:
-                        full_img_url = f"https://www.nationstech.com/{clean_url}"
-                else:
-                    # 普通相对路径，使用urljoin
-                    full_img_url = urljoin(base_url, img_url)
-                
-                # 从URL中提取文件名
-                parsed_url = urlparse(full_img_url)
-                filename = os.path.basename(parsed_url.path)
-                
-                if not filename:
-                    filename = "image.jpg"
-                
-                if not os.path.splitext(filename)[1]:
-                    filename += ".jpg"
-                
-                # 设置请求头
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-                    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                    "Referer": base_url,
-                }
-                
-                # 下载图片
-                response = requests.get(full_img_url, headers=headers, timeout=30)
-                response.raise_for_status()
-                
-                # 保存图片（直接覆盖）
-                img_path = assets_dir / filename
-                with open(img_path, "wb") as f:
-                    f.write(response.content)
-                
-                return filename
-                
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    # 不是最后一次尝试，记录警告并等待后重试
-                    time.sleep(1)  # 等待1秒后重试
-                else:
-                    # 最后一次尝试失败，记录错误
-                    Logger.error(f"[{page_type}] 下载图片失败，已重试{max_retries}次: {img_url}, 错误: {e}")
-                    return None
-    
     def generate_overview_md(self, content_data, language="cn", title_only=False):
         """生成Markdown文档"""
         try:
@@ -705,9 +1160,16 @@ class NationTechChipCrawler(BaseGenerator):
             Logger.error(f"生成overview.md失败: {e}")
             return False
     
-    def update_doxyfile_config(self, image_files):
-        """更新Doxyfile配置，添加所有下载的图片文件"""
+    def update_doxyfile_config(self, image_files=None):
+        """
+        更新Doxyfile配置，添加所有下载的图片文件
+        
+        未指定image_files时从图片下载清单（json/chip_images.json）读取
+        """
         try:
+            if image_files is None:
+                image_files = ImageDownloader.load_manifest_files(self.image_manifest_file)
+            
             # 需要更新的Doxyfile文件
             doxyfile_files = ["Doxyfile_zh", "Doxyfile_en"]
             
@@ -726,6 +1188,7 @@ class NationTechChipCrawler(BaseGenerator):
                         "./assets/files.png",
                         "./assets/pdf.png",
                         "./assets/pack.png",
+                        "./assets/modules.css",
                     ]
                     
                     # 添加图片文件
@@ -939,14 +1402,17 @@ class NationTechChipCrawler(BaseGenerator):
                 # 生成只包含标题的中文文件
                 self.generate_overview_md({}, "cn", title_only=True)
             
-            # 更新Doxyfile配置
-            if all_downloaded_images:
-                self.update_doxyfile_config(all_downloaded_images)
+            # 保存图片下载清单并更新Doxyfile配置
+            self.image_downloader.save_manifest(self.image_manifest_file)
+            if self.image_downloader.get_downloaded_files():
+                self.update_doxyfile_config()
             
             return True
         except Exception as e:
             Logger.error(f"爬取和生成失败: {e}")
             return False
+        finally:
+            self.http_client.close()
 
 
 @timing_decorator
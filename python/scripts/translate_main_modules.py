@@ -13,14 +13,7 @@ current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from common_utils import BaseGenerator, TextProcessor, FileUtils, Logger, ArgumentParser, ConfigManager, timing_decorator
-
-# 尝试导入翻译库，如果失败则提供友好的错误信息
-try:
-    from deep_translator import GoogleTranslator
-except ImportError:
-    Logger.error("缺少deep_translator模块，请安装: pip install deep_translator")
-    sys.exit(1)
+from common_utils import BaseGenerator, TextProcessor, FileUtils, Logger, ArgumentParser, ConfigManager, CacheUtils, TranslationCache, Tracer, Progress, timing_decorator
 
 
 class MarkdownTranslator(BaseGenerator):
@@ -29,7 +22,13 @@ class MarkdownTranslator(BaseGenerator):
     def __init__(self, output_folder, chip_config):
         """初始化翻译器"""
         super().__init__("", output_folder, chip_config)  # input_folder 在此脚本中不使用
-        self.translator = GoogleTranslator(source='zh-CN', target='en')
+        
+        # 翻译器在有需要翻译的文件时才创建（见translator属性）
+        self._translator = None
+        self._translator_loaded = False
+        
+        # 翻译结果缓存（批量构建时多个芯片共享）
+        self.translation_cache = TranslationCache(CacheUtils.get_shared_cache_dir(self.output_folder))
         
         # 专业术语中英文对照表
         self.technical_terms = {
@@ -61,6 +60,18 @@ class MarkdownTranslator(BaseGenerator):
         # 尝试从配置文件加载额外的专业术语
         self.load_technical_terms()
         
+    @property
+    def translator(self):
+        """翻译器（第一次使用时导入deep_translator，未安装时为None）"""
+        if not self._translator_loaded:
+            self._translator_loaded = True
+            try:
+                from deep_translator import GoogleTranslator
+                self._translator = GoogleTranslator(source='zh-CN', target='en')
+            except ImportError:
+                Logger.error("缺少deep_translator模块，请安装: pip install deep_translator")
+        return self._translator
+    
     def load_technical_terms(self):
         """从配置文件加载额外的专业术语对照表"""
         try:
@@ -95,8 +106,11 @@ class MarkdownTranslator(BaseGenerator):
             if cleaned_text in self.technical_terms:
                 return self.technical_terms[cleaned_text]
             
-            # 如果不在对照表中，使用Google翻译
-            translated = self.translator.translate(cleaned_text)
+            # 如果不在对照表中，优先使用翻译缓存，未命中时使用Google翻译
+            translated = self.translation_cache.get(cleaned_text)
+            if translated is None:
+                translated = self.translator.translate(cleaned_text)
+                self.translation_cache.set(cleaned_text, translated)
             return translated
             
         except Exception as e:
@@ -128,10 +142,12 @@ class MarkdownTranslator(BaseGenerator):
             # 创建翻译映射，避免重复翻译相同内容
             translation_map = {}
             
-            for chinese_text in chinese_matches:
-                if chinese_text not in translation_map:
-                    translated_text = self.translate_text(chinese_text)
-                    translation_map[chinese_text] = translated_text
+            # 每个文件的翻译批次记录到构建时间线
+            with Tracer.span(Path(file_path).name, "translate", strings=len(chinese_matches)):
+                for chinese_text in chinese_matches:
+                    if chinese_text not in translation_map:
+                        translated_text = self.translate_text(chinese_text)
+                        translation_map[chinese_text] = translated_text
             
             # 按长度降序排列，避免短文本被长文本包含的问题
             sorted_chinese = sorted(translation_map.keys(), key=len, reverse=True)
@@ -180,15 +196,21 @@ class MarkdownTranslator(BaseGenerator):
             if not md_files:
                 return True
             
+            # 有需要翻译的文件时才导入翻译库
+            if self.translator is None:
+                return False
+            
             success_count = 0
             failed_count = 0
             
-            for md_file in md_files:
+            for md_file in Progress.track("translate", md_files, item=lambda md_file: md_file.name):
                 if self.translate_markdown_file(md_file):
                     success_count += 1
                 else:
                     failed_count += 1
             
+            self.translation_cache.save()
+            
             if failed_count > 0:
                 Logger.error(f"{failed_count} 个文件翻译失败")
                 return False
@@ -0,0 +1,435 @@
+// Examples Overview 共享脚本（所有分组页面共用）
+// 分组数据由 <分组名>.data.js 通过 ExamplesOverview.render(...) 传入
+
+// 项目名称（由分组数据设置）
+var currentProjectName = "";
+
+// 双语提示配置
+var tipConfig = {
+    cn: {
+        title: "配置提示",
+        message: "请在Config页面中配置芯片文档基路径以查看此文件",
+        configBtn: "打开配置",
+        cancelBtn: "取消"
+    },
+    en: {
+        title: "Configuration Tip",
+        message: "Please configure the chip document base path in Config page to view this file",
+        configBtn: "Open Config",
+        cancelBtn: "Cancel"
+    }
+};
+
+// 当前语言（默认中文）
+var currentTipLanguage = "cn";
+
+// 切换提示语言
+function switchTipLanguage() {
+    currentTipLanguage = currentTipLanguage === "cn" ? "en" : "cn";
+    updateTipLanguage();
+}
+
+// 更新提示语言
+function updateTipLanguage() {
+    var lang = tipConfig[currentTipLanguage];
+    var titleElement = document.getElementById("tipTitle");
+    var messageElement = document.getElementById("tipMessage");
+    var configBtnElement = document.getElementById("tipConfigBtn");
+    var cancelBtnElement = document.getElementById("tipCancelBtn");
+    var languageToggleElement = document.getElementById("tipLanguageToggle");
+
+    if (titleElement) {
+        if (titleElement.textContent !== undefined) {
+            titleElement.textContent = lang.title;
+        } else if (titleElement.innerText !== undefined) {
+            // IE8兼容
+            titleElement.innerText = lang.title;
+        }
+    }
+
+    if (messageElement) {
+        if (messageElement.textContent !== undefined) {
+            messageElement.textContent = lang.message;
+        } else if (messageElement.innerText !== undefined) {
+            // IE8兼容
+            messageElement.innerText = lang.message;
+        }
+    }
+
+    if (configBtnElement) {
+        if (configBtnElement.textContent !== undefined) {
+            configBtnElement.textContent = lang.configBtn;
+        } else if (configBtnElement.innerText !== undefined) {
+            // IE8兼容
+            configBtnElement.innerText = lang.configBtn;
+        }
+    }
+
+    if (cancelBtnElement) {
+        if (cancelBtnElement.textContent !== undefined) {
+            cancelBtnElement.textContent = lang.cancelBtn;
+        } else if (cancelBtnElement.innerText !== undefined) {
+            // IE8兼容
+            cancelBtnElement.innerText = lang.cancelBtn;
+        }
+    }
+
+    if (languageToggleElement) {
+        var toggleText = (currentTipLanguage === "cn" ? "EN" : "中文");
+        if (languageToggleElement.textContent !== undefined) {
+            languageToggleElement.textContent = toggleText;
+        } else if (languageToggleElement.innerText !== undefined) {
+            // IE8兼容
+            languageToggleElement.innerText = toggleText;
+        }
+    }
+}
+
+// 显示配置提示
+function showConfigTip(filePath) {
+    // 首先尝试从注册表读取基路径
+    var basePath = getRegistryBasePath();
+    if (basePath) {
+        // 有注册表配置，直接打开文件
+        var fullPath = basePath + '/' + filePath;
+        var fileUrl = 'file:///' + fullPath.replace(/\\/g, '/');
+        try {
+            if (window.open) {
+                window.open(fileUrl, '_blank');
+            } else {
+                window.location.href = fileUrl;
+            }
+        } catch (e) {
+            // 如果打开失败，显示弹窗
+            showConfigDialog(filePath);
+        }
+    } else {
+        // 没有注册表配置，显示配置提示弹窗
+        showConfigDialog(filePath);
+    }
+}
+
+// 显示配置提示弹窗
+function showConfigDialog(filePath) {
+    var lang = tipConfig[currentTipLanguage];
+
+    // 创建提示对话框
+    var tipDialog = document.createElement('div');
+    tipDialog.className = 'tip-dialog-overlay';
+    tipDialog.innerHTML = 
+        '<div class="tip-dialog">' +
+            '<div class="tip-dialog-header">' +
+                '<h3 id="tipTitle">' + lang.title + '</h3>' +
+                '<button id="tipLanguageToggle" class="tip-language-toggle">' +
+                    (currentTipLanguage === "cn" ? "EN" : "中文") +
+                '</button>' +
+            '</div>' +
+            '<div class="tip-dialog-content">' +
+                '<p id="tipMessage">' + lang.message + '</p>' +
+            '</div>' +
+            '<div class="tip-dialog-footer">' +
+                '<button id="tipConfigBtn" class="tip-btn tip-btn-primary">' +
+                    lang.configBtn +
+                '</button>' +
+                '<button id="tipCancelBtn" class="tip-btn tip-btn-secondary">' +
+                    lang.cancelBtn +
+                '</button>' +
+            '</div>' +
+        '</div>';
+
+    document.body.appendChild(tipDialog);
+
+    // 绑定事件 - 使用IE8兼容的方式
+    var configBtn = document.getElementById("tipConfigBtn");
+    var cancelBtn = document.getElementById("tipCancelBtn");
+    var languageToggle = document.getElementById("tipLanguageToggle");
+
+    if (configBtn) {
+        if (configBtn.attachEvent) {
+            // IE8兼容
+            configBtn.attachEvent('onclick', openConfig);
+        } else if (configBtn.addEventListener) {
+            // 现代浏览器
+            configBtn.addEventListener('click', openConfig);
+        } else {
+            // 降级方案
+            configBtn.onclick = openConfig;
+        }
+    }
+
+    if (cancelBtn) {
+        if (cancelBtn.attachEvent) {
+            // IE8兼容
+            cancelBtn.attachEvent('onclick', closeTipDialog);
+        } else if (cancelBtn.addEventListener) {
+            // 现代浏览器
+            cancelBtn.addEventListener('click', closeTipDialog);
+        } else {
+            // 降级方案
+            cancelBtn.onclick = closeTipDialog;
+        }
+    }
+
+    if (languageToggle) {
+        if (languageToggle.attachEvent) {
+            // IE8兼容
+            languageToggle.attachEvent('onclick', function() {
+                switchTipLanguage();
+            });
+        } else if (languageToggle.addEventListener) {
+            // 现代浏览器
+            languageToggle.addEventListener('click', function() {
+                switchTipLanguage();
+            });
+        } else {
+            // 降级方案
+            languageToggle.onclick = function() {
+                switchTipLanguage();
+            };
+        }
+    }
+}
+
+// 从注册表读取基路径 - 使用与Config.html相同的方法
+function getRegistryBasePath() {
+    // 使用与Config.html相同的注册表读取方法
+    var ChmStorageManager = {
+        // 注册表路径
+        regPath: "HKEY_CURRENT_USER\\SOFTWARE\\ChmConfig\\",
+
+        // 创建WScript.Shell对象来访问注册表
+        createShell: function () {
+            try {
+                var shell = new ActiveXObject("WScript.Shell");
+                return shell;
+            } catch (e) {
+                return null;
+            }
+        },
+
+        // 从注册表读取PDF路径
+        getPath: function (projectName) {
+            var shell = this.createShell();
+            if (shell) {
+                try {
+                    var keyName = "pdfBasePath_" + projectName;
+                    var path = shell.RegRead(this.regPath + keyName);
+                    if (path && path !== "") {
+                        return path;
+                    }
+                } catch (e) {
+                }
+            } else {
+            }
+            return null;
+        }
+    };
+
+    // 使用ChmStorageManager读取注册表
+    var basePath = ChmStorageManager.getPath(currentProjectName);
+
+    return basePath;
+}
+
+// 打开配置页面
+function openConfig() {
+    // 尝试打开Config.html
+    try {
+        var configUrl = "./Config.html";
+        if (window.open) {
+            window.open(configUrl, "_self");
+        } else {
+            // 如果无法打开新窗口，尝试在当前窗口打开
+            window.location.href = configUrl;
+        }
+    } catch (e) {
+        alert("无法打开配置页面，请手动访问Config.html");
+    }
+    closeTipDialog();
+}
+
+// 关闭提示对话框
+function closeTipDialog() {
+    var tipDialog;
+    if (document.querySelector) {
+        tipDialog = document.querySelector('.tip-dialog-overlay');
+    } else {
+        // IE8兼容
+        var elements = document.getElementsByTagName('div');
+        for (var i = 0; i < elements.length; i++) {
+            if (elements[i].className && elements[i].className.indexOf('tip-dialog-overlay') !== -1) {
+                tipDialog = elements[i];
+                break;
+            }
+        }
+    }
+
+    if (tipDialog) {
+        if (tipDialog.parentNode) {
+            tipDialog.parentNode.removeChild(tipDialog);
+        }
+    }
+}
+
+// 页面加载完成后初始化语言
+if (document.addEventListener) {
+    document.addEventListener('DOMContentLoaded', function() {
+        updateTipLanguage();
+    });
+} else {
+    // IE8兼容
+    document.attachEvent('onreadystatechange', function() {
+        if (document.readyState === 'complete') {
+            updateTipLanguage();
+        }
+    });
+
+    // 额外的IE8兼容性检查
+    if (document.readyState === 'complete') {
+        updateTipLanguage();
+    }
+}
+
+// 分组表格渲染器：按块分批插入表格行，大分组也能快速显示首屏内容
+var ExamplesOverview = {
+    // 斑马纹颜色：不同IP Module之间交替
+    rowColors: ["#ffffff", "#f0f8ff"],
+
+    // 每批渲染的行数
+    chunkSize: 100,
+
+    // HTML转义
+    escapeHtml: function (text) {
+        return String(text)
+            .replace(/&/g, "&amp;")
+            .replace(/</g, "&lt;")
+            .replace(/>/g, "&gt;")
+            .replace(/"/g, "&quot;");
+    },
+
+    // 生成链接（无链接地址时生成span）
+    buildLink: function (href, text, linkClass, spanClass) {
+        var safeText = this.escapeHtml(text);
+        if (href) {
+            return '<a href="' + this.escapeHtml(href) + '" class="' + linkClass + '">' + safeText + '</a>';
+        }
+        return spanClass ? '<span class="' + spanClass + '">' + safeText + '</span>' : safeText;
+    },
+
+    // 绑定事件 - 使用IE8兼容的方式
+    bindClick: function (element, handler) {
+        if (element.attachEvent) {
+            element.attachEvent("onclick", handler);
+        } else if (element.addEventListener) {
+            element.addEventListener("click", handler);
+        } else {
+            element.onclick = handler;
+        }
+    },
+
+    // Path列点击处理
+    createPathHandler: function (path) {
+        return function (e) {
+            e = e || window.event;
+            if (e.preventDefault) {
+                e.preventDefault();
+            } else {
+                e.returnValue = false;
+            }
+            showConfigTip(path);
+            return false;
+        };
+    },
+
+    // 渲染IP Module导航链接
+    // 模块数据格式：[名称, 颜色, 单元格链接, 导航链接, 行列表]
+    renderNav: function (modules) {
+        var container = document.getElementById("ipModuleLinks");
+        if (!container) {
+            return;
+        }
+        var html = [];
+        for (var i = 0; i < modules.length; i++) {
+            if (modules[i][0]) {
+                html.push(this.buildLink(modules[i][3], modules[i][0], "ip-module-link", "ip-module-link"));
+            }
+        }
+        container.innerHTML = html.join("");
+    },
+
+    // 渲染单行
+    // 行数据格式：[名称, 名称链接, 中文描述, 英文描述, 路径]
+    renderRow: function (tbody, module, moduleIndex, rowIndex) {
+        var item = module[4][rowIndex];
+        var row = tbody.insertRow(-1);
+        row.style.backgroundColor = this.rowColors[moduleIndex % this.rowColors.length];
+
+        // 同一IP Module的第一行使用rowspan合并单元格
+        if (rowIndex === 0) {
+            var moduleCell = row.insertCell(-1);
+            moduleCell.rowSpan = module[4].length;
+            moduleCell.style.backgroundColor = module[1];
+            moduleCell.style.verticalAlign = "middle";
+            moduleCell.style.textAlign = "center";
+            moduleCell.innerHTML = this.buildLink(module[2], module[0], "ip-module-cell-link", "ip-module");
+        }
+
+        var nameCell = row.insertCell(-1);
+        nameCell.className = "example-name";
+        nameCell.innerHTML = this.buildLink(item[1], item[0], "example-name-link", "");
+
+        var cnCell = row.insertCell(-1);
+        cnCell.className = "description-cn";
+        cnCell.innerHTML = this.escapeHtml(item[2]);
+
+        var enCell = row.insertCell(-1);
+        enCell.className = "description-en";
+        enCell.innerHTML = this.escapeHtml(item[3]);
+
+        var pathCell = row.insertCell(-1);
+        pathCell.className = "path";
+        pathCell.innerHTML = '/<a href="#">' + this.escapeHtml(item[4]) + '</a>';
+        this.bindClick(pathCell.getElementsByTagName("a")[0], this.createPathHandler(item[4]));
+    },
+
+    // 渲染分组数据（由 <分组名>.data.js 调用）
+    render: function (data) {
+        currentProjectName = data.project || "";
+
+        var modules = data.modules || [];
+        this.renderNav(modules);
+
+        var table = document.getElementById("examplesTable");
+        if (!table) {
+            return;
+        }
+        var tbody = table.tBodies[0];
+        var self = this;
+        var moduleIndex = 0;
+        var rowIndex = 0;
+
+        function renderChunk() {
+            var count = 0;
+            while (moduleIndex < modules.length && count < self.chunkSize) {
+                if (rowIndex < modules[moduleIndex][4].length) {
+                    self.renderRow(tbody, modules[moduleIndex], moduleIndex, rowIndex);
+                    rowIndex++;
+                    count++;
+                } else {
+                    moduleIndex++;
+                    rowIndex = 0;
+                }
+            }
+
+            var loading = document.getElementById("loadingRows");
+            if (moduleIndex < modules.length) {
+                // 让出主线程，下一批稍后渲染
+                window.setTimeout(renderChunk, 0);
+            } else if (loading && loading.parentNode) {
+                loading.parentNode.removeChild(loading);
+            }
+        }
+
+        renderChunk();
+    }
+};